@@ -1,8 +1,11 @@
-from typing import AsyncGenerator
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Annotated, AsyncGenerator, AsyncIterator
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Path
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from db.sessions import async_session
+from db.sessions import async_session, shard_sessions
+from db.sharding import shard_of
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -14,3 +17,126 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_session() as session:
         yield session
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory, for responses that outlive the request's session.
+
+    Returns:
+        The session factory.
+
+    """
+    return async_session
+
+
+def get_shard_session_factories(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(dependency=get_session_factory)
+    ],
+) -> list[async_sessionmaker[AsyncSession]]:
+    """Get the session factory of every shard.
+
+    Args:
+        session_factory: The session factory of shard 0.
+
+    Returns:
+        The session factories in shard order.
+
+    """
+    return [session_factory, *shard_sessions[1:]]
+
+
+@asynccontextmanager
+async def _open_shard_session(
+    id: int,
+    session: AsyncSession,
+    factories: list[async_sessionmaker[AsyncSession]],
+) -> AsyncIterator[AsyncSession]:
+    shard = shard_of(id=id, shard_count=len(factories))
+
+    if shard == 0:
+        yield session
+        return
+
+    async with factories[shard]() as shard_session:
+        yield shard_session
+
+
+async def get_question_session(
+    id: Annotated[int, Path(description="Question ID")],
+    session: Annotated[AsyncSession, Depends(dependency=get_session)],
+    factories: Annotated[
+        list[async_sessionmaker[AsyncSession]],
+        Depends(dependency=get_shard_session_factories),
+    ],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get the session of the shard holding the question of the path.
+
+    Args:
+        id: The question ID.
+        session: The session of shard 0.
+        factories: The session factory of every shard.
+
+    Yields:
+        The session.
+
+    """
+    async with _open_shard_session(
+        id=id, session=session, factories=factories
+    ) as shard_session:
+        yield shard_session
+
+
+async def get_answer_session(
+    id: Annotated[int, Path(description="Answer ID")],
+    session: Annotated[AsyncSession, Depends(dependency=get_session)],
+    factories: Annotated[
+        list[async_sessionmaker[AsyncSession]],
+        Depends(dependency=get_shard_session_factories),
+    ],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get the session of the shard holding the answer of the path.
+
+    Answers are stored on the shard of their question, and their IDs route to
+    it the same way.
+
+    Args:
+        id: The answer ID.
+        session: The session of shard 0.
+        factories: The session factory of every shard.
+
+    Yields:
+        The session.
+
+    """
+    async with _open_shard_session(
+        id=id, session=session, factories=factories
+    ) as shard_session:
+        yield shard_session
+
+
+async def get_shard_sessions(
+    session: Annotated[AsyncSession, Depends(dependency=get_session)],
+    factories: Annotated[
+        list[async_sessionmaker[AsyncSession]],
+        Depends(dependency=get_shard_session_factories),
+    ],
+) -> AsyncGenerator[list[AsyncSession], None]:
+    """Get a session of every shard.
+
+    Sessions only connect on their first statement, so unused shards cost
+    nothing.
+
+    Args:
+        session: The session of shard 0.
+        factories: The session factory of every shard.
+
+    Yields:
+        The sessions in shard order.
+
+    """
+    async with AsyncExitStack() as stack:
+        yield [
+            session,
+            *[await stack.enter_async_context(factory()) for factory in factories[1:]],
+        ]
@@ -0,0 +1,11 @@
+from usecases.export import ExportUsecase
+
+
+def get_export_usecase() -> ExportUsecase:
+    """Get the export usecase.
+
+    Returns:
+        The export usecase.
+
+    """
+    return ExportUsecase()
@@ -0,0 +1,99 @@
+from typing import Annotated, Any, Awaitable, Callable
+
+from fastapi import Depends, Header, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies.db import get_session
+from constants.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENT_REPLAYED_HEADER,
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+)
+from usecases.idempotency import IdempotencyUsecase
+
+
+class IdempotentRequest:
+    def __init__(
+        self,
+        key: str | None,
+        request: Request,
+        response: Response,
+        session: AsyncSession,
+    ):
+        self.key = key
+        self.request = request
+        self.response = response
+        self.session = session
+
+        self._usecase = IdempotencyUsecase()
+
+    async def run(
+        self,
+        body: dict[str, Any],
+        operation: Callable[[AsyncSession | None], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Run the operation of the request, once per idempotency key.
+
+        Without a key the operation simply runs. A replayed response is marked
+        with the ``Idempotent-Replayed`` header.
+
+        Args:
+            body: The JSON request body.
+            operation: The operation, given the session whose transaction the
+                key owns, None without a key, and returning the JSON response
+                body.
+
+        Returns:
+            The response body.
+
+        """
+        if self.key is None:
+            return await operation(None)
+
+        response, replayed = await self._usecase.execute(
+            session=self.session,
+            key=self.key,
+            request={
+                "method": self.request.method,
+                "path": self.request.url.path,
+                "body": body,
+            },
+            operation=operation,
+        )
+
+        if replayed:
+            self.response.headers[IDEMPOTENT_REPLAYED_HEADER] = "true"
+
+        return response
+
+
+def get_idempotent_request(
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(dependency=get_session)],
+    key: Annotated[
+        str | None,
+        Header(
+            alias=IDEMPOTENCY_KEY_HEADER,
+            description="A unique key per operation; retries with the same key "
+            "return the stored response instead of running it again",
+            min_length=1,
+            max_length=MAX_IDEMPOTENCY_KEY_LENGTH,
+        ),
+    ] = None,
+) -> IdempotentRequest:
+    """Get the idempotency handling of the request.
+
+    Args:
+        request: The request.
+        response: The response.
+        session: The session.
+        key: The idempotency key, if the client sent one.
+
+    Returns:
+        The idempotent request.
+
+    """
+    return IdempotentRequest(
+        key=key, request=request, response=response, session=session
+    )
@@ -0,0 +1,11 @@
+from usecases.search import SearchUsecase
+
+
+def get_search_usecase() -> SearchUsecase:
+    """Get the search usecase.
+
+    Returns:
+        The search usecase.
+
+    """
+    return SearchUsecase()
@@ -0,0 +1,21 @@
+from typing import Annotated
+
+from fastapi import Path
+
+from db.notifications import AnswerBroadcaster, answer_broadcasters
+from db.sharding import shard_of
+
+
+def get_answer_broadcaster(
+    id: Annotated[int, Path(description="Question ID")],
+) -> AnswerBroadcaster:
+    """Get the answer broadcaster of the question's shard in the worker.
+
+    Args:
+        id: The question ID.
+
+    Returns:
+        The answer broadcaster.
+
+    """
+    return answer_broadcasters[shard_of(id=id, shard_count=len(answer_broadcasters))]
@@ -0,0 +1,11 @@
+from usecases.trending import TrendingUsecase
+
+
+def get_trending_usecase() -> TrendingUsecase:
+    """Get the trending usecase.
+
+    Returns:
+        The trending usecase.
+
+    """
+    return TrendingUsecase()
@@ -1,50 +1,203 @@
-from typing import Annotated
+import asyncio
+from typing import Annotated, Any, AsyncIterator
 
-from fastapi import APIRouter, Body, Depends, Path, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, Depends, Header, Path, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.dependencies import answer, db
-from api.schemas import AnswerCreateSchema, AnswerResponseSchema
+from api.dependencies import answer, db, idempotency, stream
+from api.schemas import (
+    AnswerCreateSchema,
+    AnswerFieldsQuerySchema,
+    AnswerResponseSchema,
+    AnswersFeedQuerySchema,
+    AnswersFeedSchema,
+    ArchivedAnswerResponseSchema,
+    ArchivedAnswersPageSchema,
+    ArchivedAnswersQuerySchema,
+)
+from api.schemas.fields import sparse_schema, split_fields
+from db.models import Answer
+from db.notifications import AnswerBroadcaster, Subscription
+from settings import stream_settings
 
 router = APIRouter(tags=["Answers"])
 
 
+def _format_event(answer: Answer) -> str:
+    data = AnswerResponseSchema.model_validate(answer).model_dump_json()
+    return f"id: {answer.id}\nevent: answer\ndata: {data}\n\n"
+
+
+async def _stream_events(
+    broadcaster: AnswerBroadcaster,
+    question_id: int,
+    subscription: Subscription,
+    missed: list[Answer],
+) -> AsyncIterator[str]:
+    try:
+        for missed_answer in missed:
+            yield _format_event(answer=missed_answer)
+
+        sent_ids = {missed_answer.id for missed_answer in missed}
+
+        while True:
+            try:
+                new_answer = await asyncio.wait_for(
+                    subscription.get(), timeout=stream_settings.heartbeat_interval
+                )
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            if new_answer is None:
+                return
+
+            if new_answer.id not in sent_ids:
+                yield _format_event(answer=new_answer)
+    finally:
+        broadcaster.unsubscribe(question_id=question_id, subscription=subscription)
+
+
 @router.post("/questions/{id}/answers/")
 async def create(
     id: Annotated[int, Path(description="Question ID")],
     data: Annotated[
         AnswerCreateSchema, Body(description="Data for creating an answer")
     ],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_question_session)],
     usecase: Annotated[
         answer.AnswerUsecase, Depends(dependency=answer.get_answer_usecase)
     ],
+    idempotent: Annotated[
+        idempotency.IdempotentRequest,
+        Depends(dependency=idempotency.get_idempotent_request),
+    ],
 ) -> AnswerResponseSchema:
+    async def create_answer(transaction: AsyncSession | None) -> dict[str, Any]:
+        return AnswerResponseSchema.model_validate(
+            await usecase.create(
+                session=session,
+                question_id=id,
+                user_id=data.user_id,
+                text=data.text,
+                transaction=transaction,
+            )
+        ).model_dump(mode="json")
+
     return AnswerResponseSchema.model_validate(
-        await usecase.create(
-            session=session, question_id=id, user_id=data.user_id, text=data.text
+        await idempotent.run(body=data.model_dump(mode="json"), operation=create_answer)
+    )
+
+
+@router.get(
+    path="/questions/{id}/answers/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_answers(
+    id: Annotated[int, Path(description="Question ID")],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_question_session)],
+    usecase: Annotated[
+        answer.AnswerUsecase, Depends(dependency=answer.get_answer_usecase)
+    ],
+    broadcaster: Annotated[
+        AnswerBroadcaster, Depends(dependency=stream.get_answer_broadcaster)
+    ],
+    last_event_id: Annotated[
+        int | None, Header(description="The last answer ID received")
+    ] = None,
+) -> StreamingResponse:
+    subscription = await broadcaster.subscribe(question_id=id)
+
+    try:
+        missed = await usecase.get_missed(
+            session=session, question_id=id, last_id=last_event_id
         )
+    except Exception:
+        broadcaster.unsubscribe(question_id=id, subscription=subscription)
+        raise
+
+    return StreamingResponse(
+        content=_stream_events(
+            broadcaster=broadcaster,
+            question_id=id,
+            subscription=subscription,
+            missed=missed,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
-@router.get(path="/answers/{id}")
+@router.get(path="/questions/{id}/answers/archive")
+async def get_archived(
+    id: Annotated[int, Path(description="Question ID")],
+    params: Annotated[ArchivedAnswersQuerySchema, Query()],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_question_session)],
+    usecase: Annotated[
+        answer.AnswerUsecase, Depends(dependency=answer.get_answer_usecase)
+    ],
+) -> ArchivedAnswersPageSchema:
+    answers, next_cursor = await usecase.get_archived(
+        session=session, question_id=id, limit=params.limit, cursor=params.cursor
+    )
+
+    return ArchivedAnswersPageSchema(
+        items=[ArchivedAnswerResponseSchema.model_validate(item) for item in answers],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(path="/answers/feed")
+async def get_feed(
+    params: Annotated[AnswersFeedQuerySchema, Query()],
+    sessions: Annotated[list[AsyncSession], Depends(dependency=db.get_shard_sessions)],
+    usecase: Annotated[
+        answer.AnswerUsecase, Depends(dependency=answer.get_answer_usecase)
+    ],
+) -> AnswersFeedSchema:
+    answers, has_more = await usecase.get_feed(
+        sessions=sessions,
+        limit=params.limit,
+        since_created_at=params.since_created_at,
+        since_id=params.since_id,
+    )
+    last = answers[-1] if answers else None
+
+    return AnswersFeedSchema(
+        items=[AnswerResponseSchema.model_validate(answer) for answer in answers],
+        has_more=has_more,
+        since_created_at=last.created_at if last else params.since_created_at,
+        since_id=last.id if last else params.since_id,
+    )
+
+
+@router.get(path="/answers/{id}", response_model=AnswerResponseSchema)
 async def get_by_id(
     id: Annotated[int, Path(description="Answer ID")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    params: Annotated[AnswerFieldsQuerySchema, Query()],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_answer_session)],
     usecase: Annotated[
         answer.AnswerUsecase, Depends(dependency=answer.get_answer_usecase)
     ],
-) -> AnswerResponseSchema:
-    return AnswerResponseSchema.model_validate(
-        await usecase.get_by_id(session=session, id=id)
-    )
+) -> AnswerResponseSchema | JSONResponse:
+    fields = split_fields(value=params.fields)
+    found = await usecase.get_by_id(session=session, id=id, fields=fields)
+
+    if fields is not None:
+        schema = sparse_schema(schema=AnswerResponseSchema, fields=fields)
+        return JSONResponse(
+            content=schema.model_validate(found).model_dump(mode="json")
+        )
+
+    return AnswerResponseSchema.model_validate(found)
 
 
 @router.delete(path="/answers/{id}")
 async def delete_by_id(
     id: Annotated[int, Path(description="Answer ID")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_answer_session)],
     usecase: Annotated[
         answer.AnswerUsecase, Depends(dependency=answer.get_answer_usecase)
     ],
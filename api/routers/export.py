@@ -0,0 +1,53 @@
+from contextlib import AsyncExitStack
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.dependencies import db, export
+from api.schemas import ExportQuerySchema
+from constants.export import EXPORT_MEDIA_TYPES
+
+router = APIRouter(tags=["Export"])
+
+
+@router.get(
+    path="/export/questions",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+)
+async def export_questions(
+    params: Annotated[ExportQuerySchema, Query()],
+    factories: Annotated[
+        list[async_sessionmaker[AsyncSession]],
+        Depends(dependency=db.get_shard_session_factories),
+    ],
+    usecase: Annotated[
+        export.ExportUsecase, Depends(dependency=export.get_export_usecase)
+    ],
+) -> StreamingResponse:
+    usecase.check_format(format=params.format)
+
+    async def stream() -> AsyncIterator[bytes]:
+        async with AsyncExitStack() as stack:
+            sessions = [
+                await stack.enter_async_context(factory()) for factory in factories
+            ]
+            async for chunk in usecase.export(
+                sessions=sessions,
+                format=params.format,
+                created_from=params.created_from,
+                created_to=params.created_to,
+            ):
+                yield chunk
+
+    return StreamingResponse(
+        content=stream(),
+        media_type=EXPORT_MEDIA_TYPES[params.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="questions.{params.format}"'
+        },
+    )
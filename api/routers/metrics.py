@@ -0,0 +1,23 @@
+import os
+
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(path="/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    registry = REGISTRY
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry=registry)
+
+    return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
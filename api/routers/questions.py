@@ -1,30 +1,59 @@
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Path, Query, Response, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.dependencies import db, question
+from api.dependencies import db, idempotency, question, trending
 from api.schemas import (
     QuestionCreateSchema,
+    QuestionDeletionSchema,
+    QuestionFieldsQuerySchema,
     QuestionResponseSchema,
+    QuestionsQuerySchema,
     QuestionWithAnswersResponseSchema,
+    TrendingQuestionResponseSchema,
+    TrendingQuestionsQuerySchema,
 )
+from api.schemas.fields import sparse_schema, split_fields
+from constants.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(tags=["Questions"])
 
 
-@router.get(path="/questions/")
+@router.get(path="/questions/", response_model=list[QuestionResponseSchema])
 async def get_all(
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    params: Annotated[QuestionsQuerySchema, Query()],
+    response: Response,
+    sessions: Annotated[list[AsyncSession], Depends(dependency=db.get_shard_sessions)],
     usecase: Annotated[
         question.QuestionUsecase, Depends(dependency=question.get_question_usecase)
     ],
-) -> list[QuestionResponseSchema]:
-    return [
-        QuestionResponseSchema.model_validate(question)
-        for question in await usecase.get_all(session=session)
-    ]
+) -> list[QuestionResponseSchema] | JSONResponse:
+    fields = split_fields(value=params.fields)
+    questions, next_cursor = await usecase.get_all(
+        sessions=sessions,
+        sort_by=params.sort_by,
+        descending=params.order == "desc",
+        limit=params.limit,
+        cursor=params.cursor,
+        fields=fields,
+    )
+
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    if fields is not None:
+        schema = sparse_schema(schema=QuestionResponseSchema, fields=fields)
+        return JSONResponse(
+            content=[
+                schema.model_validate(question).model_dump(mode="json")
+                for question in questions
+            ],
+            headers=dict(response.headers),
+        )
+
+    return [QuestionResponseSchema.model_validate(question) for question in questions]
 
 
 @router.post(path="/questions/")
@@ -32,39 +61,97 @@ async def create(
     data: Annotated[
         QuestionCreateSchema, Body(description="Data for creating a question")
     ],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    sessions: Annotated[list[AsyncSession], Depends(dependency=db.get_shard_sessions)],
     usecase: Annotated[
         question.QuestionUsecase, Depends(dependency=question.get_question_usecase)
     ],
+    idempotent: Annotated[
+        idempotency.IdempotentRequest,
+        Depends(dependency=idempotency.get_idempotent_request),
+    ],
 ) -> QuestionResponseSchema:
+    async def create_question(transaction: AsyncSession | None) -> dict[str, Any]:
+        return QuestionResponseSchema.model_validate(
+            await usecase.create(
+                sessions=sessions, text=data.text, transaction=transaction
+            )
+        ).model_dump(mode="json")
+
     return QuestionResponseSchema.model_validate(
-        await usecase.create(session=session, text=data.text)
+        await idempotent.run(
+            body=data.model_dump(mode="json"), operation=create_question
+        )
     )
 
 
-@router.get(path="/questions/{id}")
+@router.get(path="/questions/trending")
+async def get_trending(
+    params: Annotated[TrendingQuestionsQuerySchema, Query()],
+    sessions: Annotated[list[AsyncSession], Depends(dependency=db.get_shard_sessions)],
+    usecase: Annotated[
+        trending.TrendingUsecase, Depends(dependency=trending.get_trending_usecase)
+    ],
+) -> list[TrendingQuestionResponseSchema]:
+    return [
+        TrendingQuestionResponseSchema(
+            **QuestionResponseSchema.model_validate(question).model_dump(), score=score
+        )
+        for question, score in await usecase.get_top(
+            sessions=sessions, limit=params.limit
+        )
+    ]
+
+
+@router.get(path="/questions/{id}", response_model=QuestionWithAnswersResponseSchema)
 async def get_with_answers(
     id: Annotated[int, Path(description="Question ID")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    params: Annotated[QuestionFieldsQuerySchema, Query()],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_question_session)],
     usecase: Annotated[
         question.QuestionUsecase, Depends(dependency=question.get_question_usecase)
     ],
-) -> QuestionWithAnswersResponseSchema:
-    return QuestionWithAnswersResponseSchema.model_validate(
-        await usecase.get_with_answers(session=session, id=id)
+) -> QuestionWithAnswersResponseSchema | JSONResponse:
+    fields = split_fields(value=params.fields)
+    found, answers = await usecase.get_with_answers(
+        session=session, id=id, fields=fields
     )
+    data = {**found._mapping, "answers": answers}
+
+    if fields is not None:
+        schema = sparse_schema(schema=QuestionWithAnswersResponseSchema, fields=fields)
+        return JSONResponse(content=schema.model_validate(data).model_dump(mode="json"))
+
+    return QuestionWithAnswersResponseSchema.model_validate(data)
 
 
 @router.delete(path="/questions/{id}")
 async def delete_by_id(
     id: Annotated[int, Path(description="Question ID")],
-    session: Annotated[AsyncSession, Depends(dependency=db.get_session)],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_question_session)],
     usecase: Annotated[
         question.QuestionUsecase, Depends(dependency=question.get_question_usecase)
     ],
 ) -> JSONResponse:
     await usecase.delete_by_id(session=session, id=id)
     return JSONResponse(
-        content={"message": "Question and answers deleted successfully"},
+        content={"message": "Question deleted, answers are being purged"},
         status_code=status.HTTP_202_ACCEPTED,
     )
+
+
+@router.get(path="/questions/{id}/deletion")
+async def get_deletion_status(
+    id: Annotated[int, Path(description="Question ID")],
+    session: Annotated[AsyncSession, Depends(dependency=db.get_question_session)],
+    usecase: Annotated[
+        question.QuestionUsecase, Depends(dependency=question.get_question_usecase)
+    ],
+) -> QuestionDeletionSchema:
+    deleted = await usecase.get_deletion_status(session=session, id=id)
+
+    return QuestionDeletionSchema(
+        id=deleted.id,
+        status="active" if deleted.deleted_at is None else "purging",
+        deleted_at=deleted.deleted_at,
+        remaining_answers=deleted.answer_count,
+    )
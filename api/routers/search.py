@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies import db, search
+from api.schemas import SearchPageSchema, SearchQuerySchema, SearchResultSchema
+
+router = APIRouter(tags=["Search"])
+
+
+@router.get(path="/search")
+async def search_texts(
+    params: Annotated[SearchQuerySchema, Query()],
+    sessions: Annotated[list[AsyncSession], Depends(dependency=db.get_shard_sessions)],
+    usecase: Annotated[
+        search.SearchUsecase, Depends(dependency=search.get_search_usecase)
+    ],
+) -> SearchPageSchema:
+    results, next_cursor = await usecase.search(
+        sessions=sessions, query=params.q, limit=params.limit, cursor=params.cursor
+    )
+
+    return SearchPageSchema(
+        items=[SearchResultSchema.model_validate(result) for result in results],
+        next_cursor=next_cursor,
+    )
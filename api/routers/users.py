@@ -0,0 +1,37 @@
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies import answer, db
+from api.schemas import (
+    UserAnswerResponseSchema,
+    UserAnswersPageSchema,
+    UserAnswersQuerySchema,
+)
+
+router = APIRouter(tags=["Users"])
+
+
+@router.get(path="/users/{user_id}/answers")
+async def get_answers(
+    user_id: Annotated[uuid.UUID, Path(description="User ID")],
+    params: Annotated[UserAnswersQuerySchema, Query()],
+    sessions: Annotated[list[AsyncSession], Depends(dependency=db.get_shard_sessions)],
+    usecase: Annotated[
+        answer.AnswerUsecase, Depends(dependency=answer.get_answer_usecase)
+    ],
+) -> UserAnswersPageSchema:
+    answers, next_cursor = await usecase.get_by_user(
+        sessions=sessions,
+        user_id=user_id,
+        limit=params.limit,
+        cursor=params.cursor,
+        with_question=params.with_question,
+    )
+
+    return UserAnswersPageSchema(
+        items=[UserAnswerResponseSchema.model_validate(answer) for answer in answers],
+        next_cursor=next_cursor,
+    )
@@ -1,13 +1,34 @@
 from api.schemas.answer import (
     AnswerCreateSchema,
+    AnswerFieldsQuerySchema,
+    AnswerQuestionSchema,
     AnswerResponseSchema,
+    AnswersFeedQuerySchema,
+    AnswersFeedSchema,
     AnswerUpdateSchema,
+    ArchivedAnswerResponseSchema,
+    ArchivedAnswersPageSchema,
+    ArchivedAnswersQuerySchema,
+    UserAnswerResponseSchema,
+    UserAnswersPageSchema,
+    UserAnswersQuerySchema,
 )
+from api.schemas.export import ExportQuerySchema
 from api.schemas.question import (
     QuestionCreateSchema,
+    QuestionDeletionSchema,
+    QuestionFieldsQuerySchema,
     QuestionResponseSchema,
+    QuestionsQuerySchema,
     QuestionUpdateSchema,
     QuestionWithAnswersResponseSchema,
+    TrendingQuestionResponseSchema,
+    TrendingQuestionsQuerySchema,
+)
+from api.schemas.search import (
+    SearchPageSchema,
+    SearchQuerySchema,
+    SearchResultSchema,
 )
 
 __all__ = [
@@ -15,7 +36,26 @@ __all__ = [
     "QuestionResponseSchema",
     "QuestionUpdateSchema",
     "QuestionWithAnswersResponseSchema",
+    "QuestionsQuerySchema",
+    "QuestionFieldsQuerySchema",
+    "TrendingQuestionsQuerySchema",
+    "TrendingQuestionResponseSchema",
     "AnswerCreateSchema",
     "AnswerResponseSchema",
     "AnswerUpdateSchema",
+    "AnswerFieldsQuerySchema",
+    "AnswerQuestionSchema",
+    "UserAnswerResponseSchema",
+    "UserAnswersPageSchema",
+    "UserAnswersQuerySchema",
+    "AnswersFeedQuerySchema",
+    "AnswersFeedSchema",
+    "SearchQuerySchema",
+    "SearchResultSchema",
+    "SearchPageSchema",
+    "ExportQuerySchema",
+    "QuestionDeletionSchema",
+    "ArchivedAnswerResponseSchema",
+    "ArchivedAnswersQuerySchema",
+    "ArchivedAnswersPageSchema",
 ]
@@ -1,8 +1,16 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
+from api.schemas.fields import FIELDS_DESCRIPTION, check_fields
+from api.schemas.types import NaiveUTCDatetime
+from constants.pagination import (
+    DEFAULT_FEED_SIZE,
+    DEFAULT_PAGE_SIZE,
+    MAX_FEED_SIZE,
+    MAX_PAGE_SIZE,
+)
 from constants.text import DEFAULT_TEXT_LENGTH
 
 
@@ -36,3 +44,110 @@ class AnswerResponseSchema(AnswerBaseSchema):
 
     class Config:
         from_attributes = True
+
+
+class AnswerFieldsQuerySchema(BaseModel):
+    fields: str | None = Field(default=None, description=FIELDS_DESCRIPTION)
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, value: str | None) -> str | None:
+        return check_fields(value=value, schema=AnswerResponseSchema)
+
+
+class AnswerQuestionSchema(BaseModel):
+    id: int = Field(default=..., description="The question ID", gt=0)
+    text: str = Field(default=..., description="The question text")
+
+    class Config:
+        from_attributes = True
+
+
+class UserAnswerResponseSchema(AnswerResponseSchema):
+    question: AnswerQuestionSchema | None = Field(
+        default=None, description="The answered question, if requested"
+    )
+
+
+class UserAnswersQuerySchema(BaseModel):
+    limit: int = Field(
+        default=DEFAULT_PAGE_SIZE, description="The page size", ge=1, le=MAX_PAGE_SIZE
+    )
+    cursor: str | None = Field(
+        default=None, description="The cursor returned with the previous page"
+    )
+    with_question: bool = Field(
+        default=False, description="Whether to embed the answered question"
+    )
+
+
+class UserAnswersPageSchema(BaseModel):
+    items: list[UserAnswerResponseSchema] = Field(
+        default_factory=list, description="The answers, newest first"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="The cursor of the next page, if there is one"
+    )
+
+
+class ArchivedAnswerResponseSchema(AnswerResponseSchema):
+    archived_at: datetime = Field(default=..., description="When it was archived")
+
+
+class ArchivedAnswersQuerySchema(BaseModel):
+    limit: int = Field(
+        default=DEFAULT_PAGE_SIZE, description="The page size", ge=1, le=MAX_PAGE_SIZE
+    )
+    cursor: str | None = Field(
+        default=None, description="The cursor returned with the previous page"
+    )
+
+
+class ArchivedAnswersPageSchema(BaseModel):
+    items: list[ArchivedAnswerResponseSchema] = Field(
+        default_factory=list, description="The archived answers, oldest first"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="The cursor of the next page, if there is one"
+    )
+
+
+class AnswersFeedQuerySchema(BaseModel):
+    limit: int = Field(
+        default=DEFAULT_FEED_SIZE,
+        description="The maximum number of answers",
+        ge=1,
+        le=MAX_FEED_SIZE,
+    )
+    since_created_at: NaiveUTCDatetime | None = Field(
+        default=None, description="Only return answers created after this date"
+    )
+    since_id: int | None = Field(
+        default=None,
+        description="Only return answers after this ID among those created at "
+        "since_created_at",
+        gt=0,
+    )
+
+    @model_validator(mode="after")
+    def check_since(self) -> "AnswersFeedQuerySchema":
+        if self.since_id is not None and self.since_created_at is None:
+            msg = "since_id requires since_created_at"
+            raise ValueError(msg)
+
+        return self
+
+
+class AnswersFeedSchema(BaseModel):
+    items: list[AnswerResponseSchema] = Field(
+        default_factory=list, description="The answers, oldest first"
+    )
+    has_more: bool = Field(
+        default=False, description="Whether more answers are ready to be fetched"
+    )
+    since_created_at: NaiveUTCDatetime | None = Field(
+        default=None, description="The since_created_at to pass on the next poll"
+    )
+    since_id: int | None = Field(
+        default=None, description="The since_id to pass on the next poll"
+    )
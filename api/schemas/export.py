@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field, model_validator
+
+from api.schemas.types import NaiveUTCDatetime
+from constants.export import ExportFormat
+
+
+class ExportQuerySchema(BaseModel):
+    format: ExportFormat = Field(default="ndjson", description="The export format")
+    created_from: NaiveUTCDatetime | None = Field(
+        default=None, description="Only questions created at or after this date"
+    )
+    created_to: NaiveUTCDatetime | None = Field(
+        default=None, description="Only questions created before this date"
+    )
+
+    @model_validator(mode="after")
+    def check_range(self) -> "ExportQuerySchema":
+        if (
+            self.created_from is not None
+            and self.created_to is not None
+            and self.created_from > self.created_to
+        ):
+            msg = "created_from must not be after created_to"
+            raise ValueError(msg)
+
+        return self
@@ -0,0 +1,106 @@
+import functools
+from typing import Any, get_args
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return, all of them by default; nested fields "
+    "are picked with a dot, e.g. answers.id"
+)
+
+
+def split_fields(value: str | None) -> frozenset[str] | None:
+    """Split a comma-separated sparse fieldset.
+
+    Args:
+        value: The fieldset.
+
+    Returns:
+        The field names, or None if every field is requested.
+
+    """
+    if value is None:
+        return None
+
+    return frozenset(name.strip() for name in value.split(",") if name.strip())
+
+
+def _nested_schema(schema: type[BaseModel], name: str) -> type[BaseModel] | None:
+    annotation = schema.model_fields[name].annotation
+    item = next(iter(get_args(annotation)), annotation)
+
+    return item if isinstance(item, type) and issubclass(item, BaseModel) else None
+
+
+def check_fields(value: str | None, schema: type[BaseModel]) -> str | None:
+    """Check that a sparse fieldset only names fields of a response schema.
+
+    Args:
+        value: The comma-separated fieldset.
+        schema: The response schema.
+
+    Returns:
+        The fieldset.
+
+    Raises:
+        ValueError: If the fieldset is empty or names an unknown field.
+
+    """
+    fields = split_fields(value=value)
+
+    if fields is None:
+        return value
+
+    if not fields:
+        msg = "fields must name at least one field"
+        raise ValueError(msg)
+
+    for field in sorted(fields):
+        name, _, nested = field.partition(".")
+        known = name in schema.model_fields
+
+        if known and nested:
+            nested_schema = _nested_schema(schema=schema, name=name)
+            known = nested_schema is not None and nested in nested_schema.model_fields
+
+        if not known:
+            msg = f"Unknown field: {field}"
+            raise ValueError(msg)
+
+    return value
+
+
+@functools.cache
+def sparse_schema(schema: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Build a response schema trimmed to a sparse fieldset.
+
+    A nested field, such as ``answers.id``, trims the nested schema; naming
+    ``answers`` alone keeps it whole.
+
+    Args:
+        schema: The response schema.
+        fields: The checked field names.
+
+    Returns:
+        The trimmed schema, with the fields in the order of the full one.
+
+    """
+    definitions: dict[str, Any] = {}
+
+    for name, info in schema.model_fields.items():
+        nested = frozenset(
+            field.partition(".")[2] for field in fields if field.startswith(f"{name}.")
+        )
+        nested_schema = _nested_schema(schema=schema, name=name)
+
+        if nested and nested_schema is not None:
+            trimmed = sparse_schema(schema=nested_schema, fields=nested)
+            definitions[name] = (list[trimmed], info)
+        elif name in fields:
+            definitions[name] = (info.annotation, info)
+
+    return create_model(
+        f"Sparse{schema.__name__}",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
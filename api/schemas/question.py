@@ -1,8 +1,11 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from api.schemas.answer import AnswerResponseSchema
+from api.schemas.fields import FIELDS_DESCRIPTION, check_fields
+from constants.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from constants.text import DEFAULT_TEXT_LENGTH
 
 
@@ -31,6 +34,13 @@ class QuestionUpdateSchema(BaseModel):
 class QuestionResponseSchema(QuestionBaseSchema):
     id: int = Field(default=..., description="The question ID", gt=0)
     created_at: datetime = Field(default=..., description="The question creation date")
+    answer_count: int = Field(
+        default=0, description="The number of answers, archived ones included", ge=0
+    )
+    last_answer_at: datetime | None = Field(
+        default=None,
+        description="The creation date of the latest answer, archived ones included",
+    )
 
     class Config:
         from_attributes = True
@@ -40,3 +50,69 @@ class QuestionWithAnswersResponseSchema(QuestionResponseSchema):
     answers: list[AnswerResponseSchema] = Field(
         default_factory=list, description="The question answers"
     )
+
+
+class QuestionsQuerySchema(BaseModel):
+    sort_by: Literal["id", "created_at", "answer_count", "last_answer_at"] = Field(
+        default="id",
+        description="The field to sort by; answer_count and last_answer_at sort "
+        "by the values last folded in from the answer counters, so new answers "
+        "move a question once the counters are compacted",
+    )
+    order: Literal["asc", "desc"] = Field(
+        default="asc", description="The sort order; questions without answers last"
+    )
+    limit: int | None = Field(
+        default=None, description="The maximum number of questions", ge=1
+    )
+    cursor: str | None = Field(
+        default=None,
+        description="The X-Next-Cursor header returned with the previous page",
+    )
+    fields: str | None = Field(default=None, description=FIELDS_DESCRIPTION)
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, value: str | None) -> str | None:
+        return check_fields(value=value, schema=QuestionResponseSchema)
+
+
+class QuestionFieldsQuerySchema(BaseModel):
+    fields: str | None = Field(default=None, description=FIELDS_DESCRIPTION)
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, value: str | None) -> str | None:
+        return check_fields(value=value, schema=QuestionWithAnswersResponseSchema)
+
+
+class TrendingQuestionsQuerySchema(BaseModel):
+    limit: int = Field(
+        default=DEFAULT_PAGE_SIZE,
+        description="The maximum number of questions",
+        ge=1,
+        le=MAX_PAGE_SIZE,
+    )
+
+
+class TrendingQuestionResponseSchema(QuestionResponseSchema):
+    score: float = Field(
+        default=..., description="The time-decayed answer velocity", ge=0
+    )
+
+
+class QuestionDeletionSchema(BaseModel):
+    id: int = Field(default=..., description="The question ID", gt=0)
+    status: Literal["active", "purging"] = Field(
+        default=...,
+        description="Whether the question is active or being purged; once purged, "
+        "the question is not found",
+    )
+    deleted_at: datetime | None = Field(
+        default=None, description="When the question was deleted"
+    )
+    remaining_answers: int = Field(
+        default=...,
+        description="The number of answers left to purge, archived ones included",
+        ge=0,
+    )
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from constants.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from constants.search import MAX_SEARCH_QUERY_LENGTH
+
+
+class SearchQuerySchema(BaseModel):
+    q: str = Field(
+        default=...,
+        description="The search query; supports quotes, OR and -exclusions",
+        min_length=1,
+        max_length=MAX_SEARCH_QUERY_LENGTH,
+    )
+    limit: int = Field(
+        default=DEFAULT_PAGE_SIZE, description="The page size", ge=1, le=MAX_PAGE_SIZE
+    )
+    cursor: str | None = Field(
+        default=None, description="The cursor returned with the previous page"
+    )
+
+
+class SearchResultSchema(BaseModel):
+    kind: Literal["question", "answer"] = Field(
+        default=..., description="Whether a question or an answer matched"
+    )
+    id: int = Field(default=..., description="The question or answer ID", gt=0)
+    question_id: int = Field(default=..., description="The question ID", gt=0)
+    text: str = Field(default=..., description="The matched text")
+    created_at: datetime = Field(default=..., description="The creation date")
+    rank: float = Field(default=..., description="The relevance rank")
+
+    class Config:
+        from_attributes = True
+
+
+class SearchPageSchema(BaseModel):
+    items: list[SearchResultSchema] = Field(
+        default_factory=list, description="The results, best matches first"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="The cursor of the next page, if there is one"
+    )
@@ -0,0 +1,23 @@
+from datetime import UTC, datetime
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to the naive UTC the database stores.
+
+    Args:
+        value: The datetime; naive ones are taken as UTC already.
+
+    Returns:
+        The naive UTC datetime.
+
+    """
+    if value.tzinfo is None:
+        return value
+
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+NaiveUTCDatetime = Annotated[datetime, AfterValidator(to_naive_utc)]
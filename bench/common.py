@@ -0,0 +1,194 @@
+import argparse
+import json
+import math
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from sqlalchemy.engine import URL, make_url
+from testcontainers.postgres import PostgresContainer
+
+from tests.containers import get_async_url
+
+Results = dict[str, dict[str, float]]
+
+
+@contextmanager
+def postgres() -> Iterator[URL]:
+    """Start a throwaway Postgres container.
+
+    Yields:
+        The asyncpg URL of the container.
+
+    """
+    with PostgresContainer() as container:
+        yield make_url(get_async_url(container))
+
+
+def db_environment(url: URL) -> dict[str, str]:
+    """Build the environment that points the application at a database.
+
+    Args:
+        url: The database URL.
+
+    Returns:
+        The environment with the ``DB_*`` settings overridden.
+
+    """
+    return {
+        **os.environ,
+        "DB_HOST": url.host or "localhost",
+        "DB_PORT": str(url.port or 5432),
+        "DB_LOGIN": url.username or "",
+        "DB_PASSWORD": url.password or "",
+        "DB_NAME": url.database or "",
+    }
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Get a nearest-rank percentile.
+
+    Args:
+        values: The sorted values.
+        fraction: The percentile as a fraction, e.g. ``0.95``.
+
+    Returns:
+        The percentile value, or NaN for no values.
+
+    """
+    if not values:
+        return math.nan
+
+    return values[min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))]
+
+
+def summarize(latencies: list[float]) -> dict[str, float]:
+    """Summarize latencies in milliseconds.
+
+    Args:
+        latencies: The latencies in seconds.
+
+    Returns:
+        The p50, p95 and p99 latencies in milliseconds.
+
+    """
+    latencies = sorted(latencies)
+
+    return {
+        "p50_ms": percentile(values=latencies, fraction=0.50) * 1000,
+        "p95_ms": percentile(values=latencies, fraction=0.95) * 1000,
+        "p99_ms": percentile(values=latencies, fraction=0.99) * 1000,
+    }
+
+
+def find_regressions(
+    results: Results,
+    baseline: Results,
+    tolerance: float,
+    higher_is_better: tuple[str, ...] = (),
+) -> list[str]:
+    """Compare results against a baseline.
+
+    Args:
+        results: The current results by case.
+        baseline: The baseline results by case.
+        tolerance: The allowed relative change, e.g. ``0.2`` for 20%.
+        higher_is_better: Metrics where a decrease is a regression.
+
+    Returns:
+        A description of every metric that regressed past the tolerance.
+
+    """
+    regressions = []
+
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            expected = baseline.get(case, {}).get(metric)
+            if expected is None or math.isnan(expected) or expected <= 0:
+                continue
+
+            change = (value - expected) / expected
+            if metric in higher_is_better:
+                change = -change
+
+            if change > tolerance:
+                regressions.append(
+                    f"{case} {metric}: {value:.2f} vs baseline {expected:.2f} "
+                    f"({change:+.0%})"
+                )
+
+    return regressions
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file.
+
+    Args:
+        path: The file path.
+
+    Returns:
+        The decoded data.
+
+    """
+    return json.loads(path.read_text())
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write data to a JSON file, creating its directory.
+
+    Args:
+        path: The file path.
+        data: The data to encode.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def report(
+    results: Results,
+    table: str,
+    args: argparse.Namespace,
+    higher_is_better: tuple[str, ...] = (),
+) -> int:
+    """Print results, store them and compare them against a baseline.
+
+    A missing baseline file is created from the results.
+
+    Args:
+        results: The results by case.
+        table: The rendered results.
+        args: The command line arguments with ``output``, ``baseline`` and
+            ``tolerance``.
+        higher_is_better: Metrics where a decrease is a regression.
+
+    Returns:
+        The exit code, non-zero when a regression was found.
+
+    """
+    sys.stdout.write(table)
+
+    if args.output:
+        write_json(path=args.output, data=results)
+
+    baseline = args.baseline
+    if baseline is None:
+        return 0
+
+    if not baseline.exists():
+        write_json(path=baseline, data=results)
+        sys.stdout.write(f"Saved baseline to {baseline}\n")
+        return 0
+
+    regressions = find_regressions(
+        results=results,
+        baseline=read_json(path=baseline),
+        tolerance=args.tolerance,
+        higher_is_better=higher_is_better,
+    )
+    for regression in regressions:
+        sys.stdout.write(f"REGRESSION {regression}\n")
+
+    return 1 if regressions else 0
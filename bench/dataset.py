@@ -0,0 +1,243 @@
+"""Fill a Postgres database with a synthetic, reproducible dataset using COPY.
+
+Usage:
+    python -m bench.dataset --questions 1000000 --users 100000 --seed 42
+
+With shards, fill each shard through its own --dsn and --shard; the IDs follow
+the layout of ``python -m jobs configure-shards``.
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import uuid
+from datetime import date, datetime, time, timedelta
+from typing import Iterator
+
+import asyncpg
+
+from db.models import Answer
+from db.models.partitions import monthly_partition_ddl, months_between
+from settings import db_settings, get_logger
+from tests.factories import AnswerFactory, QuestionFactory
+from tests.factories.base import fake
+
+logger = get_logger(__name__)
+
+QUESTION_COLUMNS = ("id", "text", "created_at")
+ANSWER_COLUMNS = ("id", "question_id", "user_id", "text", "created_at")
+
+
+def zipf_cum_weights(size: int, exponent: float) -> list[float]:
+    """Build cumulative weights of a bounded Zipf distribution over ``range(size)``.
+
+    Args:
+        size: The number of ranks.
+        exponent: The Zipf exponent; larger values skew harder.
+
+    Returns:
+        The cumulative weights for ``random.choices``.
+
+    """
+    return list(
+        itertools.accumulate(1 / (rank + 1) ** exponent for rank in range(size))
+    )
+
+
+class DatasetGenerator:
+    def __init__(self, args: argparse.Namespace):
+        self.rng = random.Random(args.seed)  # noqa: S311
+        self.now = args.until
+        self.span = timedelta(days=args.days).total_seconds()
+
+        fake.seed_instance(args.seed)
+        self.question_texts = [
+            QuestionFactory.build().text for _ in range(args.text_pool)
+        ]
+        self.answer_texts = [AnswerFactory.build().text for _ in range(args.text_pool)]
+        self.user_ids = [
+            uuid.UUID(int=self.rng.getrandbits(128), version=4)
+            for _ in range(args.users)
+        ]
+
+        self.answer_counts = range(args.max_answers + 1)
+        self.answer_count_weights = zipf_cum_weights(
+            size=args.max_answers + 1, exponent=args.answers_zipf
+        )
+        self.user_weights = zipf_cum_weights(size=args.users, exponent=args.users_zipf)
+
+    def questions(self, ids: Iterator[int], count: int) -> Iterator[tuple]:
+        """Generate question rows.
+
+        Args:
+            ids: The question IDs to take from.
+            count: The number of questions.
+
+        Yields:
+            The question rows.
+
+        """
+        for question_id in itertools.islice(ids, count):
+            yield (
+                question_id,
+                self.rng.choice(self.question_texts),
+                self.now - timedelta(seconds=self.rng.random() * self.span),
+            )
+
+    def answers(self, questions: list[tuple], ids: Iterator[int]) -> Iterator[tuple]:
+        """Generate Zipf-distributed answers for questions.
+
+        Answers are spread between their question's creation and now, and are
+        written by Zipf-distributed users, so a few users write most answers.
+
+        Args:
+            questions: The question rows.
+            ids: The answer IDs to take from.
+
+        Yields:
+            The answer rows.
+
+        """
+        for question_id, _, created_at in questions:
+            count = self.rng.choices(
+                self.answer_counts, cum_weights=self.answer_count_weights
+            )[0]
+            users = self.rng.choices(
+                self.user_ids, cum_weights=self.user_weights, k=count
+            )
+            window = (self.now - created_at).total_seconds()
+
+            for user_id in users:
+                yield (
+                    next(ids),
+                    question_id,
+                    user_id,
+                    self.rng.choice(self.answer_texts),
+                    created_at + timedelta(seconds=self.rng.random() * window),
+                )
+
+
+def shard_first_id(last_id: int, shard: int, shard_count: int) -> int:
+    """Get the first ID above ``last_id`` that routes to a shard.
+
+    Args:
+        last_id: The highest used ID.
+        shard: The shard number.
+        shard_count: The number of shards.
+
+    Returns:
+        The ID.
+
+    """
+    return last_id + 1 + (shard - last_id) % shard_count
+
+
+async def fill(args: argparse.Namespace) -> None:
+    """Copy the synthetic dataset into the configured database in batches.
+
+    The monthly answer partitions of the generated period are created first,
+    so the answers do not pile up in the default partition.
+
+    Args:
+        args: The command line arguments.
+
+    """
+    generator = DatasetGenerator(args=args)
+    connection = await asyncpg.connect(dsn=args.dsn)
+
+    try:
+        for month in months_between(
+            first=(args.until - timedelta(days=args.days)).date(),
+            last=args.until.date(),
+        ):
+            await connection.execute(
+                monthly_partition_ddl(table=Answer.__tablename__, month=month)
+            )
+
+        ids = {
+            table: itertools.count(
+                start=shard_first_id(
+                    last_id=await connection.fetchval(
+                        f"SELECT coalesce(max(id), 0) FROM {table}"  # noqa: S608
+                    ),
+                    shard=args.shard,
+                    shard_count=args.shard_count,
+                ),
+                step=args.shard_count,
+            )
+            for table in ("questions", "answers")
+        }
+        remaining = args.questions
+
+        while remaining > 0:
+            batch_size = min(args.batch, remaining)
+            questions = list(
+                generator.questions(ids=ids["questions"], count=batch_size)
+            )
+            answers = list(generator.answers(questions=questions, ids=ids["answers"]))
+
+            async with connection.transaction():
+                await connection.copy_records_to_table(
+                    "questions", records=questions, columns=QUESTION_COLUMNS
+                )
+                await connection.copy_records_to_table(
+                    "answers", records=answers, columns=ANSWER_COLUMNS
+                )
+
+            remaining -= batch_size
+
+            logger.info(
+                "✅ Copied %s questions and %s answers, %s questions left",
+                len(questions),
+                len(answers),
+                remaining,
+            )
+
+        for table, table_ids in ids.items():
+            await connection.execute(
+                f"ALTER SEQUENCE {table}_id_seq INCREMENT BY {args.shard_count} "
+                f"RESTART WITH {next(table_ids)}"
+            )
+            await connection.execute(f"ANALYZE {table}")
+    finally:
+        await connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default=db_settings.dsn)
+    parser.add_argument("--questions", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--max-answers", type=int, default=10_000)
+    parser.add_argument(
+        "--answers-zipf",
+        type=float,
+        default=2.0,
+        help="Zipf exponent of the number of answers per question",
+    )
+    parser.add_argument(
+        "--users-zipf",
+        type=float,
+        default=1.0,
+        help="Zipf exponent of how answers are spread over users",
+    )
+    parser.add_argument(
+        "--until",
+        type=datetime.fromisoformat,
+        default=datetime.combine(date.today(), time.min),
+        help="Latest created_at; pass a fixed value for identical reruns",
+    )
+    parser.add_argument(
+        "--days", type=int, default=365, help="Days of history before --until"
+    )
+    parser.add_argument(
+        "--shard", type=int, default=0, help="The shard the DSN belongs to"
+    )
+    parser.add_argument("--shard-count", type=int, default=db_settings.shard_count)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument(
+        "--text-pool", type=int, default=2_000, help="Distinct texts sampled from"
+    )
+    asyncio.run(fill(args=parser.parse_args()))
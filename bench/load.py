@@ -0,0 +1,344 @@
+"""End-to-end HTTP load test against a throwaway Postgres container.
+
+Usage:
+    python -m bench.load --rps 200 --duration 30 --baseline bench/results/load.json
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import subprocess  # noqa: S404
+import sys
+import time
+import uuid
+from collections import defaultdict, deque
+from pathlib import Path
+
+import httpx
+from sqlalchemy import insert
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from bench.common import (
+    Results,
+    db_environment,
+    postgres,
+    report,
+    summarize,
+)
+from db.models import Answer, Base, Question
+from tests.factories import AnswerFactory, QuestionFactory
+
+SCENARIOS = {
+    "GET /questions/": 0.30,
+    "GET /questions/{id}": 0.45,
+    "POST /questions/{id}/answers/": 0.20,
+    "DELETE /answers/{id}": 0.05,
+}
+STARTUP_TIMEOUT = 30
+
+
+async def seed(url: URL, questions: int, answers_per_question: int) -> list[int]:
+    """Create the schema and seed questions with answers.
+
+    Args:
+        url: The database URL.
+        questions: The number of questions.
+        answers_per_question: The number of answers per question.
+
+    Returns:
+        The question IDs.
+
+    """
+    engine = create_async_engine(url=url)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+        result = await connection.execute(
+            insert(Question).returning(Question.id),
+            [{"text": QuestionFactory.build().text} for _ in range(questions)],
+        )
+        question_ids = list(result.scalars())
+
+        await connection.execute(
+            insert(Answer),
+            [
+                {
+                    "question_id": question_id,
+                    "user_id": uuid.uuid4(),
+                    "text": AnswerFactory.build().text,
+                }
+                for question_id in question_ids
+                for _ in range(answers_per_question)
+            ],
+        )
+
+    await engine.dispose()
+
+    return question_ids
+
+
+def start_server(url: URL, port: int, workers: int) -> subprocess.Popen:
+    """Start the application with uvicorn in a separate process.
+
+    Args:
+        url: The database URL.
+        port: The port to listen on.
+        workers: The number of worker processes.
+
+    Returns:
+        The server process.
+
+    """
+    return subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--no-access-log",
+            "--log-level",
+            "warning",
+        ],
+        env={**db_environment(url=url), "LOG_LEVEL": "WARNING"},
+    )
+
+
+async def wait_until_ready(client: httpx.AsyncClient) -> None:
+    """Wait for the server to accept requests.
+
+    Args:
+        client: The client pointed at the server.
+
+    Raises:
+        TimeoutError: If the server does not start in time.
+
+    """
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+
+    while time.monotonic() < deadline:
+        try:
+            await client.get(url="/metrics")
+        except httpx.TransportError:
+            await asyncio.sleep(0.2)
+        else:
+            return
+
+    msg = "Server did not start in time"
+    raise TimeoutError(msg)
+
+
+async def send(
+    client: httpx.AsyncClient,
+    scenario: str,
+    question_ids: list[int],
+    created_answer_ids: deque[int],
+    rng: random.Random,
+) -> tuple[str, bool]:
+    """Send one request of a scenario.
+
+    Args:
+        client: The HTTP client.
+        scenario: The scenario to run.
+        question_ids: The seeded question IDs.
+        created_answer_ids: Answers created by this run, available for deletion.
+        rng: The random generator.
+
+    Returns:
+        The route that was requested and whether it succeeded.
+
+    """
+    if scenario == "DELETE /answers/{id}" and created_answer_ids:
+        response = await client.delete(url=f"/answers/{created_answer_ids.popleft()}")
+        return scenario, response.is_success
+
+    if scenario == "GET /questions/":
+        response = await client.get(url="/questions/")
+        return scenario, response.is_success
+
+    question_id = rng.choice(question_ids)
+
+    if scenario == "GET /questions/{id}":
+        response = await client.get(url=f"/questions/{question_id}")
+        return scenario, response.is_success
+
+    response = await client.post(
+        url=f"/questions/{question_id}/answers/",
+        json={"user_id": str(uuid.uuid4()), "text": AnswerFactory.build().text},
+    )
+    if response.is_success:
+        created_answer_ids.append(response.json()["id"])
+
+    return "POST /questions/{id}/answers/", response.is_success
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    question_ids: list[int],
+    rps: float,
+    duration: float,
+    seed: int,
+) -> Results:
+    """Drive an open-loop request mix at a fixed rate.
+
+    Latency is measured from each request's scheduled start, so a slow server
+    cannot hide queueing delay by slowing down the generator.
+
+    Args:
+        client: The HTTP client.
+        question_ids: The seeded question IDs.
+        rps: The target requests per second.
+        duration: The test duration in seconds.
+        seed: The random seed for the request mix.
+
+    Returns:
+        The latency percentiles, throughput and errors per route.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    loop = asyncio.get_running_loop()
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    created_answer_ids: deque[int] = deque()
+    pending: set[asyncio.Task] = set()
+
+    async def timed(scenario: str, scheduled: float) -> None:
+        try:
+            route, ok = await send(
+                client=client,
+                scenario=scenario,
+                question_ids=question_ids,
+                created_answer_ids=created_answer_ids,
+                rng=rng,
+            )
+        except httpx.HTTPError:
+            route, ok = scenario, False
+
+        latencies[route].append(loop.time() - scheduled)
+        if not ok:
+            errors[route] += 1
+
+    started = loop.time()
+    for index in range(int(rps * duration)):
+        scheduled = started + index / rps
+        await asyncio.sleep(max(0.0, scheduled - loop.time()))
+
+        scenario = rng.choices(list(SCENARIOS), weights=list(SCENARIOS.values()))[0]
+        task = loop.create_task(timed(scenario=scenario, scheduled=scheduled))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    await asyncio.gather(*pending)
+    elapsed = loop.time() - started
+
+    return {
+        route: {
+            **summarize(latencies=values),
+            "throughput_rps": len(values) / elapsed,
+            "errors": errors[route],
+        }
+        for route, values in sorted(latencies.items())
+    }
+
+
+def render(results: Results) -> str:
+    """Render results as a text table.
+
+    Args:
+        results: The results per route.
+
+    Returns:
+        The table.
+
+    """
+    header = f"{'route':<32} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'rps':>8}"
+    lines = [f"{header} {'errors':>7}"]
+    lines.extend(
+        f"{route:<32} {metrics['p50_ms']:>9.2f} {metrics['p95_ms']:>9.2f} "
+        f"{metrics['p99_ms']:>9.2f} {metrics['throughput_rps']:>8.1f} "
+        f"{int(metrics['errors']):>7}"
+        for route, metrics in results.items()
+    )
+
+    return "\n".join(lines) + "\n"
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run the load test.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        The exit code, non-zero when a regression was found.
+
+    """
+    with postgres() as url:
+        question_ids = await seed(
+            url=url,
+            questions=args.questions,
+            answers_per_question=args.answers_per_question,
+        )
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        server = start_server(url=url, port=port, workers=args.workers)
+        try:
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{port}",
+                limits=httpx.Limits(max_connections=args.max_connections),
+                timeout=args.timeout,
+            ) as client:
+                await wait_until_ready(client=client)
+                results = await run_load(
+                    client=client,
+                    question_ids=question_ids,
+                    rps=args.rps,
+                    duration=args.duration,
+                    seed=args.seed,
+                )
+        finally:
+            server.terminate()
+            server.wait()
+
+    return report(
+        results=results,
+        table=render(results=results),
+        args=args,
+        higher_is_better=("throughput_rps",),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rps", type=float, default=100)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--questions", type=int, default=100)
+    parser.add_argument("--answers-per-question", type=int, default=20)
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Baseline JSON to compare against, created if it does not exist",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression per metric",
+    )
+    sys.exit(asyncio.run(main(args=parser.parse_args())))
@@ -0,0 +1,438 @@
+"""Layered microbenchmarks for repositories, schemas and response serialization.
+
+Usage:
+    python -m bench.micro --answers 10,1000,100000 --baseline bench/results/micro.json
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy import insert
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from api.schemas import QuestionWithAnswersResponseSchema
+from bench.common import (
+    Results,
+    percentile,
+    postgres,
+    report,
+)
+from db.models import Answer, Base, Question
+from db.repositories import QuestionRepository
+from main import app
+from tests.factories import AnswerFactory, QuestionFactory
+
+LAYERS = ("repository", "schema", "router")
+
+
+def rounds(size: int, repeat: int) -> int:
+    """Scale the number of timed rounds down for large inputs.
+
+    Args:
+        size: The number of rows the case handles.
+        repeat: The requested number of rounds.
+
+    Returns:
+        The number of rounds to run.
+
+    """
+    return max(3, min(repeat, 100_000 // max(size, 1)))
+
+
+def measure(timings: list[float]) -> dict[str, float]:
+    """Summarize timings in milliseconds.
+
+    Args:
+        timings: The timings in seconds.
+
+    Returns:
+        The minimum, median and p95 in milliseconds.
+
+    """
+    timings = sorted(timings)
+
+    return {
+        "min_ms": timings[0] * 1000,
+        "median_ms": statistics.median(timings) * 1000,
+        "p95_ms": percentile(values=timings, fraction=0.95) * 1000,
+    }
+
+
+async def time_async(
+    operation: Callable[[int], Awaitable[Any]], repeat: int, warmup: int = 2
+) -> dict[str, float]:
+    """Time an async operation.
+
+    Args:
+        operation: The operation, called with the round number.
+        repeat: The number of timed rounds.
+        warmup: The number of untimed rounds run first.
+
+    Returns:
+        The timing summary.
+
+    """
+    timings = []
+
+    for index in range(warmup + repeat):
+        started = time.perf_counter()
+        await operation(index)
+        if index >= warmup:
+            timings.append(time.perf_counter() - started)
+
+    return measure(timings=timings)
+
+
+def time_sync(
+    operation: Callable[[], Any], repeat: int, warmup: int = 2
+) -> dict[str, float]:
+    """Time a sync operation.
+
+    Args:
+        operation: The operation.
+        repeat: The number of timed rounds.
+        warmup: The number of untimed rounds run first.
+
+    Returns:
+        The timing summary.
+
+    """
+    timings = []
+
+    for index in range(warmup + repeat):
+        started = time.perf_counter()
+        operation()
+        if index >= warmup:
+            timings.append(time.perf_counter() - started)
+
+    return measure(timings=timings)
+
+
+def build_question_graph(answers: int) -> Question:
+    """Build an in-memory question with answers, as the ORM would load it.
+
+    Args:
+        answers: The number of answers.
+
+    Returns:
+        The question.
+
+    """
+    now = datetime.now()
+    question = Question(id=1, text=QuestionFactory.build().text, created_at=now)
+    question.answers = [
+        Answer(
+            id=index + 1,
+            question_id=1,
+            user_id=uuid.uuid4(),
+            text=AnswerFactory.build().text,
+            created_at=now,
+        )
+        for index in range(answers)
+    ]
+
+    return question
+
+
+async def seed_question(session: AsyncSession, answers: int) -> int:
+    """Insert a question with answers in bulk.
+
+    Args:
+        session: The session.
+        answers: The number of answers.
+
+    Returns:
+        The question ID.
+
+    """
+    question_id = (
+        await session.execute(
+            insert(Question).returning(Question.id),
+            [{"text": QuestionFactory.build().text}],
+        )
+    ).scalar_one()
+    texts = [AnswerFactory.build().text for _ in range(min(answers, 1000))]
+
+    await session.execute(
+        insert(Answer),
+        [
+            {
+                "question_id": question_id,
+                "user_id": uuid.uuid4(),
+                "text": texts[index % len(texts)],
+            }
+            for index in range(answers)
+        ],
+    )
+    await session.commit()
+
+    return question_id
+
+
+async def bench_repositories(url: URL, sizes: list[int], repeat: int) -> Results:
+    """Benchmark the repository layer against Postgres.
+
+    Args:
+        url: The database URL.
+        sizes: The answer counts for ``get_with_answers``.
+        repeat: The number of timed rounds.
+
+    Returns:
+        The results per case.
+
+    """
+    engine = create_async_engine(url=url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+    repository = QuestionRepository()
+    results: Results = {}
+
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        created: list[int] = []
+
+        async def create(index: int) -> None:
+            question = await repository.create(
+                session=session, data={"text": f"Benchmark question {index}"}
+            )
+            created.append(question.id)
+            session.expunge_all()
+
+        async def get_by(index: int) -> None:
+            await repository.get_by(session=session, id=created[index % len(created)])
+            session.expunge_all()
+
+        async def get_all(index: int) -> None:
+            await repository.get_all(session=session)
+            session.expunge_all()
+
+        async def delete_by(index: int) -> None:
+            await repository.delete_by(session=session, id=created.pop())
+            session.expunge_all()
+
+        results["repository.create"] = await time_async(create, repeat=repeat * 2)
+        results["repository.get_by"] = await time_async(get_by, repeat=repeat)
+        results["repository.get_all"] = await time_async(get_all, repeat=repeat)
+        results["repository.delete_by"] = await time_async(delete_by, repeat=repeat)
+
+        for size in sizes:
+            question_id = await seed_question(session=session, answers=size)
+
+            results.update(
+                await bench_read_paths(
+                    session=session,
+                    question_id=question_id,
+                    size=size,
+                    repeat=rounds(size=size, repeat=repeat),
+                )
+            )
+
+    await engine.dispose()
+
+    return results
+
+
+async def bench_read_paths(
+    session: AsyncSession, question_id: int, size: int, repeat: int
+) -> Results:
+    """Benchmark reading a question with answers through the ORM and as rows.
+
+    Each path is timed alone and followed by validation into
+    ``QuestionWithAnswersResponseSchema``, as the ``GET /questions/{id}``
+    route would do.
+
+    Args:
+        session: The session.
+        question_id: The ID of a seeded question.
+        size: The number of answers of the question.
+        repeat: The number of timed rounds.
+
+    Returns:
+        The results per case.
+
+    """
+    repository = QuestionRepository()
+
+    async def get_with_answers(index: int) -> Question | None:
+        question = await repository.get_with_answers(session=session, id=question_id)
+        session.expunge_all()
+        return question
+
+    async def get_rows_with_answers(index: int) -> dict[str, Any]:
+        question, answers = await repository.get_rows_with_answers(
+            session=session, id=question_id
+        )
+        return {**(question._mapping if question else {}), "answers": answers}
+
+    async def read_orm(index: int) -> None:
+        QuestionWithAnswersResponseSchema.model_validate(
+            await get_with_answers(index=index)
+        )
+
+    async def read_core(index: int) -> None:
+        QuestionWithAnswersResponseSchema.model_validate(
+            await get_rows_with_answers(index=index)
+        )
+
+    cases = {
+        "repository.get_with_answers": get_with_answers,
+        "repository.get_rows_with_answers": get_rows_with_answers,
+        "read.orm": read_orm,
+        "read.core": read_core,
+    }
+
+    return {
+        f"{case}[{size}]": await time_async(operation, repeat=repeat)
+        for case, operation in cases.items()
+    }
+
+
+def bench_schemas(sizes: list[int], repeat: int) -> Results:
+    """Benchmark validating ORM graphs into response schemas.
+
+    Args:
+        sizes: The answer counts.
+        repeat: The number of timed rounds.
+
+    Returns:
+        The results per case.
+
+    """
+    results: Results = {}
+
+    for size in sizes:
+        question = build_question_graph(answers=size)
+        results[f"schema.model_validate[{size}]"] = time_sync(
+            lambda question=question: QuestionWithAnswersResponseSchema.model_validate(
+                question
+            ),
+            repeat=rounds(size=size, repeat=repeat),
+        )
+
+    return results
+
+
+def bench_router(sizes: list[int], repeat: int) -> Results:
+    """Benchmark what the router does with a returned schema.
+
+    Covers FastAPI's response-model validation and encoding for the
+    ``GET /questions/{id}`` route plus rendering the JSON body.
+
+    Args:
+        sizes: The answer counts.
+        repeat: The number of timed rounds.
+
+    Returns:
+        The results per case.
+
+    """
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path == "/questions/{id}"
+        and "GET" in route.methods
+    )
+    results: Results = {}
+
+    for size in sizes:
+        schema = QuestionWithAnswersResponseSchema.model_validate(
+            build_question_graph(answers=size)
+        )
+
+        async def serialize(index: int, schema=schema) -> None:
+            JSONResponse(
+                content=await serialize_response(
+                    field=route.response_field, response_content=schema
+                )
+            )
+
+        results[f"router.serialize[{size}]"] = asyncio.run(
+            time_async(serialize, repeat=rounds(size=size, repeat=repeat))
+        )
+
+    return results
+
+
+def render(results: Results) -> str:
+    """Render results as a text table.
+
+    Args:
+        results: The results per case.
+
+    Returns:
+        The table.
+
+    """
+    lines = [f"{'case':<44} {'min ms':>10} {'median ms':>10} {'p95 ms':>10}"]
+    lines.extend(
+        f"{case:<44} {metrics['min_ms']:>10.3f} {metrics['median_ms']:>10.3f} "
+        f"{metrics['p95_ms']:>10.3f}"
+        for case, metrics in results.items()
+    )
+
+    return "\n".join(lines) + "\n"
+
+
+def main(args: argparse.Namespace) -> int:
+    """Run the selected benchmark layers.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        The exit code, non-zero when a regression was found.
+
+    """
+    layers = args.layers.split(",")
+    sizes = [int(size) for size in args.answers.split(",")]
+    results: Results = {}
+
+    if "repository" in layers:
+        with postgres() as url:
+            results.update(
+                asyncio.run(
+                    bench_repositories(url=url, sizes=sizes, repeat=args.repeat)
+                )
+            )
+    if "schema" in layers:
+        results.update(bench_schemas(sizes=sizes, repeat=args.repeat))
+    if "router" in layers:
+        results.update(bench_router(sizes=sizes, repeat=args.repeat))
+
+    return report(
+        results=results,
+        table=render(results=results),
+        args=args,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layers", default=",".join(LAYERS))
+    parser.add_argument("--answers", default="10,1000,100000")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Baseline JSON to compare against, created if it does not exist",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown per case",
+    )
+    sys.exit(main(args=parser.parse_args()))
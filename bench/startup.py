@@ -0,0 +1,175 @@
+"""Startup-time report: how long a fresh worker process takes to get the app ready.
+
+Usage:
+    python -m bench.startup --repeat 10 --top 15 --baseline bench/results/startup.json
+"""
+
+import argparse
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from bench.common import Results, report, summarize
+
+# Runs in a fresh interpreter, so every phase pays its import cost in full.
+PROBE = """
+import json, time
+
+started = time.perf_counter()
+phases = {}
+
+def mark(phase):
+    global started
+    now = time.perf_counter()
+    phases[phase] = now - started
+    started = now
+
+import asyncpg, fastapi, httptools, prometheus_client, pydantic, sqlalchemy
+import uvicorn, uvloop
+mark("import.third_party")
+import api.routers, db.sessions, jobs, monitoring, settings, usecases
+mark("import.app_modules")
+import main
+mark("app.construction")
+main.app.build_middleware_stack()
+mark("app.middleware_stack")
+main.app.openapi()
+mark("app.openapi")
+
+print(json.dumps(phases))
+"""
+
+PHASES = (
+    "import.third_party",
+    "import.app_modules",
+    "app.construction",
+    "app.middleware_stack",
+    "app.openapi",
+)
+
+
+def probe(importtime: bool = False) -> tuple[dict[str, float], float, str]:
+    """Start the app in a fresh interpreter.
+
+    Args:
+        importtime: Whether to log import times with ``-X importtime``, which
+            slows the imports down.
+
+    Returns:
+        The seconds spent in each phase, the seconds the whole process took
+        and the import time log.
+
+    """
+    started = time.perf_counter()
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", PROBE],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "LOG_LEVEL": "WARNING"},
+    )
+    elapsed = time.perf_counter() - started
+
+    return json.loads(completed.stdout.splitlines()[-1]), elapsed, completed.stderr
+
+
+def slowest_imports(log: str, top: int) -> list[tuple[str, float]]:
+    """Find the modules with the highest own import time.
+
+    Args:
+        log: The ``-X importtime`` log.
+        top: The number of modules.
+
+    Returns:
+        The module names and their own import time in milliseconds.
+
+    """
+    modules = []
+
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        own, _, name = line.removeprefix("import time:").split("|")
+        modules.append((name.strip(), int(own) / 1000))
+
+    return sorted(modules, key=lambda module: module[1], reverse=True)[:top]
+
+
+def render(results: Results, imports: list[tuple[str, float]]) -> str:
+    """Render results as a text table, followed by the slowest imports.
+
+    Args:
+        results: The results per phase.
+        imports: The slowest modules and their own import time.
+
+    Returns:
+        The table.
+
+    """
+    lines = [f"{'phase':<24} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    lines.extend(
+        f"{phase:<24} {metrics['p50_ms']:>9.1f} {metrics['p95_ms']:>9.1f} "
+        f"{metrics['p99_ms']:>9.1f}"
+        for phase, metrics in results.items()
+    )
+    lines.append("")
+    lines.append(f"{'slowest import':<48} {'own ms':>9}")
+    lines.extend(f"{name:<48} {own:>9.1f}" for name, own in imports)
+
+    return "\n".join(lines) + "\n"
+
+
+def main(args: argparse.Namespace) -> int:
+    """Probe the startup repeatedly and report the time of each phase.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        The exit code, non-zero when a regression was found.
+
+    """
+    timings: dict[str, list[float]] = defaultdict(list)
+
+    for _ in range(args.repeat):
+        phases, elapsed, _ = probe()
+
+        for phase in PHASES:
+            timings[phase].append(phases[phase])
+        timings["total.ready"].append(sum(phases.values()))
+        timings["total.process"].append(elapsed)
+
+    results: Results = {
+        phase: summarize(latencies=values) for phase, values in timings.items()
+    }
+    *_, log = probe(importtime=True)
+
+    return report(
+        results=results,
+        table=render(results=results, imports=slowest_imports(log=log, top=args.top)),
+        args=args,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Baseline JSON to compare against, created if it does not exist",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown per phase",
+    )
+    sys.exit(main(args=parser.parse_args()))
@@ -0,0 +1,3 @@
+# Set locally in the transactions that move answers into the archive, so the
+# answer delete trigger leaves the answer stats of their questions alone.
+ARCHIVING_SETTING = "app.archiving"
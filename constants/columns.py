@@ -0,0 +1,11 @@
+QUESTION_COLUMNS = ("id", "text", "created_at", "answer_count", "last_answer_at")
+ANSWER_COLUMNS = ("id", "user_id", "question_id", "text", "created_at")
+
+# Questions are sorted by the indexed answer stats folded into their rows, which
+# lag the exact values until the counter shards are compacted.
+QUESTION_SORT_COLUMNS = {
+    "id": "id",
+    "created_at": "created_at",
+    "answer_count": "folded_answer_count",
+    "last_answer_at": "folded_last_answer_at",
+}
@@ -0,0 +1 @@
+ANSWER_COUNTER_SLOTS = 16
@@ -0,0 +1,20 @@
+from typing import Literal
+
+ExportFormat = Literal["csv", "ndjson", "parquet"]
+
+EXPORT_COLUMNS = (
+    "question_id",
+    "question_text",
+    "question_created_at",
+    "answer_id",
+    "answer_user_id",
+    "answer_text",
+    "answer_created_at",
+)
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+EXPORT_BATCH_SIZE = 1000
+EXPORT_PARQUET_ROW_GROUP_SIZE = 64_000
@@ -0,0 +1 @@
+ANSWERS_CHANNEL = "answers"
@@ -0,0 +1,5 @@
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+DEFAULT_FEED_SIZE = 100
+MAX_FEED_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
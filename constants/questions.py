@@ -0,0 +1,3 @@
+from typing import Literal
+
+DuplicatePolicy = Literal["reject", "return-existing", "allow"]
@@ -0,0 +1,4 @@
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_EXPRESSION = f"to_tsvector('{SEARCH_CONFIG}', text)"
+SEARCH_KINDS = ("answer", "question")
+MAX_SEARCH_QUERY_LENGTH = 256
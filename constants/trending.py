@@ -0,0 +1,6 @@
+from datetime import datetime
+
+# Scores are stored as the log of answer weights relative to this fixed epoch,
+# so they never need to be decayed in place.
+TRENDING_EPOCH = datetime(2025, 1, 1)
+TRENDING_CURSOR = "trending"
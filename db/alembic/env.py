@@ -63,14 +63,16 @@ async def run_migrations_online() -> None:
 
     In this scenario we need to create an Engine
     and associate a connection with the context.
+    Every shard is migrated in turn.
 
     """
-    connectable = create_async_engine(url=db_settings.url)
+    for url in (db_settings.url, *db_settings.shard_urls):
+        connectable = create_async_engine(url=url)
 
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
+        async with connectable.connect() as connection:
+            await connection.run_sync(do_run_migrations)
 
-    await connectable.dispose()
+        await connectable.dispose()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,174 @@
+"""Add question answer counter shards
+
+Revision ID: 5a0d83e6f2c7
+Revises: c5f7e2b94d13
+Create Date: 2026-10-19 13:40:52.771930
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a0d83e6f2c7"
+down_revision: Union[str, None] = "c5f7e2b94d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INSERT_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_after_insert() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO question_answer_counter_shards AS shards
+            (question_id, slot, answer_count, last_answer_at)
+        SELECT
+            question_id,
+            floor(random() * 16)::int,
+            count(*),
+            max(created_at)
+        FROM new_answers
+        GROUP BY question_id
+        ON CONFLICT (question_id, slot) DO UPDATE
+        SET answer_count = shards.answer_count + excluded.answer_count,
+            last_answer_at = GREATEST(shards.last_answer_at, excluded.last_answer_at);
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+DELETE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_after_delete() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE questions
+        SET answer_count = questions.answer_count - deleted.count,
+            last_answer_at = (
+                SELECT max(answers.created_at)
+                FROM answers
+                WHERE answers.question_id = questions.id
+            )
+        FROM (
+            SELECT question_id, count(*) AS count
+            FROM old_answers
+            GROUP BY question_id
+        ) AS deleted
+        WHERE questions.id = deleted.question_id;
+
+        UPDATE question_answer_counter_shards
+        SET last_answer_at = NULL
+        WHERE question_id IN (SELECT question_id FROM old_answers)
+            AND last_answer_at IS NOT NULL;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+PREVIOUS_INSERT_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_after_insert() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE questions
+        SET answer_count = questions.answer_count + inserted.count,
+            last_answer_at = GREATEST(questions.last_answer_at, inserted.last_answer_at)
+        FROM (
+            SELECT question_id, count(*) AS count, max(created_at) AS last_answer_at
+            FROM new_answers
+            GROUP BY question_id
+        ) AS inserted
+        WHERE questions.id = inserted.question_id;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+PREVIOUS_DELETE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_after_delete() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE questions
+        SET answer_count = questions.answer_count - deleted.count,
+            last_answer_at = CASE
+                WHEN questions.last_answer_at > deleted.last_answer_at
+                    THEN questions.last_answer_at
+                ELSE (
+                    SELECT max(answers.created_at)
+                    FROM answers
+                    WHERE answers.question_id = questions.id
+                )
+            END
+        FROM (
+            SELECT question_id, count(*) AS count, max(created_at) AS last_answer_at
+            FROM old_answers
+            GROUP BY question_id
+        ) AS deleted
+        WHERE questions.id = deleted.question_id;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "question_answer_counter_shards",
+        sa.Column(
+            "question_id", sa.Integer(), nullable=False, comment="The question ID"
+        ),
+        sa.Column("slot", sa.Integer(), nullable=False, comment="The counter slot"),
+        sa.Column(
+            "answer_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Answers counted in this slot since the last compaction",
+        ),
+        sa.Column(
+            "last_answer_at",
+            sa.DateTime(),
+            nullable=True,
+            comment="Created at of the latest answer counted in this slot",
+        ),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("question_id", "slot"),
+    )
+    op.alter_column(
+        "questions",
+        "answer_count",
+        comment="The number of answers folded in from the counter shards",
+    )
+    op.alter_column(
+        "questions",
+        "last_answer_at",
+        comment="Created at of the latest answer folded in from the counter shards",
+    )
+    op.execute(INSERT_FUNCTION)
+    op.execute(DELETE_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_INSERT_FUNCTION)
+    op.execute(PREVIOUS_DELETE_FUNCTION)
+    op.execute("""
+        UPDATE questions
+        SET answer_count = questions.answer_count + shards.answer_count,
+            last_answer_at = GREATEST(questions.last_answer_at, shards.last_answer_at)
+        FROM (
+            SELECT
+                question_id,
+                sum(answer_count) AS answer_count,
+                max(last_answer_at) AS last_answer_at
+            FROM question_answer_counter_shards
+            GROUP BY question_id
+        ) AS shards
+        WHERE questions.id = shards.question_id
+        """)
+    op.alter_column(
+        "questions", "last_answer_at", comment="Created at of the latest answer"
+    )
+    op.alter_column("questions", "answer_count", comment="The number of answers")
+    op.drop_table("question_answer_counter_shards")
@@ -0,0 +1,171 @@
+"""Partition answers by created_at
+
+Revision ID: 7a3c5e9f1b24
+Revises: f2b8c6a41d97
+Create Date: 2026-10-19 23:02:37.518406
+
+The answers are copied into a new table range partitioned by month, so the
+table is locked for the duration of the copy. On large databases run it in a
+maintenance window, or pre-create the partitions and copy ahead of time.
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3c5e9f1b24"
+down_revision: Union[str, None] = "f2b8c6a41d97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_answers_user_id_created_at_id", ["user_id", sa.text("created_at DESC"), "id"]),
+    ("ix_answers_created_at_id", ["created_at", "id"]),
+    ("ix_answers_question_id_created_at", ["question_id", "created_at"]),
+)
+
+COLUMNS = "id, user_id, question_id, text, created_at"
+
+INSERT_TRIGGER = """
+    CREATE TRIGGER answers_after_insert
+    AFTER INSERT ON answers
+    REFERENCING NEW TABLE AS new_answers
+    FOR EACH STATEMENT EXECUTE FUNCTION answers_after_insert()
+"""
+
+DELETE_TRIGGER = """
+    CREATE TRIGGER answers_after_delete
+    AFTER DELETE ON answers
+    REFERENCING OLD TABLE AS old_answers
+    FOR EACH STATEMENT EXECUTE FUNCTION answers_after_delete()
+"""
+
+# One partition per month from the oldest answer to three months from now, and
+# a default partition for anything outside of them.
+CREATE_PARTITIONS = """
+    DO $$
+    DECLARE
+        month date;
+    BEGIN
+        FOR month IN
+            SELECT generate_series(
+                date_trunc(
+                    'month',
+                    coalesce((SELECT min(created_at) FROM answers_old), now())
+                ),
+                date_trunc('month', now()) + interval '3 months',
+                interval '1 month'
+            )::date
+        LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF answers FOR VALUES FROM (%L) TO (%L)',
+                'answers_p' || to_char(month, 'YYYY_MM'),
+                month,
+                month + interval '1 month'
+            );
+        END LOOP;
+    END;
+    $$
+"""
+
+
+def detach_old_table() -> None:
+    """Rename the answers table out of the way and free its names."""
+    op.rename_table("answers", "answers_old")
+    op.execute("ALTER SEQUENCE answers_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE answers_old DROP CONSTRAINT answers_pkey")
+    op.execute("ALTER TABLE answers_old DROP CONSTRAINT answers_question_id_fkey")
+
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name="answers_old")
+    op.drop_index("ix_answers_search_vector", table_name="answers_old")
+
+
+def create_table(primary_key: list[str], **kwargs) -> None:
+    """Create the answers table taking its IDs from the existing sequence.
+
+    Args:
+        primary_key: The primary key columns.
+        **kwargs: Extra table options.
+
+    """
+    op.create_table(
+        "answers",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('answers_id_seq'::regclass)"),
+            nullable=False,
+            comment="ID",
+        ),
+        sa.Column("user_id", sa.Uuid(), nullable=False, comment="The user ID"),
+        sa.Column(
+            "question_id", sa.Integer(), nullable=False, comment="The question ID"
+        ),
+        sa.Column("text", sa.String(length=2048), nullable=False, comment="The text"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Created at",
+        ),
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english', text)", persisted=True),
+            nullable=True,
+            comment="The full-text search vector of the text",
+        ),
+        sa.ForeignKeyConstraint(
+            ["question_id"],
+            ["questions.id"],
+            name="answers_question_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(*primary_key, name="answers_pkey"),
+        **kwargs,
+    )
+
+
+def fill_table() -> None:
+    """Copy the answers over, then index them and restore the counter triggers."""
+    op.execute(
+        f"INSERT INTO answers ({COLUMNS}) SELECT {COLUMNS} FROM answers_old"  # noqa: S608
+    )
+    op.drop_table("answers_old")
+    op.execute("ALTER SEQUENCE answers_id_seq OWNED BY answers.id")
+
+    for name, columns in INDEXES:
+        op.create_index(name, "answers", columns, unique=False)
+    op.create_index(
+        "ix_answers_search_vector",
+        "answers",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    op.execute(INSERT_TRIGGER)
+    op.execute(DELETE_TRIGGER)
+
+
+def upgrade() -> None:
+    detach_old_table()
+    create_table(
+        primary_key=["id", "created_at"],
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute(CREATE_PARTITIONS)
+    op.execute("CREATE TABLE answers_default PARTITION OF answers DEFAULT")
+    fill_table()
+
+
+def downgrade() -> None:
+    detach_old_table()
+    create_table(primary_key=["id"])
+    fill_table()
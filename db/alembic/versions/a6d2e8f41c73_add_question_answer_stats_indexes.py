@@ -0,0 +1,41 @@
+"""Add question answer stats indexes
+
+Revision ID: a6d2e8f41c73
+Revises: 7a3c5e9f1b24
+Create Date: 2026-10-20 09:12:44.203517
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d2e8f41c73"
+down_revision: Union[str, None] = "7a3c5e9f1b24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_questions_answer_count_id", ["answer_count", "id"]),
+    (
+        "ix_questions_answer_count_desc_id",
+        [sa.text("answer_count DESC NULLS LAST"), "id"],
+    ),
+    ("ix_questions_last_answer_at_id", ["last_answer_at", "id"]),
+    (
+        "ix_questions_last_answer_at_desc_id",
+        [sa.text("last_answer_at DESC NULLS LAST"), "id"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES:
+        op.create_index(name, "questions", columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="questions")
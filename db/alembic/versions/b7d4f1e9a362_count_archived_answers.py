@@ -0,0 +1,125 @@
+"""Count archived answers
+
+Revision ID: b7d4f1e9a362
+Revises: e4b9c2f7a815
+Create Date: 2026-10-21 09:14:52.607381
+
+Moving answers into the archive no longer lowers the answer stats of their
+questions. The answers archived so far were subtracted, so they are added back.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d4f1e9a362"
+down_revision: Union[str, None] = "e4b9c2f7a815"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DELETE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_after_delete() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF current_setting('app.archiving', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+
+        UPDATE questions
+        SET answer_count = questions.answer_count - deleted.count,
+            last_answer_at = GREATEST(
+                (
+                    SELECT max(answers.created_at)
+                    FROM answers
+                    WHERE answers.question_id = questions.id
+                ),
+                (
+                    SELECT max(answers_archive.created_at)
+                    FROM answers_archive
+                    WHERE answers_archive.question_id = questions.id
+                )
+            )
+        FROM (
+            SELECT question_id, count(*) AS count
+            FROM old_answers
+            GROUP BY question_id
+        ) AS deleted
+        WHERE questions.id = deleted.question_id;
+
+        UPDATE question_answer_counter_shards
+        SET last_answer_at = NULL
+        WHERE question_id IN (SELECT question_id FROM old_answers)
+            AND last_answer_at IS NOT NULL;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+PREVIOUS_DELETE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_after_delete() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE questions
+        SET answer_count = questions.answer_count - deleted.count,
+            last_answer_at = (
+                SELECT max(answers.created_at)
+                FROM answers
+                WHERE answers.question_id = questions.id
+            )
+        FROM (
+            SELECT question_id, count(*) AS count
+            FROM old_answers
+            GROUP BY question_id
+        ) AS deleted
+        WHERE questions.id = deleted.question_id;
+
+        UPDATE question_answer_counter_shards
+        SET last_answer_at = NULL
+        WHERE question_id IN (SELECT question_id FROM old_answers)
+            AND last_answer_at IS NOT NULL;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+ADD_ARCHIVED = """
+    UPDATE questions
+    SET answer_count = questions.answer_count + archived.count,
+        last_answer_at = GREATEST(questions.last_answer_at, archived.last_answer_at)
+    FROM (
+        SELECT question_id, count(*) AS count, max(created_at) AS last_answer_at
+        FROM answers_archive
+        GROUP BY question_id
+    ) AS archived
+    WHERE questions.id = archived.question_id
+"""
+
+SUBTRACT_ARCHIVED = """
+    UPDATE questions
+    SET answer_count = questions.answer_count - archived.count,
+        last_answer_at = (
+            SELECT max(answers.created_at)
+            FROM answers
+            WHERE answers.question_id = questions.id
+        )
+    FROM (
+        SELECT question_id, count(*) AS count
+        FROM answers_archive
+        GROUP BY question_id
+    ) AS archived
+    WHERE questions.id = archived.question_id
+"""
+
+
+def upgrade() -> None:
+    op.execute(DELETE_FUNCTION)
+    op.execute(ADD_ARCHIVED)
+
+
+def downgrade() -> None:
+    op.execute(SUBTRACT_ARCHIVED)
+    op.execute(PREVIOUS_DELETE_FUNCTION)
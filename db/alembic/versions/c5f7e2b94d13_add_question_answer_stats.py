@@ -0,0 +1,135 @@
+"""Add question answer stats
+
+Revision ID: c5f7e2b94d13
+Revises: 8e4c1a7d5b20
+Create Date: 2026-10-19 12:21:09.304716
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5f7e2b94d13"
+down_revision: Union[str, None] = "8e4c1a7d5b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INSERT_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_after_insert() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE questions
+        SET answer_count = questions.answer_count + inserted.count,
+            last_answer_at = GREATEST(questions.last_answer_at, inserted.last_answer_at)
+        FROM (
+            SELECT question_id, count(*) AS count, max(created_at) AS last_answer_at
+            FROM new_answers
+            GROUP BY question_id
+        ) AS inserted
+        WHERE questions.id = inserted.question_id;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+DELETE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_after_delete() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE questions
+        SET answer_count = questions.answer_count - deleted.count,
+            last_answer_at = CASE
+                WHEN questions.last_answer_at > deleted.last_answer_at
+                    THEN questions.last_answer_at
+                ELSE (
+                    SELECT max(answers.created_at)
+                    FROM answers
+                    WHERE answers.question_id = questions.id
+                )
+            END
+        FROM (
+            SELECT question_id, count(*) AS count, max(created_at) AS last_answer_at
+            FROM old_answers
+            GROUP BY question_id
+        ) AS deleted
+        WHERE questions.id = deleted.question_id;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+INSERT_TRIGGER = """
+    CREATE TRIGGER answers_after_insert
+    AFTER INSERT ON answers
+    REFERENCING NEW TABLE AS new_answers
+    FOR EACH STATEMENT EXECUTE FUNCTION answers_after_insert()
+"""
+
+DELETE_TRIGGER = """
+    CREATE TRIGGER answers_after_delete
+    AFTER DELETE ON answers
+    REFERENCING OLD TABLE AS old_answers
+    FOR EACH STATEMENT EXECUTE FUNCTION answers_after_delete()
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "questions",
+        sa.Column(
+            "answer_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="The number of answers",
+        ),
+    )
+    op.add_column(
+        "questions",
+        sa.Column(
+            "last_answer_at",
+            sa.DateTime(),
+            nullable=True,
+            comment="Created at of the latest answer",
+        ),
+    )
+    op.create_index(
+        "ix_answers_question_id_created_at",
+        "answers",
+        ["question_id", "created_at"],
+        unique=False,
+    )
+
+    for statement in (
+        INSERT_FUNCTION,
+        DELETE_FUNCTION,
+        INSERT_TRIGGER,
+        DELETE_TRIGGER,
+    ):
+        op.execute(statement)
+
+    op.execute("""
+        UPDATE questions
+        SET answer_count = stats.count, last_answer_at = stats.last_answer_at
+        FROM (
+            SELECT question_id, count(*) AS count, max(created_at) AS last_answer_at
+            FROM answers
+            GROUP BY question_id
+        ) AS stats
+        WHERE questions.id = stats.question_id
+        """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER answers_after_delete ON answers")
+    op.execute("DROP TRIGGER answers_after_insert ON answers")
+    op.execute("DROP FUNCTION answers_after_delete()")
+    op.execute("DROP FUNCTION answers_after_insert()")
+    op.drop_index("ix_answers_question_id_created_at", table_name="answers")
+    op.drop_column("questions", "last_answer_at")
+    op.drop_column("questions", "answer_count")
@@ -0,0 +1,49 @@
+"""Add answers notify trigger
+
+Revision ID: c8f1a3d6e590
+Revises: a6d2e8f41c73
+Create Date: 2026-10-20 10:03:18.640251
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8f1a3d6e590"
+down_revision: Union[str, None] = "a6d2e8f41c73"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOTIFY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_notify() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM pg_notify(
+            'answers',
+            json_build_object('id', id, 'question_id', question_id)::text
+        )
+        FROM new_answers;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+NOTIFY_TRIGGER = """
+    CREATE TRIGGER answers_notify
+    AFTER INSERT ON answers
+    REFERENCING NEW TABLE AS new_answers
+    FOR EACH STATEMENT EXECUTE FUNCTION answers_notify()
+"""
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTION)
+    op.execute(NOTIFY_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER answers_notify ON answers")
+    op.execute("DROP FUNCTION answers_notify()")
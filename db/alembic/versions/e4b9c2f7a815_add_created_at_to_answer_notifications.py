@@ -0,0 +1,57 @@
+"""Add created_at to answer notifications
+
+Revision ID: e4b9c2f7a815
+Revises: c8f1a3d6e590
+Create Date: 2026-10-20 11:27:05.318904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b9c2f7a815"
+down_revision: Union[str, None] = "c8f1a3d6e590"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOTIFY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_notify() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM pg_notify(
+            'answers',
+            json_build_object(
+                'id', id, 'question_id', question_id, 'created_at', created_at
+            )::text
+        )
+        FROM new_answers;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+PREVIOUS_NOTIFY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION answers_notify() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM pg_notify(
+            'answers',
+            json_build_object('id', id, 'question_id', question_id)::text
+        )
+        FROM new_answers;
+
+        RETURN NULL;
+    END;
+    $$
+"""
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_NOTIFY_FUNCTION)
@@ -0,0 +1,213 @@
+import asyncio
+import random
+import re
+import sys
+import time
+from types import FrameType
+from typing import Any
+
+from greenlet import getcurrent
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from monitoring.metrics import DB_COMPILED_CACHE
+from settings import get_logger
+
+logger = get_logger(__name__)
+
+REPOSITORIES_MODULE = "db.repositories"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(
+    r"\(\s*(?:\$\d+|%\(\w+\)s|\?)(?:::\w+(?:\[\])?)?"
+    r"(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?)(?:::\w+(?:\[\])?)?)+\s*\)"
+)
+
+_pending_explains: set[asyncio.Task] = set()
+
+
+def normalize_sql(statement: str) -> str:
+    """Normalize a SQL statement so that similar statements group together.
+
+    Args:
+        statement: The SQL statement.
+
+    Returns:
+        The statement with literals and placeholder lists collapsed.
+
+    """
+    statement = _STRING_LITERAL_RE.sub("?", statement)
+    statement = _NUMBER_LITERAL_RE.sub("?", statement)
+    statement = _PLACEHOLDER_LIST_RE.sub("(...)", statement)
+    return _WHITESPACE_RE.sub(" ", statement).strip()
+
+
+def parameters_shape(parameters: Any, executemany: bool = False) -> str:
+    """Describe the shape of statement parameters without their values.
+
+    Args:
+        parameters: The DBAPI parameters.
+        executemany: Whether the parameters are a batch.
+
+    Returns:
+        The parameter types, e.g. ``(int, str)`` or ``100 x (int, str)``.
+
+    """
+    if executemany:
+        batch = list(parameters)
+        if not batch:
+            return "0 x ()"
+        return f"{len(batch)} x {parameters_shape(parameters=batch[0])}"
+
+    if isinstance(parameters, dict):
+        types = ", ".join(
+            f"{key}: {type(value).__name__}" for key, value in parameters.items()
+        )
+        return f"{{{types}}}"
+
+    if isinstance(parameters, (list, tuple)):
+        return f"({', '.join(type(value).__name__ for value in parameters)})"
+
+    return type(parameters).__name__
+
+
+def _repository_method(frame: FrameType | None) -> str | None:
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(REPOSITORIES_MODULE):
+            owner = frame.f_locals.get("self")
+            if owner is None:
+                return frame.f_code.co_qualname
+            return f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+
+    return None
+
+
+def find_repository_caller() -> str:
+    """Find the repository method that issued the current statement.
+
+    The async engine runs cursor execution in a greenlet spawned from the awaiting
+    coroutine, so the coroutine frames live on the parent greenlet's stack.
+
+    Returns:
+        The ``Repository.method`` name, or ``"unknown"``.
+
+    """
+    caller = _repository_method(frame=sys._getframe(1))
+
+    current = getcurrent()
+    while caller is None and current.parent is not None:
+        current = current.parent
+        caller = _repository_method(frame=current.gr_frame)
+
+    return caller or "unknown"
+
+
+async def _explain(
+    engine: AsyncEngine, statement: str, parameters: Any, caller: str
+) -> None:
+    try:
+        async with engine.connect() as connection:
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+            )
+            plan = "\n".join(str(row[0]) for row in result)
+            await connection.rollback()
+    except Exception:
+        logger.exception("❌ Failed to capture plan for slow query in %s", caller)
+        return
+
+    logger.warning("🔍 Plan for slow query in %s:\n%s", caller, plan)
+
+
+def install_slow_query_log(
+    engine: AsyncEngine, threshold_ms: float, explain_sample_rate: float = 0.0
+) -> None:
+    """Log statements slower than a threshold and sample their plans.
+
+    Sampled ``SELECT`` statements are re-run with ``EXPLAIN (ANALYZE, BUFFERS)`` in
+    a background task on a dedicated, unpooled connection, so request connections
+    are never held for plan capture.
+
+    Args:
+        engine: The async engine to instrument.
+        threshold_ms: The minimum elapsed time to log, in milliseconds.
+        explain_sample_rate: The fraction of slow ``SELECT`` statements to explain.
+
+    """
+    explain_engine = create_async_engine(url=engine.url, poolclass=NullPool)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute", named=True)
+    def before_cursor_execute(conn: Connection, **kwargs: Any) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(context: ExceptionContext) -> None:
+        if context.connection is not None and context.connection.info.get(
+            "query_start_time"
+        ):
+            context.connection.info["query_start_time"].pop()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute", named=True)
+    def after_cursor_execute(
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        **kwargs: Any,
+    ) -> None:
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+
+        if elapsed_ms < threshold_ms or statement.lstrip().upper().startswith(
+            "EXPLAIN"
+        ):
+            return
+
+        caller = find_repository_caller()
+
+        logger.warning(
+            "🐢 Slow query in %s took %.1f ms: %s | params: %s",
+            caller,
+            elapsed_ms,
+            normalize_sql(statement=statement),
+            parameters_shape(parameters=parameters, executemany=executemany),
+        )
+
+        if (
+            executemany
+            or not statement.lstrip().upper().startswith("SELECT")
+            or random.random() >= explain_sample_rate  # noqa: S311
+        ):
+            return
+
+        task = asyncio.get_running_loop().create_task(
+            _explain(
+                engine=explain_engine,
+                statement=statement,
+                parameters=parameters,
+                caller=caller,
+            )
+        )
+        _pending_explains.add(task)
+        task.add_done_callback(_pending_explains.discard)
+
+
+def install_compiled_cache_metrics(engine: AsyncEngine) -> None:
+    """Count executed statements by whether their compiled form was cached.
+
+    The hit rate of SQLAlchemy's compiled cache is the share of the
+    ``cache_hit`` outcome; ``cache_miss`` means the statement was compiled.
+
+    Args:
+        engine: The async engine to instrument.
+
+    """
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute", named=True)
+    def after_cursor_execute(context: DefaultExecutionContext, **kwargs: Any) -> None:
+        DB_COMPILED_CACHE.labels(outcome=context.cache_hit.name.lower()).inc()
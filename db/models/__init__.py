@@ -1,5 +1,19 @@
 from db.models.answer import Answer
+from db.models.archive import AnswerArchive
 from db.models.base import Base
+from db.models.counter import QuestionAnswerCounterShard
+from db.models.idempotency import IdempotencyKey
+from db.models.job import JobCursor
 from db.models.question import Question
+from db.models.trending import QuestionTrending
 
-__all__ = ["Base", "Question", "Answer"]
+__all__ = [
+    "Base",
+    "Question",
+    "Answer",
+    "QuestionAnswerCounterShard",
+    "JobCursor",
+    "QuestionTrending",
+    "IdempotencyKey",
+    "AnswerArchive",
+]
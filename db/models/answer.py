@@ -1,19 +1,22 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, String, func
+from sqlalchemy import Computed, ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from constants.search import SEARCH_VECTOR_EXPRESSION
 from constants.text import DEFAULT_TEXT_LENGTH
 from db.models.base import Base
+from db.models.partitions import attach_default_partition
+from db.models.triggers import ANSWER_TRIGGERS, attach_triggers
 
 
 class Answer(Base):
     __tablename__ = "answers"
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
-    id: Mapped[int] = mapped_column(
-        primary_key=True, autoincrement=True, unique=True, comment="ID"
-    )
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, comment="ID")
 
     user_id: Mapped[uuid.UUID] = mapped_column(nullable=False, comment="The user ID")
     question_id: Mapped[int] = mapped_column(
@@ -27,7 +30,30 @@ class Answer(Base):
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        server_default=func.now(), comment="Created at"
+        primary_key=True,
+        server_default=func.now(),
+        comment="Created at",
+    )
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+        comment="The full-text search vector of the text",
     )
 
     question = relationship("Question", back_populates="answers")
+
+
+Index(
+    "ix_answers_user_id_created_at_id",
+    Answer.user_id,
+    Answer.created_at.desc(),
+    Answer.id,
+)
+Index("ix_answers_created_at_id", Answer.created_at, Answer.id)
+Index("ix_answers_question_id_created_at", Answer.question_id, Answer.created_at)
+Index("ix_answers_search_vector", Answer.search_vector, postgresql_using="gin")
+
+attach_default_partition(table=Answer.__table__)
+attach_triggers(table=Answer.__table__, statements=ANSWER_TRIGGERS)
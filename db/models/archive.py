@@ -0,0 +1,36 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Index, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from constants.text import DEFAULT_TEXT_LENGTH
+from db.models.base import Base
+
+
+class AnswerArchive(Base):
+    __tablename__ = "answers_archive"
+
+    id: Mapped[int] = mapped_column(
+        primary_key=True, autoincrement=False, comment="ID of the archived answer"
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(nullable=False, comment="The user ID")
+    question_id: Mapped[int] = mapped_column(nullable=False, comment="The question ID")
+
+    text: Mapped[str] = mapped_column(
+        String(length=DEFAULT_TEXT_LENGTH), nullable=False, comment="The text"
+    )
+
+    created_at: Mapped[datetime] = mapped_column(comment="Created at")
+    archived_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), comment="Archived at"
+    )
+
+
+Index(
+    "ix_answers_archive_question_id_created_at_id",
+    AnswerArchive.question_id,
+    AnswerArchive.created_at,
+    AnswerArchive.id,
+)
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.models.base import Base
+
+
+class QuestionAnswerCounterShard(Base):
+    __tablename__ = "question_answer_counter_shards"
+
+    question_id: Mapped[int] = mapped_column(
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="The question ID",
+    )
+    slot: Mapped[int] = mapped_column(primary_key=True, comment="The counter slot")
+
+    answer_count: Mapped[int] = mapped_column(
+        default=0, comment="Answers counted in this slot since the last compaction"
+    )
+    last_answer_at: Mapped[datetime | None] = mapped_column(
+        comment="Created at of the latest answer counted in this slot"
+    )
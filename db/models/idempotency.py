@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Index, LargeBinary, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from constants.idempotency import MAX_IDEMPOTENCY_KEY_LENGTH
+from db.models.base import Base
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(
+        String(length=MAX_IDEMPOTENCY_KEY_LENGTH),
+        primary_key=True,
+        comment="The Idempotency-Key header sent by the client",
+    )
+
+    fingerprint: Mapped[bytes] = mapped_column(
+        LargeBinary(length=32), comment="SHA-256 of the request the key was used for"
+    )
+    response: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB, comment="The stored response, null while the request is in progress"
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), comment="Created at"
+    )
+
+
+Index("ix_idempotency_keys_created_at", IdempotencyKey.created_at)
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.models.base import Base
+
+
+class JobCursor(Base):
+    __tablename__ = "job_cursors"
+
+    name: Mapped[str] = mapped_column(
+        String(length=64), primary_key=True, comment="The job name"
+    )
+
+    last_created_at: Mapped[datetime] = mapped_column(
+        comment="Created at of the last processed row"
+    )
+    last_id: Mapped[int] = mapped_column(comment="ID of the last processed row")
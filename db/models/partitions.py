@@ -0,0 +1,118 @@
+from datetime import date
+from typing import Iterator
+
+from sqlalchemy import DDL, Table, event
+
+
+def month_start(day: date) -> date:
+    """Get the first day of the month of a date.
+
+    Args:
+        day: The date.
+
+    Returns:
+        The first day of its month.
+
+    """
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Get the first day of the month some months after another.
+
+    Args:
+        month: The first day of a month.
+        months: The number of months to add.
+
+    Returns:
+        The first day of the resulting month.
+
+    """
+    index = month.year * 12 + month.month - 1 + months
+
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def months_between(first: date, last: date) -> Iterator[date]:
+    """Iterate over the months from one date to another, both included.
+
+    Args:
+        first: A date in the first month.
+        last: A date in the last month.
+
+    Yields:
+        The first day of every month.
+
+    """
+    month = month_start(day=first)
+
+    while month <= last:
+        yield month
+        month = add_months(month=month, months=1)
+
+
+def monthly_partition_name(table: str, month: date) -> str:
+    """Get the name of the partition of a table holding one month.
+
+    Args:
+        table: The partitioned table.
+        month: The first day of the month.
+
+    Returns:
+        The partition name, like ``answers_p2026_10``.
+
+    """
+    return f"{table}_p{month:%Y_%m}"
+
+
+def monthly_partition_ddl(table: str, month: date) -> str:
+    """Build the statement creating the partition of a table for one month.
+
+    Args:
+        table: The table, range partitioned by ``created_at``.
+        month: The first day of the month.
+
+    Returns:
+        The ``CREATE TABLE ... PARTITION OF`` statement.
+
+    """
+    name = monthly_partition_name(table=table, month=month)
+    end = add_months(month=month, months=1)
+
+    return (
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month}') TO ('{end}')"
+    )
+
+
+def default_partition_name(table: str) -> str:
+    """Get the name of the default partition of a table.
+
+    Args:
+        table: The partitioned table.
+
+    Returns:
+        The partition name, like ``answers_default``.
+
+    """
+    return f"{table}_default"
+
+
+def attach_default_partition(table: Table) -> None:
+    """Create a default partition whenever a table is created from the metadata.
+
+    Rows outside of every monthly partition land in it, so inserts never fail
+    before the partition maintenance job has created their month.
+
+    Args:
+        table: The partitioned table.
+
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TABLE {default_partition_name(table.name)} "
+            f"PARTITION OF {table.name} DEFAULT"
+        ),
+    )
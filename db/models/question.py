@@ -1,10 +1,41 @@
+import uuid
 from datetime import datetime
 
-from sqlalchemy import String, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    ColumnElement,
+    Computed,
+    Index,
+    String,
+    cast,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
+from constants.search import SEARCH_VECTOR_EXPRESSION
 from constants.text import DEFAULT_TEXT_LENGTH
 from db.models.base import Base
+from db.models.counter import QuestionAnswerCounterShard
+
+
+def normalized_text_hash(text: ColumnElement[str]) -> ColumnElement[uuid.UUID]:
+    """Hash a text after trimming, collapsing whitespace and lowercasing it.
+
+    Args:
+        text: The text expression.
+
+    Returns:
+        The MD5 hash of the normalized text as a UUID.
+
+    """
+    return cast(
+        func.md5(
+            func.lower(func.btrim(func.regexp_replace(text, "[[:space:]]+", " ", "g")))
+        ),
+        UUID(as_uuid=True),
+    )
 
 
 class Question(Base):
@@ -22,6 +53,81 @@ class Question(Base):
         server_default=func.now(), comment="Created at"
     )
 
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        comment="Deleted at; the question and its answers are purged in the background"
+    )
+
+    text_hash: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        Computed(normalized_text_hash(literal_column("text")), persisted=True),
+        deferred=True,
+        comment="The hash of the normalized text, for finding duplicates",
+    )
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+        comment="The full-text search vector of the text",
+    )
+
+    folded_answer_count: Mapped[int] = mapped_column(
+        "answer_count",
+        server_default="0",
+        default=0,
+        comment="The number of answers folded in from the counter shards",
+    )
+    folded_last_answer_at: Mapped[datetime | None] = mapped_column(
+        "last_answer_at",
+        comment="Created at of the latest answer folded in from the counter shards",
+    )
+
+    # The exact values sum the counter shards with a subquery per question, so
+    # they are only loaded where they are returned; sorting uses the folded ones.
+    answer_count: Mapped[int] = column_property(
+        folded_answer_count
+        + select(func.coalesce(func.sum(QuestionAnswerCounterShard.answer_count), 0))
+        .where(QuestionAnswerCounterShard.question_id == id)
+        .scalar_subquery(),
+        deferred=True,
+        raiseload=True,
+    )
+    last_answer_at: Mapped[datetime | None] = column_property(
+        func.greatest(
+            folded_last_answer_at,
+            select(func.max(QuestionAnswerCounterShard.last_answer_at))
+            .where(QuestionAnswerCounterShard.question_id == id)
+            .scalar_subquery(),
+        ),
+        deferred=True,
+        raiseload=True,
+    )
+
     answers = relationship(
-        "Answer", back_populates="question", cascade="all, delete-orphan"
+        "Answer",
+        back_populates="question",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
+
+
+Index(
+    "ix_questions_deleted_at",
+    Question.deleted_at,
+    postgresql_where=Question.deleted_at.is_not(None),
+)
+Index("ix_questions_created_at_id", Question.created_at, Question.id)
+Index("ix_questions_text_hash_id", Question.text_hash, Question.id)
+Index("ix_questions_search_vector", Question.search_vector, postgresql_using="gin")
+Index("ix_questions_answer_count_id", Question.folded_answer_count, Question.id)
+Index(
+    "ix_questions_answer_count_desc_id",
+    Question.folded_answer_count.desc().nulls_last(),
+    Question.id,
+)
+Index("ix_questions_last_answer_at_id", Question.folded_last_answer_at, Question.id)
+Index(
+    "ix_questions_last_answer_at_desc_id",
+    Question.folded_last_answer_at.desc().nulls_last(),
+    Question.id,
+)
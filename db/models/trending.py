@@ -0,0 +1,23 @@
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from db.models.base import Base
+
+
+class QuestionTrending(Base):
+    __tablename__ = "question_trending"
+
+    question_id: Mapped[int] = mapped_column(
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="The question ID",
+    )
+
+    log_score: Mapped[float] = mapped_column(
+        comment="Log of the summed answer weights relative to the trending epoch"
+    )
+
+    question = relationship("Question")
+
+
+Index("ix_question_trending_log_score", QuestionTrending.log_score.desc())
@@ -0,0 +1,135 @@
+from sqlalchemy import DDL, Table, event
+
+from constants.archive import ARCHIVING_SETTING
+from constants.counters import ANSWER_COUNTER_SLOTS
+from constants.notifications import ANSWERS_CHANNEL
+
+# Inserts add to a random counter slot of each question instead of its row, so
+# concurrent answers to one question do not queue on a single row lock. Deletes
+# are rare and fold straight into the question, recomputing its latest answer.
+# Archived answers still count, so moves into the archive skip the delete
+# trigger, and the latest answer is recomputed over both tables.
+ANSWER_COUNTERS_INSERT_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION answers_after_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO question_answer_counter_shards AS shards
+        (question_id, slot, answer_count, last_answer_at)
+    SELECT
+        question_id,
+        floor(random() * {ANSWER_COUNTER_SLOTS})::int,
+        count(*),
+        max(created_at)
+    FROM new_answers
+    GROUP BY question_id
+    ON CONFLICT (question_id, slot) DO UPDATE
+    SET answer_count = shards.answer_count + excluded.answer_count,
+        last_answer_at = GREATEST(shards.last_answer_at, excluded.last_answer_at);
+
+    RETURN NULL;
+END;
+$$
+"""  # noqa: S608
+
+ANSWER_COUNTERS_DELETE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION answers_after_delete() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF current_setting('{ARCHIVING_SETTING}', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE questions
+    SET answer_count = questions.answer_count - deleted.count,
+        last_answer_at = GREATEST(
+            (
+                SELECT max(answers.created_at)
+                FROM answers
+                WHERE answers.question_id = questions.id
+            ),
+            (
+                SELECT max(answers_archive.created_at)
+                FROM answers_archive
+                WHERE answers_archive.question_id = questions.id
+            )
+        )
+    FROM (
+        SELECT question_id, count(*) AS count
+        FROM old_answers
+        GROUP BY question_id
+    ) AS deleted
+    WHERE questions.id = deleted.question_id;
+
+    UPDATE question_answer_counter_shards
+    SET last_answer_at = NULL
+    WHERE question_id IN (SELECT question_id FROM old_answers)
+        AND last_answer_at IS NOT NULL;
+
+    RETURN NULL;
+END;
+$$
+"""  # noqa: S608
+
+ANSWER_COUNTERS_INSERT_TRIGGER = """
+CREATE TRIGGER answers_after_insert
+AFTER INSERT ON answers
+REFERENCING NEW TABLE AS new_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_after_insert()
+"""
+
+ANSWER_COUNTERS_DELETE_TRIGGER = """
+CREATE TRIGGER answers_after_delete
+AFTER DELETE ON answers
+REFERENCING OLD TABLE AS old_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_after_delete()
+"""
+
+# New answers are announced to the answer streams from the inserting
+# transaction, so the notification is delivered exactly when the answer commits.
+# The payload carries the partition key, so listeners load the answer from its
+# monthly partition only.
+ANSWERS_NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION answers_notify() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify(
+        '{ANSWERS_CHANNEL}',
+        json_build_object(
+            'id', id, 'question_id', question_id, 'created_at', created_at
+        )::text
+    )
+    FROM new_answers;
+
+    RETURN NULL;
+END;
+$$
+"""
+
+ANSWERS_NOTIFY_TRIGGER = """
+CREATE TRIGGER answers_notify
+AFTER INSERT ON answers
+REFERENCING NEW TABLE AS new_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_notify()
+"""
+
+ANSWER_TRIGGERS = (
+    ANSWER_COUNTERS_INSERT_FUNCTION,
+    ANSWER_COUNTERS_DELETE_FUNCTION,
+    ANSWERS_NOTIFY_FUNCTION,
+    ANSWER_COUNTERS_INSERT_TRIGGER,
+    ANSWER_COUNTERS_DELETE_TRIGGER,
+    ANSWERS_NOTIFY_TRIGGER,
+)
+
+
+def attach_triggers(table: Table, statements: tuple[str, ...]) -> None:
+    """Create triggers whenever a table is created from the metadata.
+
+    Args:
+        table: The table.
+        statements: The DDL statements, executed one by one after the table is
+            created.
+
+    """
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement))
@@ -0,0 +1,177 @@
+import asyncio
+import json
+from collections import defaultdict
+from datetime import datetime
+
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from constants.notifications import ANSWERS_CHANNEL
+from db.models import Answer
+from db.repositories import AnswerRepository
+from db.sessions import shard_sessions
+from settings import db_settings, get_logger, stream_settings
+
+logger = get_logger(__name__)
+
+Subscription = asyncio.Queue[Answer | None]
+
+
+class AnswerBroadcaster:
+    """Fan answer notifications out to the streams of one worker.
+
+    A single ``LISTEN`` connection, opened outside the session pool on the first
+    subscription, receives the notifications emitted by the ``answers_notify``
+    trigger when answers are committed. Each new answer is loaded once, by its ID
+    and creation date so that only its monthly partition is searched, and put
+    into the bounded queue of every subscriber of its question. A subscriber
+    whose queue is full, or every subscriber when the connection is lost,
+    receives ``None`` and should end its stream so that the client reconnects
+    and catches up.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        session_factory: async_sessionmaker[AsyncSession],
+        buffer_size: int,
+    ):
+        self.dsn = dsn
+        self.session_factory = session_factory
+        self.buffer_size = buffer_size
+        self._repository = AnswerRepository()
+        self._subscribers: dict[int, set[Subscription]] = defaultdict(set)
+        self._connection: asyncpg.Connection | None = None
+        self._pending: asyncio.Queue[tuple[int, int, datetime]] = asyncio.Queue()
+        self._dispatcher: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, question_id: int) -> Subscription:
+        """Subscribe to the new answers of a question.
+
+        Args:
+            question_id: The question ID.
+
+        Returns:
+            The queue new answers are put into.
+
+        """
+        await self._start()
+
+        subscription: Subscription = asyncio.Queue(maxsize=self.buffer_size)
+        self._subscribers[question_id].add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, question_id: int, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Args:
+            question_id: The question ID.
+            subscription: The queue returned by ``subscribe``.
+
+        """
+        subscribers = self._subscribers.get(question_id)
+
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[question_id]
+
+    async def stop(self) -> None:
+        """Close the listening connection and end all subscriptions."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+        self._end_all()
+
+    async def _start(self) -> None:
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+
+            self._connection = await asyncpg.connect(dsn=self.dsn)
+            self._connection.add_termination_listener(self._on_termination)
+            await self._connection.add_listener(ANSWERS_CHANNEL, self._on_notification)
+
+            if self._dispatcher is None:
+                self._dispatcher = asyncio.create_task(self._dispatch())
+
+            logger.info("✅ Listening for answer notifications")
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        message = json.loads(payload)
+
+        if message["question_id"] in self._subscribers:
+            self._pending.put_nowait(
+                (
+                    message["id"],
+                    message["question_id"],
+                    datetime.fromisoformat(message["created_at"]),
+                )
+            )
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        logger.warning("⚠️ Lost the answer notification connection")
+
+        if connection is self._connection:
+            self._connection = None
+        self._end_all()
+
+    async def _dispatch(self) -> None:
+        while True:
+            id, question_id, created_at = await self._pending.get()
+
+            try:
+                async with self.session_factory() as session:
+                    answer = await self._repository.get_by(
+                        session=session, id=id, created_at=created_at
+                    )
+            except Exception:
+                logger.exception("❌ Failed to load answer %s for streaming", id)
+                continue
+
+            if answer is not None:
+                self._publish(question_id=question_id, answer=answer)
+
+    def _publish(self, question_id: int, answer: Answer) -> None:
+        for subscription in list(self._subscribers.get(question_id, ())):
+            try:
+                subscription.put_nowait(answer)
+            except asyncio.QueueFull:
+                logger.warning("⚠️ Disconnecting a slow answer stream client")
+                self.unsubscribe(question_id=question_id, subscription=subscription)
+                self._end(subscription=subscription)
+
+    def _end_all(self) -> None:
+        for subscriptions in self._subscribers.values():
+            for subscription in subscriptions:
+                self._end(subscription=subscription)
+
+        self._subscribers.clear()
+
+    @staticmethod
+    def _end(subscription: Subscription) -> None:
+        while not subscription.empty():
+            subscription.get_nowait()
+
+        subscription.put_nowait(None)
+
+
+# Answers are announced on the shard of their question, so every shard has its
+# own broadcaster, in shard order.
+answer_broadcasters = [
+    AnswerBroadcaster(
+        dsn=dsn,
+        session_factory=session_factory,
+        buffer_size=stream_settings.buffer_size,
+    )
+    for dsn, session_factory in zip(db_settings.shard_dsns, shard_sessions, strict=True)
+]
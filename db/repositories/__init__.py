@@ -1,4 +1,17 @@
 from db.repositories.answer import AnswerRepository
+from db.repositories.archive import AnswerArchiveRepository
+from db.repositories.idempotency import IdempotencyKeyRepository
+from db.repositories.job import JobCursorRepository
 from db.repositories.question import QuestionRepository
+from db.repositories.search import SearchRepository
+from db.repositories.trending import TrendingRepository
 
-__all__ = ["AnswerRepository", "QuestionRepository"]
+__all__ = [
+    "AnswerRepository",
+    "QuestionRepository",
+    "JobCursorRepository",
+    "TrendingRepository",
+    "SearchRepository",
+    "IdempotencyKeyRepository",
+    "AnswerArchiveRepository",
+]
@@ -1,7 +1,227 @@
-from db.models import Answer
-from db.repositories.base import BaseRepository
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Collection
+
+from sqlalchemy import Row, and_, bindparam, func, or_, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, noload
+
+from constants.columns import ANSWER_COLUMNS
+from db.models import Answer, Question
+from db.models.partitions import monthly_partition_ddl
+from db.repositories.base import BaseRepository, select_columns
+from db.repositories.question import question_not_deleted
 
 
 class AnswerRepository(BaseRepository[Answer]):
     def __init__(self):
         super().__init__(model=Answer)
+
+    async def get_by_user(
+        self,
+        session: AsyncSession,
+        user_id: uuid.UUID,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        with_question: bool = False,
+    ) -> list[Answer]:
+        """Get a page of a user's answers, newest first.
+
+        Rows are ordered by ``(created_at DESC, id)`` to match the
+        ``ix_answers_user_id_created_at_id`` index, so every page is a range
+        scan starting right after the previous page.
+
+        Args:
+            session: The session.
+            user_id: The user ID.
+            limit: The maximum number of answers.
+            after: The creation date and ID of the last answer of the previous
+                page.
+            with_question: Whether to load the question ID and text in the same
+                query.
+
+        Returns:
+            The answers.
+
+        """
+        statement = (
+            select(Answer)
+            .where(Answer.user_id == user_id, question_not_deleted(Answer.question_id))
+            .order_by(Answer.created_at.desc(), Answer.id)
+            .limit(limit)
+        )
+
+        if after is not None:
+            created_at, id = after
+            statement = statement.where(
+                Answer.created_at <= created_at,
+                or_(
+                    Answer.created_at < created_at,
+                    and_(Answer.created_at == created_at, Answer.id > id),
+                ),
+            )
+
+        if with_question:
+            statement = statement.options(
+                joinedload(Answer.question, innerjoin=True).load_only(Question.text)
+            )
+        else:
+            statement = statement.options(noload(Answer.question))
+
+        result = await session.execute(statement=statement)
+
+        return list(result.scalars().all())
+
+    async def get_feed(
+        self,
+        session: AsyncSession,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        settle_lag: float = 0,
+    ) -> list[Answer]:
+        """Get answers across all questions in ``(created_at, id)`` order.
+
+        Both directions are range scans of the ``ix_answers_created_at_id``
+        index: forwards from ``after``, or backwards from the end for the
+        latest answers.
+
+        ``created_at`` is the start of the inserting transaction, so an answer
+        can commit after a later one is already returned; answers younger than
+        the settle lag are held back until their position is final.
+
+        Args:
+            session: The session.
+            limit: The maximum number of answers.
+            after: The creation date and ID to continue after; the latest answers
+                are returned when omitted.
+            settle_lag: Only return answers at least this many seconds old.
+
+        Returns:
+            The answers, oldest first.
+
+        """
+        statement = (
+            select(Answer)
+            .options(noload(Answer.question))
+            .where(
+                question_not_deleted(Answer.question_id),
+                Answer.created_at
+                < func.localtimestamp() - timedelta(seconds=settle_lag),
+            )
+            .limit(limit)
+        )
+
+        if after is None:
+            result = await session.execute(
+                statement=statement.order_by(Answer.created_at.desc(), Answer.id.desc())
+            )
+            return list(reversed(result.scalars().all()))
+
+        result = await session.execute(
+            statement=statement.where(
+                tuple_(Answer.created_at, Answer.id) > tuple_(*after)
+            ).order_by(Answer.created_at, Answer.id)
+        )
+
+        return list(result.scalars().all())
+
+    async def get_row_by_id(
+        self, session: AsyncSession, id: int, columns: Collection[str] = ANSWER_COLUMNS
+    ) -> Row | None:
+        """Get the row of an answer by ID unless its question is deleted.
+
+        The ID alone does not tell the partition, so the ID index of every
+        monthly partition is probed; the cost grows with the months retained.
+
+        Args:
+            session: The session.
+            id: The answer ID.
+            columns: The columns to select.
+
+        Returns:
+            The answer row.
+
+        """
+        columns = tuple(columns)
+        statement = self.cached_statement(
+            key=("get_row_by_id", columns),
+            build=lambda: select_columns(model=Answer, columns=columns).where(
+                Answer.id == bindparam("id"), question_not_deleted(Answer.question_id)
+            ),
+        )
+        result = await session.execute(statement=statement, params={"id": id})
+
+        return result.one_or_none()
+
+    async def get_by_question_after(
+        self,
+        session: AsyncSession,
+        question_id: int,
+        since: datetime,
+        after_id: int,
+        limit: int,
+    ) -> list[Answer]:
+        """Get the answers of a question with IDs after a given one.
+
+        Args:
+            session: The session.
+            question_id: The question ID.
+            since: The question's creation date, to skip older partitions.
+            after_id: The last answer ID already seen.
+            limit: The maximum number of answers.
+
+        Returns:
+            The answers ordered by ID.
+
+        """
+        result = await session.execute(
+            statement=select(Answer)
+            .options(noload(Answer.question))
+            .where(
+                Answer.question_id == question_id,
+                Answer.created_at >= since,
+                Answer.id > after_id,
+            )
+            .order_by(Answer.id)
+            .limit(limit)
+        )
+
+        return list(result.scalars().all())
+
+    async def get_partition_names(self, session: AsyncSession) -> set[str]:
+        """Get the names of the partitions of the answers table.
+
+        Args:
+            session: The session.
+
+        Returns:
+            The partition names.
+
+        """
+        result = await session.execute(
+            statement=text(
+                "SELECT inhrelid::regclass::text FROM pg_inherits "
+                "WHERE inhparent = CAST(:table AS regclass)"
+            ),
+            params={"table": Answer.__tablename__},
+        )
+
+        return set(result.scalars().all())
+
+    async def create_partition(self, session: AsyncSession, month: date) -> None:
+        """Create the partition of the answers of one month and commit.
+
+        Creating a partition briefly locks the whole answers table, and fails if
+        the default partition already holds answers of that month.
+
+        Args:
+            session: The session.
+            month: The first day of the month.
+
+        """
+        await session.execute(
+            statement=text(
+                monthly_partition_ddl(table=Answer.__tablename__, month=month)
+            )
+        )
+        await session.commit()
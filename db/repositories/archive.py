@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select, text, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.archive import ARCHIVING_SETTING
+from db.models import Answer, AnswerArchive, Question
+from db.repositories.base import BaseRepository
+
+
+class AnswerArchiveRepository(BaseRepository[AnswerArchive]):
+    def __init__(self):
+        super().__init__(model=AnswerArchive)
+
+    async def archive(
+        self, session: AsyncSession, max_age: timedelta, limit: int
+    ) -> int:
+        """Move a batch of the oldest answers into the archive and commit.
+
+        The answers are removed with ``DELETE ... RETURNING`` and inserted from
+        the returned rows in the same statement, so every answer is in exactly
+        one of the two tables. The batch and the delete are both bounded by the
+        cutoff date, so only the partitions of old months of ``answers`` are
+        scanned. Archived answers still count towards the answer stats of their
+        questions, so the transaction tells the answer delete trigger to leave
+        them alone.
+
+        Args:
+            session: The session.
+            max_age: Answers created longer ago than this are archived.
+            limit: The maximum number of archived answers.
+
+        Returns:
+            The number of archived answers.
+
+        """
+        old = Answer.created_at < func.localtimestamp() - max_age
+        batch = (
+            select(Answer.id)
+            .where(old)
+            .order_by(Answer.created_at, Answer.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(Answer)
+            .where(old, Answer.id.in_(batch.scalar_subquery()))
+            .returning(
+                Answer.id,
+                Answer.question_id,
+                Answer.user_id,
+                Answer.text,
+                Answer.created_at,
+            )
+            .cte("moved")
+        )
+
+        await session.execute(statement=text(f"SET LOCAL {ARCHIVING_SETTING} = 'on'"))
+        result = await session.execute(
+            statement=insert(AnswerArchive).from_select(
+                ["id", "question_id", "user_id", "text", "created_at"],
+                select(
+                    moved.c.id,
+                    moved.c.question_id,
+                    moved.c.user_id,
+                    moved.c.text,
+                    moved.c.created_at,
+                ),
+            )
+        )
+        await session.commit()
+
+        return result.rowcount
+
+    async def get_by_question(
+        self,
+        session: AsyncSession,
+        question_id: int,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[AnswerArchive]:
+        """Get a page of the archived answers of a question, oldest first.
+
+        Args:
+            session: The session.
+            question_id: The question ID.
+            limit: The maximum number of answers.
+            after: The creation date and ID of the last answer of the previous
+                page.
+
+        Returns:
+            The archived answers.
+
+        """
+        statement = (
+            select(AnswerArchive)
+            .where(AnswerArchive.question_id == question_id)
+            .order_by(AnswerArchive.created_at, AnswerArchive.id)
+            .limit(limit)
+        )
+
+        if after is not None:
+            statement = statement.where(
+                tuple_(AnswerArchive.created_at, AnswerArchive.id) > tuple_(*after)
+            )
+
+        result = await session.execute(statement=statement)
+
+        return list(result.scalars().all())
+
+    async def purge_by_question(
+        self, session: AsyncSession, question_id: int, limit: int
+    ) -> int:
+        """Delete a batch of the archived answers of a question and commit.
+
+        Archived answers count towards the answer count of their question, so it
+        is lowered by the deleted answers and keeps counting the answers left to
+        purge.
+
+        Args:
+            session: The session.
+            question_id: The question ID.
+            limit: The maximum number of deleted answers.
+
+        Returns:
+            The number of deleted answers.
+
+        """
+        batch = (
+            select(AnswerArchive.id)
+            .where(AnswerArchive.question_id == question_id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await session.execute(
+            statement=delete(AnswerArchive).where(AnswerArchive.id.in_(batch))
+        )
+
+        if result.rowcount:
+            await session.execute(
+                statement=update(Question)
+                .where(Question.id == question_id)
+                .values(
+                    folded_answer_count=Question.folded_answer_count - result.rowcount
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        await session.commit()
+
+        return result.rowcount
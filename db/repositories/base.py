@@ -1,23 +1,98 @@
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Callable, ClassVar, Collection, Generic, Hashable, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import Executable, Select, bindparam, func, inspect, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 Model = TypeVar("Model")
+Statement = TypeVar("Statement", bound=Executable)
+
+
+def select_columns(model: type, columns: Collection[str]) -> Select:
+    """Build a select of some column attributes of a model.
+
+    It returns plain rows: no instances are built, tracked in the identity map
+    or instrumented, so large read-only results stay cheap. Rows can be
+    validated into response schemas directly.
+
+    Args:
+        model: The model.
+        columns: The names of the column attributes; repeated names are
+            selected once.
+
+    Returns:
+        The select.
+
+    """
+    return select(*(getattr(model, column) for column in dict.fromkeys(columns)))
 
 
 class BaseRepository(Generic[Model]):
+    _statements: ClassVar[dict[Hashable, Any]] = {}
+
     def __init__(self, model: Type[Model]):
         self.model = model
 
+    def cached_statement(
+        self, key: Hashable, build: Callable[[], Statement]
+    ) -> Statement:
+        """Get a statement of this repository, built on first use.
+
+        Statements are shared by all instances and executed with bound
+        parameters, so each is constructed once and SQLAlchemy finds its
+        compiled form by a cache key memoized on the statement, instead of
+        walking a new statement on every call.
+
+        Args:
+            key: The statement key within the repository; it must only vary
+                with the shape of the statement, never with parameter values.
+            build: Build the statement.
+
+        Returns:
+            The statement.
+
+        """
+        key = (type(self), key)
+        statement = self._statements.get(key)
+
+        if statement is None:
+            statement = self._statements[key] = build()
+
+        return statement
+
+    def _select_by(self, filters: dict[str, Any]) -> tuple[Select, dict[str, Any]]:
+        # None filters render IS NULL, so they are part of the statement shape.
+        signature = tuple(
+            (name, value is None) for name, value in sorted(filters.items())
+        )
+        statement = self.cached_statement(
+            key=("select_by", signature),
+            build=lambda: select(self.model).filter_by(
+                **{
+                    name: None if is_null else bindparam(name)
+                    for name, is_null in signature
+                }
+            ),
+        )
+
+        return statement, {
+            name: value for name, value in filters.items() if value is not None
+        }
+
     async def create(
-        self, session: AsyncSession, data: dict[str, Any], *args, **kwargs
+        self,
+        session: AsyncSession,
+        data: dict[str, Any],
+        *args,
+        commit: bool = True,
+        **kwargs,
     ) -> Model:
         """Create a new model instance.
 
         Args:
             session: The async session.
             data: The data to create the model instance.
+            commit: Whether to commit, or only flush and leave the transaction
+                to the caller.
 
         Returns:
             The created model instance.
@@ -26,7 +101,12 @@ class BaseRepository(Generic[Model]):
         instance = self.model(**data)
 
         session.add(instance=instance)
-        await session.commit()
+
+        if commit:
+            await session.commit()
+        else:
+            await session.flush()
+
         await session.refresh(instance)
 
         return instance
@@ -42,9 +122,8 @@ class BaseRepository(Generic[Model]):
             The list of model instances.
 
         """
-        result = await session.execute(
-            statement=select(self.model).filter_by(**filters)
-        )
+        statement, params = self._select_by(filters=filters)
+        result = await session.execute(statement=statement, params=params)
         return list(result.scalars().all())
 
     async def get_by(self, session: AsyncSession, **filters) -> Model | None:
@@ -58,9 +137,8 @@ class BaseRepository(Generic[Model]):
             The model instance.
 
         """
-        result = await session.execute(
-            statement=select(self.model).filter_by(**filters)
-        )
+        statement, params = self._select_by(filters=filters)
+        result = await session.execute(statement=statement, params=params)
         return result.scalar_one_or_none()
 
     async def update_by(
@@ -108,3 +186,37 @@ class BaseRepository(Generic[Model]):
             return True
 
         return False
+
+    async def stride_ids(self, session: AsyncSession, stride: int, offset: int) -> None:
+        """Make the ID sequence step by a stride from an offset and commit.
+
+        The next ID is the first one above every used ID that is ``offset + 1``
+        modulo ``stride``, so tables on different databases can hand out IDs
+        that never collide.
+
+        Args:
+            session: The async session.
+            stride: The step between IDs.
+            offset: The remainder of ``ID - 1`` divided by the stride.
+
+        """
+        table = inspect(self.model).local_table.description
+        sequence = await session.scalar(
+            statement=select(func.pg_get_serial_sequence(table, "id"))
+        )
+        last = await session.scalar(
+            statement=text(
+                "SELECT greatest(coalesce(max(id), 0), "  # noqa: S608
+                "coalesce(pg_sequence_last_value(CAST(:sequence AS regclass)), 0)) "
+                f"FROM {table}"
+            ),
+            params={"sequence": sequence},
+        )
+        start = last + 1 + (offset - last) % stride
+
+        await session.execute(
+            statement=text(
+                f"ALTER SEQUENCE {sequence} INCREMENT BY {stride} RESTART WITH {start}"
+            )
+        )
+        await session.commit()
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import IdempotencyKey
+from db.repositories.base import BaseRepository
+
+
+class IdempotencyKeyRepository(BaseRepository[IdempotencyKey]):
+    def __init__(self):
+        super().__init__(model=IdempotencyKey)
+
+    async def claim(
+        self,
+        session: AsyncSession,
+        key: str,
+        fingerprint: bytes,
+        ttl: timedelta,
+        pending_timeout: timedelta,
+    ) -> bool:
+        """Store a placeholder for a key unless a live one exists, and commit.
+
+        A key whose response expired, or whose placeholder was abandoned by a
+        request that never finished, is taken over.
+
+        Args:
+            session: The session.
+            key: The idempotency key.
+            fingerprint: The request fingerprint.
+            ttl: How long a stored response is replayed.
+            pending_timeout: How long a placeholder blocks other requests.
+
+        Returns:
+            True if the key was claimed, False if it is already in use.
+
+        """
+        now = func.localtimestamp()
+        statement = insert(IdempotencyKey).values(key=key, fingerprint=fingerprint)
+
+        result = await session.execute(
+            statement=statement.on_conflict_do_update(
+                index_elements=[IdempotencyKey.key],
+                set_={
+                    "fingerprint": statement.excluded.fingerprint,
+                    "response": None,
+                    "created_at": now,
+                },
+                where=or_(
+                    IdempotencyKey.created_at < now - ttl,
+                    (IdempotencyKey.response.is_(None))
+                    & (IdempotencyKey.created_at < now - pending_timeout),
+                ),
+            ).returning(IdempotencyKey.key)
+        )
+        claimed = result.scalar_one_or_none() is not None
+        await session.commit()
+
+        return claimed
+
+    async def get_stored(
+        self, session: AsyncSession, key: str
+    ) -> tuple[bytes, dict[str, Any] | None] | None:
+        """Get the fingerprint and response stored for a key.
+
+        Args:
+            session: The session.
+            key: The idempotency key.
+
+        Returns:
+            The fingerprint and the response, which is None while in progress.
+
+        """
+        result = await session.execute(
+            statement=select(IdempotencyKey.fingerprint, IdempotencyKey.response).where(
+                IdempotencyKey.key == key
+            )
+        )
+        row = result.one_or_none()
+
+        return None if row is None else (row.fingerprint, row.response)
+
+    async def complete(
+        self, session: AsyncSession, key: str, response: dict[str, Any]
+    ) -> None:
+        """Store the response of a claimed key and commit.
+
+        Args:
+            session: The session.
+            key: The idempotency key.
+            response: The response body.
+
+        """
+        await session.execute(
+            statement=update(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .values(response=response)
+        )
+        await session.commit()
+
+    async def release(self, session: AsyncSession, key: str) -> None:
+        """Delete the placeholder of a claimed key and commit.
+
+        Args:
+            session: The session.
+            key: The idempotency key.
+
+        """
+        await session.execute(
+            statement=delete(IdempotencyKey).where(
+                IdempotencyKey.key == key, IdempotencyKey.response.is_(None)
+            )
+        )
+        await session.commit()
+
+    async def purge(self, session: AsyncSession, ttl: timedelta, limit: int) -> int:
+        """Delete a batch of expired keys and commit.
+
+        Args:
+            session: The session.
+            ttl: How long a stored response is replayed.
+            limit: The maximum number of deleted keys.
+
+        Returns:
+            The number of deleted keys.
+
+        """
+        expired = (
+            select(IdempotencyKey.key)
+            .where(IdempotencyKey.created_at < func.localtimestamp() - ttl)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await session.execute(
+            statement=delete(IdempotencyKey).where(
+                IdempotencyKey.key.in_(expired.scalar_subquery())
+            )
+        )
+        await session.commit()
+
+        return result.rowcount
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import JobCursor
+from db.repositories.base import BaseRepository
+
+
+class JobCursorRepository(BaseRepository[JobCursor]):
+    def __init__(self):
+        super().__init__(model=JobCursor)
+
+    async def get_position(
+        self, session: AsyncSession, name: str
+    ) -> tuple[datetime, int] | None:
+        """Get the last processed position of a job and lock it.
+
+        Args:
+            session: The session.
+            name: The job name.
+
+        Returns:
+            The creation date and ID of the last processed row, if any.
+
+        """
+        result = await session.execute(
+            statement=select(JobCursor.last_created_at, JobCursor.last_id)
+            .where(JobCursor.name == name)
+            .with_for_update()
+        )
+        row = result.one_or_none()
+
+        return None if row is None else (row.last_created_at, row.last_id)
+
+    async def save_position(
+        self, session: AsyncSession, name: str, position: tuple[datetime, int]
+    ) -> None:
+        """Store the last processed position of a job and commit.
+
+        Args:
+            session: The session.
+            name: The job name.
+            position: The creation date and ID of the last processed row.
+
+        """
+        last_created_at, last_id = position
+        statement = insert(JobCursor).values(
+            name=name, last_created_at=last_created_at, last_id=last_id
+        )
+
+        await session.execute(
+            statement=statement.on_conflict_do_update(
+                index_elements=[JobCursor.name],
+                set_={
+                    "last_created_at": statement.excluded.last_created_at,
+                    "last_id": statement.excluded.last_id,
+                },
+            )
+        )
+        await session.commit()
@@ -1,18 +1,354 @@
-from sqlalchemy import select
+from datetime import datetime
+from typing import Any, AsyncIterator, Collection, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Text,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import undefer
+from sqlalchemy.orm.attributes import set_committed_value
+
+from constants.columns import ANSWER_COLUMNS, QUESTION_COLUMNS, QUESTION_SORT_COLUMNS
+from db.models import Answer, AnswerArchive, Question, QuestionAnswerCounterShard
+from db.models.question import normalized_text_hash
+from db.repositories.base import BaseRepository, select_columns
+
+
+def question_not_deleted(question_id: ColumnElement[int]) -> ColumnElement[bool]:
+    """Filter out rows of soft-deleted questions by question ID.
+
+    The few soft-deleted question IDs come from the partial
+    ``ix_questions_deleted_at`` index, so the check stays cheap for answers.
+
+    Args:
+        question_id: The question ID expression.
 
-from db.models import Question
-from db.repositories.base import BaseRepository
+    Returns:
+        The filter.
+
+    """
+    return question_id.not_in(
+        select(Question.id).where(Question.deleted_at.is_not(None))
+    )
+
+
+# Loads the deferred exact answer stats along with questions.
+WITH_ANSWER_STATS = (undefer(Question.answer_count), undefer(Question.last_answer_at))
 
 
 class QuestionRepository(BaseRepository[Question]):
     def __init__(self):
         super().__init__(model=Question)
 
+    async def create(
+        self,
+        session: AsyncSession,
+        data: dict[str, Any],
+        *args,
+        commit: bool = True,
+        **kwargs,
+    ) -> Question:
+        """Create a new question.
+
+        A new question has no answers, so its answer stats are the folded ones
+        and need no query of their own.
+
+        Args:
+            session: The session.
+            data: The data to create the question.
+            commit: Whether to commit, or only flush and leave the transaction
+                to the caller.
+
+        Returns:
+            The created question.
+
+        """
+        question = await super().create(session=session, data=data, commit=commit)
+        set_committed_value(question, "answer_count", question.folded_answer_count)
+        set_committed_value(question, "last_answer_at", question.folded_last_answer_at)
+
+        return question
+
+    async def load_answer_stats(
+        self, session: AsyncSession, question: Question
+    ) -> None:
+        """Load the exact answer stats of a question loaded without them.
+
+        Args:
+            session: The session.
+            question: The question.
+
+        """
+        await session.refresh(
+            instance=question, attribute_names=["answer_count", "last_answer_at"]
+        )
+
     async def get_with_answers(self, session: AsyncSession, id: int) -> Question | None:
         """Get a question with its answers.
 
+        The answers are loaded with a lower bound on ``created_at``: no answer
+        is older than its question, so Postgres skips the monthly partitions of
+        ``answers`` from before the question was asked.
+
+        Args:
+            session: The session.
+            id: The question ID.
+
+        Returns:
+            The question.
+
+        """
+        result = await session.execute(
+            statement=select(Question).where(
+                Question.id == id, Question.deleted_at.is_(None)
+            )
+        )
+        question = result.scalar_one_or_none()
+
+        if question is not None:
+            answers = await session.execute(
+                statement=select(Answer).where(
+                    Answer.question_id == id, Answer.created_at >= question.created_at
+                )
+            )
+            set_committed_value(question, "answers", list(answers.scalars().all()))
+
+        return question
+
+    async def get_rows_with_answers(
+        self,
+        session: AsyncSession,
+        id: int,
+        columns: Collection[str] = QUESTION_COLUMNS,
+        answer_columns: Collection[str] = ANSWER_COLUMNS,
+        with_answers: bool = True,
+    ) -> tuple[Row | None, list[Row]]:
+        """Get the row of a question and the rows of its answers.
+
+        The read-only counterpart of ``get_with_answers``: columns are selected
+        as plain rows, so thousands of answers cost no ORM instances.
+
+        Args:
+            session: The session.
+            id: The question ID.
+            columns: The question columns.
+            answer_columns: The answer columns.
+            with_answers: Whether to select the answers at all.
+
+        Returns:
+            The question row, or None if it is not found, and the answer rows.
+
+        """
+        columns = (*columns, "created_at")
+        answer_columns = tuple(answer_columns)
+        statement = self.cached_statement(
+            key=("get_row", columns),
+            build=lambda: select_columns(model=Question, columns=columns).where(
+                Question.id == bindparam("id"), Question.deleted_at.is_(None)
+            ),
+        )
+        result = await session.execute(statement=statement, params={"id": id})
+        question = result.one_or_none()
+
+        if question is None or not with_answers:
+            return question, []
+
+        statement = self.cached_statement(
+            key=("get_answer_rows", answer_columns),
+            build=lambda: select_columns(model=Answer, columns=answer_columns).where(
+                Answer.question_id == bindparam("id"),
+                Answer.created_at >= bindparam("since"),
+            ),
+        )
+        answers = await session.execute(
+            statement=statement, params={"id": id, "since": question.created_at}
+        )
+
+        return question, list(answers.all())
+
+    async def get_by_text(
+        self, session: AsyncSession, text: str, lock: bool = False
+    ) -> Question | None:
+        """Get the oldest question whose normalized text equals the given one.
+
+        Args:
+            session: The session.
+            text: The question text.
+            lock: Whether to first take a transaction-level advisory lock on the
+                normalized text, so concurrent creations of the same text wait
+                for each other until the transaction ends.
+
+        Returns:
+            The question.
+
+        """
+        text_hash = normalized_text_hash(literal(text))
+
+        if lock:
+            await session.execute(
+                statement=select(
+                    func.pg_advisory_xact_lock(
+                        func.hashtextextended(cast(text_hash, Text), 0)
+                    )
+                )
+            )
+
+        result = await session.execute(
+            statement=select(Question)
+            .where(Question.text_hash == text_hash, Question.deleted_at.is_(None))
+            .order_by(Question.id)
+            .limit(1)
+        )
+
+        return result.scalar_one_or_none()
+
+    async def stream_with_answers(
+        self,
+        session: AsyncSession,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Stream questions joined with their answers through a server-side cursor.
+
+        Rows are ordered by question creation date and ID, then answer ID; a
+        question without answers yields one row with empty answer columns.
+
+        Args:
+            session: The session.
+            created_from: Only questions created at or after this date.
+            created_to: Only questions created before this date.
+            batch_size: The number of rows fetched from the cursor at a time.
+
+        Yields:
+            Batches of rows of question ID, text and creation date, and answer
+            ID, user ID, text and creation date.
+
+        """
+        statement = (
+            select(
+                Question.id.label("question_id"),
+                Question.text.label("question_text"),
+                Question.created_at.label("question_created_at"),
+                Answer.id.label("answer_id"),
+                Answer.user_id.label("answer_user_id"),
+                Answer.text.label("answer_text"),
+                Answer.created_at.label("answer_created_at"),
+            )
+            .outerjoin(Answer, Answer.question_id == Question.id)
+            .where(Question.deleted_at.is_(None))
+            .order_by(Question.created_at, Question.id, Answer.id)
+        )
+
+        if created_from is not None:
+            statement = statement.where(Question.created_at >= created_from)
+        if created_to is not None:
+            statement = statement.where(Question.created_at < created_to)
+
+        result = await session.stream(
+            statement=statement, execution_options={"yield_per": batch_size}
+        )
+
+        async for rows in result.partitions():
+            yield rows
+
+    async def get_sorted(  # noqa: PLR0913, PLR0917
+        self,
+        session: AsyncSession,
+        sort_by: str = "id",
+        descending: bool = False,
+        limit: int | None = None,
+        after: tuple[Any, int] | None = None,
+        columns: Collection[str] = QUESTION_COLUMNS,
+    ) -> list[Row]:
+        """Get the rows of questions sorted by a field, ties broken by ID.
+
+        Questions with an empty field come last in both directions. The answer
+        stats are sorted by their indexed folded columns (see
+        ``QUESTION_SORT_COLUMNS``), so the order only catches up with new
+        answers once their counter shards are compacted. Rows are selected
+        without ORM instances, see ``select_columns``.
+
+        Args:
+            session: The session.
+            sort_by: The field to sort by.
+            descending: Whether to sort in descending order.
+            limit: The maximum number of questions.
+            after: The sorted column value and ID of the last question of the
+                previous page.
+            columns: The columns to select; the sorted column and the ID are
+                always selected.
+
+        Returns:
+            The question rows.
+
+        """
+        sort_column = QUESTION_SORT_COLUMNS[sort_by]
+        column = getattr(Question, sort_column)
+        ordering = column.desc().nulls_last() if descending else column.asc()
+        statement = (
+            select_columns(model=Question, columns=[*columns, sort_column, "id"])
+            .where(Question.deleted_at.is_(None))
+            .order_by(ordering, Question.id)
+            .limit(limit)
+        )
+
+        if after is not None:
+            value, id = after
+            if value is None:
+                statement = statement.where(column.is_(None), Question.id > id)
+            else:
+                statement = statement.where(
+                    or_(
+                        column < value if descending else column > value,
+                        and_(column == value, Question.id > id),
+                        column.is_(None),
+                    )
+                )
+
+        result = await session.execute(statement=statement)
+
+        return list(result.all())
+
+    async def soft_delete(self, session: AsyncSession, id: int) -> bool:
+        """Mark a question as deleted and commit.
+
+        Args:
+            session: The session.
+            id: The question ID.
+
+        Returns:
+            True if the question was marked, False if it is missing or already
+            deleted.
+
+        """
+        result = await session.execute(
+            statement=update(Question)
+            .where(Question.id == id, Question.deleted_at.is_(None))
+            .values(deleted_at=func.now())
+            .returning(Question.id)
+        )
+        await session.commit()
+
+        return result.scalar_one_or_none() is not None
+
+    async def get_including_deleted(
+        self, session: AsyncSession, id: int
+    ) -> Question | None:
+        """Get a fresh copy of a question, whether it is soft-deleted or not.
+
         Args:
             session: The session.
             id: The question ID.
@@ -23,8 +359,213 @@ class QuestionRepository(BaseRepository[Question]):
         """
         result = await session.execute(
             statement=select(Question)
-            .options(selectinload(Question.answers))
             .where(Question.id == id)
+            .options(*WITH_ANSWER_STATS)
+            .execution_options(populate_existing=True)
         )
 
         return result.scalar_one_or_none()
+
+    async def get_deleted(self, session: AsyncSession, limit: int) -> list[Row]:
+        """Get soft-deleted questions, earliest deleted first.
+
+        Args:
+            session: The session.
+            limit: The maximum number of questions.
+
+        Returns:
+            Rows of question ID and creation date.
+
+        """
+        result = await session.execute(
+            statement=select(Question.id, Question.created_at)
+            .where(Question.deleted_at.is_not(None))
+            .order_by(Question.deleted_at)
+            .limit(limit)
+        )
+
+        return list(result.all())
+
+    async def purge_answers(
+        self, session: AsyncSession, question_id: int, since: datetime, limit: int
+    ) -> int:
+        """Delete a batch of the answers of a question and commit.
+
+        No answer is older than its question, so the batch is only looked for
+        in the monthly partitions of ``answers`` from ``since`` on, and each
+        answer is deleted by its ID and creation date from its own partition.
+
+        Args:
+            session: The session.
+            question_id: The question ID.
+            since: The creation date of the question.
+            limit: The maximum number of deleted answers.
+
+        Returns:
+            The number of deleted answers.
+
+        """
+        batch = (
+            select(Answer.id, Answer.created_at)
+            .where(Answer.question_id == question_id, Answer.created_at >= since)
+            .limit(limit)
+        )
+        result = await session.execute(
+            statement=delete(Answer).where(
+                tuple_(Answer.id, Answer.created_at).in_(batch)
+            )
+        )
+        await session.commit()
+
+        return result.rowcount
+
+    async def purge(self, session: AsyncSession, id: int) -> bool:
+        """Delete a soft-deleted question and commit.
+
+        Args:
+            session: The session.
+            id: The question ID.
+
+        Returns:
+            True if the question was deleted.
+
+        """
+        result = await session.execute(
+            statement=delete(Question).where(
+                Question.id == id, Question.deleted_at.is_not(None)
+            )
+        )
+        await session.commit()
+
+        return result.rowcount > 0
+
+    async def get_id_range(self, session: AsyncSession) -> tuple[int, int] | None:
+        """Get the lowest and highest question IDs.
+
+        Args:
+            session: The session.
+
+        Returns:
+            The lowest and highest ID, or None if there are no questions.
+
+        """
+        result = await session.execute(
+            statement=select(func.min(Question.id), func.max(Question.id))
+        )
+        first_id, last_id = result.one()
+
+        return None if first_id is None else (first_id, last_id)
+
+    async def repair_answer_stats(
+        self, session: AsyncSession, first_id: int, last_id: int
+    ) -> int:
+        """Recompute the answer count and last answer date of a range of questions.
+
+        The questions are locked first, so answers inserted or deleted
+        concurrently are either counted here or applied by the answer triggers
+        after this transaction commits. Their counter shards are dropped and the
+        exact values, archived answers included, are stored on the questions.
+
+        Args:
+            session: The session.
+            first_id: The first question ID of the range.
+            last_id: The last question ID of the range.
+
+        Returns:
+            The number of questions whose stored values changed.
+
+        """
+        in_range = Question.id.between(first_id, last_id)
+        count = (
+            select(func.count())
+            .where(Answer.question_id == Question.id)
+            .scalar_subquery()
+        ) + (
+            select(func.count())
+            .where(AnswerArchive.question_id == Question.id)
+            .scalar_subquery()
+        )
+        last_answer_at = func.greatest(
+            select(func.max(Answer.created_at))
+            .where(Answer.question_id == Question.id)
+            .scalar_subquery(),
+            select(func.max(AnswerArchive.created_at))
+            .where(AnswerArchive.question_id == Question.id)
+            .scalar_subquery(),
+        )
+
+        await session.execute(
+            statement=select(Question.id).where(in_range).with_for_update()
+        )
+        await session.execute(
+            statement=delete(QuestionAnswerCounterShard).where(
+                QuestionAnswerCounterShard.question_id.between(first_id, last_id)
+            )
+        )
+        result = await session.execute(
+            statement=update(Question)
+            .where(
+                in_range,
+                or_(
+                    Question.folded_answer_count != count,
+                    Question.folded_last_answer_at.is_distinct_from(last_answer_at),
+                ),
+            )
+            .values(folded_answer_count=count, folded_last_answer_at=last_answer_at)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+        return result.rowcount
+
+    async def compact_answer_counters(self, session: AsyncSession, limit: int) -> int:
+        """Fold the counter shards of some questions into the questions.
+
+        Shards are deleted and added to their questions in one statement, so
+        concurrent reads see either the shards or the folded values.
+
+        Args:
+            session: The session.
+            limit: The maximum number of questions to compact.
+
+        Returns:
+            The number of compacted questions.
+
+        """
+        shards = QuestionAnswerCounterShard
+        folded = (
+            delete(shards)
+            .where(
+                shards.question_id.in_(
+                    select(shards.question_id).distinct().limit(limit)
+                )
+            )
+            .returning(shards.question_id, shards.answer_count, shards.last_answer_at)
+            .cte("folded")
+        )
+        totals = (
+            select(
+                folded.c.question_id,
+                func.sum(folded.c.answer_count).label("answer_count"),
+                func.max(folded.c.last_answer_at).label("last_answer_at"),
+            )
+            .group_by(folded.c.question_id)
+            .subquery("totals")
+        )
+
+        result = await session.execute(
+            statement=update(Question)
+            .where(Question.id == totals.c.question_id)
+            .values(
+                folded_answer_count=Question.folded_answer_count
+                + totals.c.answer_count,
+                folded_last_answer_at=func.greatest(
+                    Question.folded_last_answer_at, totals.c.last_answer_at
+                ),
+            )
+            .add_cte(folded)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+        return result.rowcount
@@ -0,0 +1,83 @@
+from sqlalchemy import Row, and_, cast, func, literal, or_, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.search import SEARCH_CONFIG
+from db.models import Answer, Question
+from db.repositories.base import BaseRepository
+from db.repositories.question import question_not_deleted
+
+
+class SearchRepository(BaseRepository[Question]):
+    def __init__(self):
+        super().__init__(model=Question)
+
+    async def search(
+        self,
+        session: AsyncSession,
+        query: str,
+        limit: int,
+        after: tuple[float, str, int] | None = None,
+    ) -> list[Row]:
+        """Search question and answer texts, best matches first.
+
+        Matches are found through the GIN indexes on the generated
+        ``search_vector`` columns and ordered by ``(rank DESC, kind, id)``.
+
+        Args:
+            session: The session.
+            query: The web-search style query, e.g. ``python -snake "type hints"``.
+            limit: The maximum number of results.
+            after: The rank, kind and ID of the last result of the previous page.
+
+        Returns:
+            Rows of kind, ID, question ID, text, creation date and rank.
+
+        """
+        tsquery = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), query)
+        matches = union_all(
+            select(
+                literal("question").label("kind"),
+                Question.id,
+                Question.id.label("question_id"),
+                Question.text,
+                Question.created_at,
+                func.ts_rank(Question.search_vector, tsquery).label("rank"),
+            ).where(
+                Question.search_vector.bool_op("@@")(tsquery),
+                Question.deleted_at.is_(None),
+            ),
+            select(
+                literal("answer").label("kind"),
+                Answer.id,
+                Answer.question_id,
+                Answer.text,
+                Answer.created_at,
+                func.ts_rank(Answer.search_vector, tsquery).label("rank"),
+            ).where(
+                Answer.search_vector.bool_op("@@")(tsquery),
+                question_not_deleted(Answer.question_id),
+            ),
+        ).subquery("matches")
+
+        statement = (
+            select(matches)
+            .order_by(matches.c.rank.desc(), matches.c.kind, matches.c.id)
+            .limit(limit)
+        )
+
+        if after is not None:
+            rank, kind, id = after
+            statement = statement.where(
+                or_(
+                    matches.c.rank < rank,
+                    and_(
+                        matches.c.rank == rank,
+                        tuple_(matches.c.kind, matches.c.id) > tuple_(kind, id),
+                    ),
+                )
+            )
+
+        result = await session.execute(statement=statement)
+
+        return list(result.all())
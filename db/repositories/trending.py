@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Row,
+    cast,
+    delete,
+    extract,
+    func,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.trending import TRENDING_EPOCH
+from db.models import Answer, Question, QuestionTrending
+from db.repositories.base import BaseRepository
+from db.repositories.question import WITH_ANSWER_STATS
+
+
+def _seconds_since_epoch(timestamp: ColumnElement[datetime]) -> ColumnElement[float]:
+    return cast(extract("epoch", timestamp - TRENDING_EPOCH), Float)
+
+
+class TrendingRepository(BaseRepository[QuestionTrending]):
+    def __init__(self):
+        super().__init__(model=QuestionTrending)
+
+    async def get_top(
+        self, session: AsyncSession, limit: int, decay_rate: float
+    ) -> list[tuple[Question, float]]:
+        """Get the questions with the highest trending scores.
+
+        Args:
+            session: The session.
+            limit: The maximum number of questions.
+            decay_rate: The exponential decay rate per second.
+
+        Returns:
+            The questions with their current decayed scores, highest first.
+
+        """
+        now = _seconds_since_epoch(func.localtimestamp())
+        result = await session.execute(
+            statement=select(
+                Question, func.exp(QuestionTrending.log_score - decay_rate * now)
+            )
+            .join(QuestionTrending.question)
+            .where(Question.deleted_at.is_(None))
+            .options(*WITH_ANSWER_STATS)
+            .order_by(QuestionTrending.log_score.desc())
+            .limit(limit)
+        )
+
+        return [(question, score) for question, score in result.tuples()]
+
+    async def get_new_answers(
+        self,
+        session: AsyncSession,
+        after: tuple[datetime, int] | None,
+        settle_lag: float,
+        limit: int,
+    ) -> list[Row]:
+        """Get the positions of answers created after a point, oldest first.
+
+        Args:
+            session: The session.
+            after: The creation date and ID of the last scored answer.
+            settle_lag: Only return answers at least this many seconds old.
+            limit: The maximum number of answers.
+
+        Returns:
+            Rows of question ID, creation date, ID and seconds since the epoch.
+
+        """
+        statement = (
+            select(
+                Answer.question_id,
+                Answer.created_at,
+                Answer.id,
+                _seconds_since_epoch(Answer.created_at).label("seconds"),
+            )
+            .where(
+                Answer.created_at
+                < func.localtimestamp() - timedelta(seconds=settle_lag)
+            )
+            .order_by(Answer.created_at, Answer.id)
+            .limit(limit)
+        )
+
+        if after is not None:
+            statement = statement.where(
+                tuple_(Answer.created_at, Answer.id) > tuple_(*after)
+            )
+
+        result = await session.execute(statement=statement)
+
+        return list(result.all())
+
+    async def add_scores(
+        self, session: AsyncSession, log_scores: dict[int, float]
+    ) -> None:
+        """Add log-space scores to the questions' trending scores.
+
+        Args:
+            session: The session.
+            log_scores: The log-space scores to add by question ID.
+
+        """
+        if not log_scores:
+            return
+
+        statement = insert(QuestionTrending).values(
+            [
+                {"question_id": question_id, "log_score": log_score}
+                for question_id, log_score in log_scores.items()
+            ]
+        )
+        current = QuestionTrending.log_score
+        added = statement.excluded.log_score
+
+        await session.execute(
+            statement=statement.on_conflict_do_update(
+                index_elements=[QuestionTrending.question_id],
+                set_={
+                    "log_score": func.greatest(current, added)
+                    + func.ln(1 + func.exp(-func.abs(current - added)))
+                },
+            )
+        )
+
+    async def prune(
+        self, session: AsyncSession, decay_rate: float, min_score: float
+    ) -> int:
+        """Delete the questions whose decayed score dropped below a minimum.
+
+        Args:
+            session: The session.
+            decay_rate: The exponential decay rate per second.
+            min_score: The minimum decayed score to keep.
+
+        Returns:
+            The number of deleted rows.
+
+        """
+        now = _seconds_since_epoch(func.localtimestamp())
+        result = await session.execute(
+            statement=delete(QuestionTrending).where(
+                QuestionTrending.log_score < decay_rate * now + func.ln(min_score)
+            )
+        )
+        await session.commit()
+
+        return result.rowcount
@@ -1,20 +1,72 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
+from db.instrumentation import install_compiled_cache_metrics, install_slow_query_log
 from settings import db_settings
 
-async_engine = create_async_engine(
-    url=db_settings.url,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_timeout=30,
-    pool_recycle=1800,
-)
 
-async_session = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+def create_engine(url: str) -> AsyncEngine:
+    """Create the engine of a database with the application's pool settings.
+
+    Args:
+        url: The database URL.
+
+    Returns:
+        The engine.
+
+    """
+    engine = create_async_engine(
+        url=url,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_timeout=30,
+        pool_recycle=1800,
+    )
+    install_compiled_cache_metrics(engine=engine)
+
+    if db_settings.slow_query_log_enabled:
+        install_slow_query_log(
+            engine=engine,
+            threshold_ms=db_settings.slow_query_threshold_ms,
+            explain_sample_rate=db_settings.slow_query_explain_sample_rate,
+        )
+
+    return engine
+
+
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory of an engine.
+
+    Args:
+        engine: The engine.
+
+    Returns:
+        The session factory.
+
+    """
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+async_engine = create_engine(url=db_settings.url)
+
+async_session = create_session_factory(engine=async_engine)
+
+# One session factory per shard, in shard order; shard 0 is the database above.
+shard_sessions = [
+    async_session,
+    *(
+        create_session_factory(engine=create_engine(url=url))
+        for url in db_settings.shard_urls
+    ),
+]
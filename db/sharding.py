@@ -0,0 +1,39 @@
+import hashlib
+
+
+def shard_of(id: int, shard_count: int) -> int:
+    """Get the shard holding a question or answer by its ID.
+
+    The ID sequences of shard ``k`` hand out ``k + 1``, ``k + 1 + shard_count``
+    and so on (see ``ShardUsecase.configure_ids``), so an ID alone tells its
+    shard. Answers are stored on the shard of their question.
+
+    Args:
+        id: The question or answer ID.
+        shard_count: The number of shards.
+
+    Returns:
+        The shard number.
+
+    """
+    return (id - 1) % shard_count
+
+
+def shard_for_text(text: str, shard_count: int) -> int:
+    """Get the shard a new question is created on.
+
+    Questions are placed by their normalized text, so duplicates of a question
+    always meet it on the same shard and the duplicate check stays local.
+
+    Args:
+        text: The question text.
+        shard_count: The number of shards.
+
+    Returns:
+        The shard number.
+
+    """
+    normalized = " ".join(text.split()).lower()
+    digest = hashlib.md5(normalized.encode(), usedforsecurity=False).digest()
+
+    return int.from_bytes(digest[:8]) % shard_count
@@ -1,5 +1,20 @@
 from exceptions.answer import AnswerNotFoundError
 from exceptions.base import BaseError
-from exceptions.question import QuestionNotFoundError
+from exceptions.export import ExportFormatUnavailableError
+from exceptions.idempotency import (
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError,
+)
+from exceptions.pagination import InvalidCursorError
+from exceptions.question import DuplicateQuestionError, QuestionNotFoundError
 
-__all__ = ["BaseError", "QuestionNotFoundError", "AnswerNotFoundError"]
+__all__ = [
+    "BaseError",
+    "QuestionNotFoundError",
+    "DuplicateQuestionError",
+    "AnswerNotFoundError",
+    "InvalidCursorError",
+    "IdempotencyKeyMismatchError",
+    "IdempotencyKeyInProgressError",
+    "ExportFormatUnavailableError",
+]
@@ -0,0 +1,12 @@
+from http import HTTPStatus
+
+from exceptions.base import BaseError
+
+
+class ExportFormatUnavailableError(BaseError):
+    def __init__(
+        self,
+        message: str = "Parquet export requires the optional pyarrow dependency",
+        status_code: HTTPStatus = HTTPStatus.NOT_IMPLEMENTED,
+    ):
+        super().__init__(message=message, status_code=status_code)
@@ -0,0 +1,21 @@
+from http import HTTPStatus
+
+from exceptions.base import BaseError
+
+
+class IdempotencyKeyMismatchError(BaseError):
+    def __init__(
+        self,
+        message: str = "Idempotency key was already used for a different request",
+        status_code: HTTPStatus = HTTPStatus.UNPROCESSABLE_ENTITY,
+    ):
+        super().__init__(message=message, status_code=status_code)
+
+
+class IdempotencyKeyInProgressError(BaseError):
+    def __init__(
+        self,
+        message: str = "A request with this idempotency key is in progress",
+        status_code: HTTPStatus = HTTPStatus.CONFLICT,
+    ):
+        super().__init__(message=message, status_code=status_code)
@@ -0,0 +1,12 @@
+from http import HTTPStatus
+
+from exceptions.base import BaseError
+
+
+class InvalidCursorError(BaseError):
+    def __init__(
+        self,
+        message: str = "Invalid pagination cursor",
+        status_code: HTTPStatus = HTTPStatus.UNPROCESSABLE_ENTITY,
+    ):
+        super().__init__(message=message, status_code=status_code)
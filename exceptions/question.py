@@ -10,3 +10,12 @@ class QuestionNotFoundError(BaseError):
         status_code: HTTPStatus = HTTPStatus.NOT_FOUND,
     ):
         super().__init__(message=message, status_code=status_code)
+
+
+class DuplicateQuestionError(BaseError):
+    def __init__(
+        self,
+        message: str = "Question already exists",
+        status_code: HTTPStatus = HTTPStatus.CONFLICT,
+    ):
+        super().__init__(message=message, status_code=status_code)
@@ -1,6 +1,30 @@
-bind = "0.0.0.0:8000"
-worker_class = "uvicorn.workers.UvicornWorker"
-worker_connections = 500
-max_requests = 2000
-max_requests_jitter = 400
-timeout = 300
+import time
+
+from settings import server_settings
+
+config_loaded_at = time.perf_counter()
+
+bind = server_settings.bind
+workers = server_settings.worker_count
+worker_class = "server.ServerWorker"
+worker_connections = server_settings.worker_connections
+max_requests = server_settings.max_requests
+max_requests_jitter = server_settings.max_requests_jitter if max_requests else 0
+timeout = server_settings.timeout
+keepalive = server_settings.keepalive
+preload_app = server_settings.preload_app
+
+
+def when_ready(server) -> None:
+    """Log how long the master took to get ready, app import included.
+
+    Args:
+        server: The gunicorn arbiter.
+
+    """
+    server.log.info(
+        "Ready in %.3f s with %s workers, app preloaded: %s",
+        time.perf_counter() - config_loaded_at,
+        workers,
+        preload_app,
+    )
@@ -0,0 +1,93 @@
+from jobs.answers import archive_answers, create_answer_partitions
+from jobs.export import export_questions
+from jobs.idempotency import purge_idempotency_keys
+from jobs.questions import (
+    compact_answer_counters,
+    purge_deleted_questions,
+    repair_answer_stats,
+    update_trending,
+)
+from jobs.scheduler import JobScheduler, PeriodicJob
+from jobs.shards import configure_shards
+from settings import (
+    idempotency_settings,
+    jobs_settings,
+    retention_settings,
+    trending_settings,
+)
+
+__all__ = [
+    "JobScheduler",
+    "PeriodicJob",
+    "archive_answers",
+    "compact_answer_counters",
+    "configure_shards",
+    "create_answer_partitions",
+    "export_questions",
+    "get_periodic_jobs",
+    "purge_deleted_questions",
+    "purge_idempotency_keys",
+    "repair_answer_stats",
+    "update_trending",
+]
+
+
+def get_periodic_jobs() -> list[PeriodicJob]:
+    """Get the jobs the workers run periodically.
+
+    Returns:
+        The periodic jobs.
+
+    """
+    jobs = [
+        PeriodicJob(
+            name="compact-answer-counters",
+            interval=jobs_settings.counter_compaction_interval,
+            run=lambda: compact_answer_counters(
+                batch_size=jobs_settings.counter_compaction_batch_size
+            ),
+        ),
+        PeriodicJob(
+            name="purge-deleted-questions",
+            interval=jobs_settings.question_purge_interval,
+            run=lambda: purge_deleted_questions(
+                batch_size=jobs_settings.question_purge_batch_size
+            ),
+        ),
+        PeriodicJob(
+            name="create-answer-partitions",
+            interval=jobs_settings.answer_partition_interval,
+            run=lambda: create_answer_partitions(
+                months_ahead=jobs_settings.answer_partition_months_ahead
+            ),
+        ),
+        PeriodicJob(
+            name="update-trending",
+            interval=trending_settings.interval,
+            run=lambda: update_trending(
+                batch_size=trending_settings.batch_size,
+                settle_lag=trending_settings.settle_lag,
+            ),
+        ),
+        PeriodicJob(
+            name="purge-idempotency-keys",
+            interval=idempotency_settings.purge_interval,
+            run=lambda: purge_idempotency_keys(
+                batch_size=idempotency_settings.purge_batch_size
+            ),
+        ),
+    ]
+
+    if retention_settings.enabled:
+        jobs.append(
+            PeriodicJob(
+                name="archive-answers",
+                interval=retention_settings.interval,
+                run=lambda: archive_answers(
+                    max_age_days=retention_settings.max_age_days,
+                    batch_size=retention_settings.batch_size,
+                ),
+            )
+        )
+
+    return jobs
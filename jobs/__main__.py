@@ -0,0 +1,169 @@
+"""Run a maintenance job against the configured database.
+
+Usage:
+    python -m jobs repair-answer-stats --batch-size 10000
+    python -m jobs compact-answer-counters
+    python -m jobs purge-deleted-questions
+    python -m jobs update-trending
+    python -m jobs purge-idempotency-keys
+    python -m jobs archive-answers --max-age-days 365
+    python -m jobs create-answer-partitions --months-ahead 3
+    python -m jobs configure-shards
+    python -m jobs export-questions --format parquet --output questions.parquet
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import get_args
+
+from constants.export import ExportFormat
+from jobs import (
+    archive_answers,
+    compact_answer_counters,
+    configure_shards,
+    create_answer_partitions,
+    export_questions,
+    purge_deleted_questions,
+    purge_idempotency_keys,
+    repair_answer_stats,
+    update_trending,
+)
+from settings import (
+    idempotency_settings,
+    jobs_settings,
+    retention_settings,
+    setup_logging,
+    trending_settings,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser with one subcommand per job.
+
+    Returns:
+        The parser.
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m jobs", description=__doc__)
+    subparsers = parser.add_subparsers(dest="job", required=True)
+
+    repair = subparsers.add_parser(
+        "repair-answer-stats",
+        help="Rebuild answer_count and last_answer_at of all questions",
+    )
+    repair.add_argument("--batch-size", type=int, default=10_000)
+    repair.set_defaults(
+        run=lambda args: repair_answer_stats(batch_size=args.batch_size)
+    )
+
+    compact = subparsers.add_parser(
+        "compact-answer-counters",
+        help="Fold answer counter shards into their questions",
+    )
+    compact.add_argument("--batch-size", type=int, default=1000)
+    compact.set_defaults(
+        run=lambda args: compact_answer_counters(batch_size=args.batch_size)
+    )
+
+    purge_questions = subparsers.add_parser(
+        "purge-deleted-questions",
+        help="Delete soft-deleted questions and their answers in batches",
+    )
+    purge_questions.add_argument(
+        "--batch-size", type=int, default=jobs_settings.question_purge_batch_size
+    )
+    purge_questions.set_defaults(
+        run=lambda args: purge_deleted_questions(batch_size=args.batch_size)
+    )
+
+    trending = subparsers.add_parser(
+        "update-trending", help="Score new answers for the trending questions"
+    )
+    trending.add_argument(
+        "--batch-size", type=int, default=trending_settings.batch_size
+    )
+    trending.add_argument(
+        "--settle-lag", type=float, default=trending_settings.settle_lag
+    )
+    trending.set_defaults(
+        run=lambda args: update_trending(
+            batch_size=args.batch_size, settle_lag=args.settle_lag
+        )
+    )
+
+    purge = subparsers.add_parser(
+        "purge-idempotency-keys", help="Delete expired idempotency keys"
+    )
+    purge.add_argument(
+        "--batch-size", type=int, default=idempotency_settings.purge_batch_size
+    )
+    purge.set_defaults(
+        run=lambda args: purge_idempotency_keys(batch_size=args.batch_size)
+    )
+
+    archive = subparsers.add_parser(
+        "archive-answers", help="Move old answers into the answers archive"
+    )
+    archive.add_argument(
+        "--max-age-days", type=int, default=retention_settings.max_age_days
+    )
+    archive.add_argument(
+        "--batch-size", type=int, default=retention_settings.batch_size
+    )
+    archive.set_defaults(
+        run=lambda args: archive_answers(
+            max_age_days=args.max_age_days, batch_size=args.batch_size
+        )
+    )
+
+    partitions = subparsers.add_parser(
+        "create-answer-partitions",
+        help="Create the monthly partitions of answers ahead of time",
+    )
+    partitions.add_argument(
+        "--months-ahead", type=int, default=jobs_settings.answer_partition_months_ahead
+    )
+    partitions.set_defaults(
+        run=lambda args: create_answer_partitions(months_ahead=args.months_ahead)
+    )
+
+    shards = subparsers.add_parser(
+        "configure-shards",
+        help="Make every shard hand out IDs that route back to it",
+    )
+    shards.set_defaults(run=lambda args: configure_shards())
+
+    export = subparsers.add_parser(
+        "export-questions",
+        help="Export questions with their answers as CSV, NDJSON or Parquet",
+    )
+    export.add_argument("--format", choices=get_args(ExportFormat), default="ndjson")
+    export.add_argument("--output", type=Path, help="Output file instead of stdout")
+    export.add_argument(
+        "--created-from",
+        type=datetime.fromisoformat,
+        help="Only questions created at or after this date",
+    )
+    export.add_argument(
+        "--created-to",
+        type=datetime.fromisoformat,
+        help="Only questions created before this date",
+    )
+    export.set_defaults(
+        run=lambda args: export_questions(
+            format=args.format,
+            output=args.output,
+            created_from=args.created_from,
+            created_to=args.created_to,
+        )
+    )
+
+    return parser
+
+
+if __name__ == "__main__":
+    setup_logging()
+    args = build_parser().parse_args()
+    asyncio.run(args.run(args))
@@ -0,0 +1,41 @@
+from datetime import date, timedelta
+
+from jobs.shards import run_on_shards
+from usecases import AnswerUsecase
+
+
+async def archive_answers(max_age_days: int, batch_size: int) -> int:
+    """Move the answers older than a maximum age into the archive.
+
+    Args:
+        max_age_days: Answers created more days ago than this are archived.
+        batch_size: The number of answers moved per transaction.
+
+    Returns:
+        The number of archived answers.
+
+    """
+    return await run_on_shards(
+        lambda session: AnswerUsecase().archive_old(
+            session=session,
+            max_age=timedelta(days=max_age_days),
+            batch_size=batch_size,
+        )
+    )
+
+
+async def create_answer_partitions(months_ahead: int) -> int:
+    """Create the missing monthly partitions of answers.
+
+    Args:
+        months_ahead: The number of months after the current one to create.
+
+    Returns:
+        The number of created partitions.
+
+    """
+    return await run_on_shards(
+        lambda session: AnswerUsecase().create_partitions(
+            session=session, today=date.today(), months_ahead=months_ahead
+        )
+    )
@@ -0,0 +1,46 @@
+import sys
+from contextlib import AsyncExitStack
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from constants.export import ExportFormat
+from db.sessions import shard_sessions
+from usecases import ExportUsecase
+
+
+async def export_questions(
+    format: ExportFormat,
+    output: Path | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> None:
+    """Export questions with their answers to a file or stdout.
+
+    Args:
+        format: The export format.
+        output: The output file; stdout if not given.
+        created_from: Only questions created at or after this date.
+        created_to: Only questions created before this date.
+
+    """
+    usecase = ExportUsecase()
+    usecase.check_format(format=format)
+
+    file: BinaryIO = output.open("wb") if output is not None else sys.stdout.buffer
+
+    try:
+        async with AsyncExitStack() as stack:
+            sessions = [
+                await stack.enter_async_context(factory()) for factory in shard_sessions
+            ]
+            async for chunk in usecase.export(
+                sessions=sessions,
+                format=format,
+                created_from=created_from,
+                created_to=created_to,
+            ):
+                file.write(chunk)
+    finally:
+        if output is not None:
+            file.close()
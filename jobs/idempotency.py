@@ -0,0 +1,16 @@
+from db.sessions import async_session
+from usecases import IdempotencyUsecase
+
+
+async def purge_idempotency_keys(batch_size: int) -> int:
+    """Delete the idempotency keys whose responses are no longer replayed.
+
+    Args:
+        batch_size: The number of keys deleted per transaction.
+
+    Returns:
+        The number of deleted keys.
+
+    """
+    async with async_session() as session:
+        return await IdempotencyUsecase().purge(session=session, batch_size=batch_size)
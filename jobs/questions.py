@@ -0,0 +1,71 @@
+from jobs.shards import run_on_shards
+from usecases import QuestionUsecase, TrendingUsecase
+
+
+async def repair_answer_stats(batch_size: int) -> int:
+    """Rebuild the denormalized answer stats of all questions.
+
+    Args:
+        batch_size: The number of question IDs repaired per transaction.
+
+    Returns:
+        The number of questions whose values were wrong.
+
+    """
+    return await run_on_shards(
+        lambda session: QuestionUsecase().repair_answer_stats(
+            session=session, batch_size=batch_size
+        )
+    )
+
+
+async def compact_answer_counters(batch_size: int) -> int:
+    """Fold all answer counter shards into their questions.
+
+    Args:
+        batch_size: The number of questions compacted per transaction.
+
+    Returns:
+        The number of compacted questions.
+
+    """
+    return await run_on_shards(
+        lambda session: QuestionUsecase().compact_answer_counters(
+            session=session, batch_size=batch_size
+        )
+    )
+
+
+async def purge_deleted_questions(batch_size: int) -> int:
+    """Purge the soft-deleted questions and their answers.
+
+    Args:
+        batch_size: The number of answers deleted per transaction.
+
+    Returns:
+        The number of purged questions.
+
+    """
+    return await run_on_shards(
+        lambda session: QuestionUsecase().purge_deleted(
+            session=session, batch_size=batch_size
+        )
+    )
+
+
+async def update_trending(batch_size: int, settle_lag: float) -> int:
+    """Score the answers created since the last trending update.
+
+    Args:
+        batch_size: The number of answers scored per transaction.
+        settle_lag: Only score answers at least this many seconds old.
+
+    Returns:
+        The number of scored answers.
+
+    """
+    return await run_on_shards(
+        lambda session: TrendingUsecase().update(
+            session=session, batch_size=batch_size, settle_lag=settle_lag
+        )
+    )
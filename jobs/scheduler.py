@@ -0,0 +1,92 @@
+import asyncio
+import zlib
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from settings import get_logger
+
+logger = get_logger(__name__)
+
+
+class PeriodicJob:
+    def __init__(self, name: str, interval: float, run: Callable[[], Awaitable[Any]]):
+        self.name = name
+        self.interval = interval
+        self.run = run
+
+    @property
+    def lock_key(self) -> int:
+        """Get the advisory lock key that serializes runs across workers.
+
+        Returns:
+            A stable 32-bit key derived from the job name.
+
+        """
+        return zlib.crc32(self.name.encode())
+
+
+class JobScheduler:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        jobs: list[PeriodicJob],
+    ):
+        self.session_factory = session_factory
+        self.jobs = jobs
+
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Run every job on its interval in the background.
+
+        Every worker runs the scheduler, but a run only happens in the worker that
+        takes the job's transaction-level advisory lock, so a job never runs
+        twice at the same time.
+
+        """
+        self._tasks = [
+            asyncio.create_task(self._loop(job=job), name=f"job:{job.name}")
+            for job in self.jobs
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the scheduled jobs and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_once(self, job: PeriodicJob) -> bool:
+        """Run a job unless another worker is running it.
+
+        Args:
+            job: The job.
+
+        Returns:
+            True if the job ran, False if another worker holds its lock.
+
+        """
+        async with self.session_factory() as session, session.begin():
+            locked = await session.scalar(
+                statement=select(func.pg_try_advisory_xact_lock(job.lock_key))
+            )
+            if not locked:
+                return False
+
+            logger.info("⏲️ Running job %s", job.name)
+            result = await job.run()
+            logger.info("✅ Finished job %s: %s", job.name, result)
+
+        return True
+
+    async def _loop(self, job: PeriodicJob) -> None:
+        while True:
+            await asyncio.sleep(job.interval)
+
+            try:
+                await self.run_once(job=job)
+            except Exception:
+                logger.exception("❌ Job %s failed", job.name)
@@ -0,0 +1,43 @@
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.sessions import shard_sessions
+from usecases import ShardUsecase
+
+
+async def run_on_shards(operation: Callable[[AsyncSession], Awaitable[int]]) -> int:
+    """Run a job on every shard in turn.
+
+    Args:
+        operation: The job, called with a session of each shard.
+
+    Returns:
+        The sum of the results of every shard.
+
+    """
+    total = 0
+
+    for session_factory in shard_sessions:
+        async with session_factory() as session:
+            total += await operation(session)
+
+    return total
+
+
+async def configure_shards() -> int:
+    """Make every shard hand out question and answer IDs that route back to it.
+
+    Returns:
+        The number of shards.
+
+    """
+    usecase = ShardUsecase()
+
+    for shard, session_factory in enumerate(shard_sessions):
+        async with session_factory() as session:
+            await usecase.configure_ids(
+                session=session, shard=shard, shard_count=len(shard_sessions)
+            )
+
+    return len(shard_sessions)
@@ -1,14 +1,53 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from api.routers import answers, questions
+from api.routers import answers, export, metrics, questions, search, users
+from db.notifications import answer_broadcasters
+from db.sessions import async_session
 from exceptions import BaseError
-from settings import setup_logging
+from jobs import JobScheduler, get_periodic_jobs
+from monitoring import EventLoopMonitor, ProfilingMiddleware
+from settings import jobs_settings, monitoring_settings, setup_logging
 
 setup_logging()
 
-app = FastAPI(title="Questions App")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Start and stop the background services of a worker.
+
+    Args:
+        app: The application.
+
+    Yields:
+        Control while the application is serving.
+
+    """
+    loop_monitor = EventLoopMonitor(
+        interval=monitoring_settings.loop_lag_interval,
+        threshold=monitoring_settings.loop_lag_threshold,
+    )
+
+    scheduler = JobScheduler(session_factory=async_session, jobs=get_periodic_jobs())
+
+    if monitoring_settings.loop_lag_enabled:
+        loop_monitor.start()
+    if jobs_settings.enabled:
+        scheduler.start()
+
+    yield
+
+    await scheduler.stop()
+    for answer_broadcaster in answer_broadcasters:
+        await answer_broadcaster.stop()
+    await loop_monitor.stop()
+
+
+app = FastAPI(title="Questions App", lifespan=lifespan)
 
 app.add_middleware(
     middleware_class=CORSMiddleware,
@@ -18,6 +57,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if monitoring_settings.profiling_secret:
+    app.add_middleware(
+        middleware_class=ProfilingMiddleware,
+        secret=monitoring_settings.profiling_secret,
+        interval=monitoring_settings.profiling_interval,
+        output_dir=monitoring_settings.profiling_output_dir,
+    )
+
 
 @app.exception_handler(exc_class_or_status_code=BaseError)
 async def exception_handler(request: Request, exc: BaseError) -> JSONResponse:
@@ -36,3 +83,7 @@ async def exception_handler(request: Request, exc: BaseError) -> JSONResponse:
 
 app.include_router(router=questions.router)
 app.include_router(router=answers.router)
+app.include_router(router=users.router)
+app.include_router(router=search.router)
+app.include_router(router=export.router)
+app.include_router(router=metrics.router)
@@ -0,0 +1,4 @@
+from monitoring.loop import EventLoopMonitor
+from monitoring.profiling import ProfilingMiddleware
+
+__all__ = ["EventLoopMonitor", "ProfilingMiddleware"]
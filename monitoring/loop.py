@@ -0,0 +1,80 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+
+from monitoring.metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS
+from settings import get_logger
+
+logger = get_logger(__name__)
+
+
+class EventLoopMonitor:
+    def __init__(self, interval: float, threshold: float):
+        self.interval = interval
+        self.threshold = threshold
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id = 0
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start watching the running event loop from a background thread.
+
+        The thread schedules a callback on the loop every interval and records how
+        long the loop took to run it. When the callback is not run within the
+        threshold, the stack of the loop thread is logged, which points at the
+        coroutine step or sync call that is holding the loop.
+
+        """
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+
+        self._watchdog = threading.Thread(
+            target=self._watch, name="event-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the watchdog thread."""
+        self._stopped.set()
+
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    def _report_stall(self) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+
+        EVENT_LOOP_STALLS.inc()
+        logger.warning(
+            "🧊 Event loop blocked for over %.0f ms in:\n%s",
+            self.threshold * 1000,
+            "".join(traceback.format_stack(f=frame)),
+        )
+
+    def _watch(self) -> None:
+        pong = threading.Event()
+
+        while self._loop is not None and not self._stopped.wait(timeout=self.interval):
+            pong.clear()
+            sent = time.perf_counter()
+
+            try:
+                self._loop.call_soon_threadsafe(pong.set)
+            except RuntimeError:
+                return
+
+            if not pong.wait(timeout=self.threshold):
+                self._report_stall()
+
+                while not pong.wait(timeout=self.interval):
+                    if self._stopped.is_set():
+                        return
+
+            EVENT_LOOP_LAG.observe(time.perf_counter() - sent)
@@ -0,0 +1,19 @@
+from prometheus_client import Counter, Histogram
+
+EVENT_LOOP_LAG = Histogram(
+    name="event_loop_lag_seconds",
+    documentation="Delay between when a loop callback was due and when it ran",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+EVENT_LOOP_STALLS = Counter(
+    name="event_loop_stalls_total",
+    documentation="Times the event loop stayed blocked past the stall threshold",
+)
+
+DB_COMPILED_CACHE = Counter(
+    name="db_compiled_cache_total",
+    documentation="Executed statements by SQLAlchemy compiled cache outcome, "
+    "e.g. cache_hit or cache_miss",
+    labelnames=("outcome",),
+)
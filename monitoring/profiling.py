@@ -0,0 +1,154 @@
+import asyncio
+import hmac
+import time
+import uuid
+from pathlib import Path
+
+from pyinstrument import Profiler
+from pyinstrument.frame import Frame
+from pyinstrument.renderers import SpeedscopeRenderer
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from settings import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+PHASE_ROUTING = "routing"
+PHASES = (
+    ("repository", ("/db/repositories/", "/sqlalchemy/", "/asyncpg/")),
+    ("dependencies", ("/api/dependencies/", "/fastapi/dependencies/")),
+    ("usecase", ("/usecases/",)),
+    ("serialization", ("/pydantic/", "/pydantic_core/", "/api/schemas/")),
+)
+SERIALIZATION_FUNCTIONS = ("serialize_response", "jsonable_encoder", "render")
+
+
+def _phase_of(frame: Frame) -> str | None:
+    if frame.function in SERIALIZATION_FUNCTIONS:
+        return "serialization"
+
+    file_path = (frame.file_path or "").replace("\\", "/")
+    for phase, markers in PHASES:
+        if any(marker in file_path for marker in markers):
+            return phase
+
+    return None
+
+
+def split_into_phases(root: Frame | None) -> dict[str, float]:
+    """Split the sampled time of a request into application phases.
+
+    Each frame's own time is attributed to the innermost enclosing frame that
+    belongs to a known phase; everything else counts as routing.
+
+    Args:
+        root: The root frame of the profile.
+
+    Returns:
+        The seconds spent per phase.
+
+    """
+    totals = {PHASE_ROUTING: 0.0, **{phase: 0.0 for phase, _ in PHASES}}
+    stack = [(root, PHASE_ROUTING)] if root is not None else []
+
+    while stack:
+        frame, inherited = stack.pop()
+        phase = _phase_of(frame=frame) or inherited
+
+        totals[phase] += frame.time - sum(child.time for child in frame.children)
+        stack.extend((child, phase) for child in frame.children)
+
+    return totals
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp, secret: str, interval: float, output_dir: Path):
+        self.app = app
+        self.secret = secret
+        self.interval = interval
+        self.output_dir = output_dir
+
+    def _is_requested(self, scope: Scope) -> bool:
+        if scope["type"] != "http":
+            return False
+
+        provided = Headers(scope=scope).get(PROFILE_HEADER)
+        return provided is not None and hmac.compare_digest(
+            provided.encode(), self.secret.encode()
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Profile requests that carry the profiling secret.
+
+        The response start is held back until the first body chunk, when the
+        profiler stops, so that the profile ID and the per-phase
+        ``Server-Timing`` header can be attached to it. The rest of the response
+        is passed through as it comes, so streamed responses are profiled up to
+        their first chunk and never buffered.
+
+        Args:
+            scope: The ASGI scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
+
+        """
+        if not self._is_requested(scope=scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        start: Message | None = None
+
+        async def send_profiled(message: Message) -> None:
+            nonlocal start
+
+            if not profiler.is_running:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            headers = await self._finish(profiler=profiler, scope=scope)
+            if start is not None:
+                MutableHeaders(scope=start).update(headers)
+                await send(start)
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_profiled)
+        finally:
+            if profiler.is_running:
+                profiler.stop()
+
+    async def _finish(self, profiler: Profiler, scope: Scope) -> dict[str, str]:
+        session = profiler.stop()
+        phases = split_into_phases(root=session.root_frame())
+        profile_id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+
+        await asyncio.to_thread(
+            self._store,
+            profile_id=profile_id,
+            content=SpeedscopeRenderer().render(session=session),
+        )
+
+        logger.info(
+            "🔥 Profiled %s %s as %s", scope["method"], scope["path"], profile_id
+        )
+
+        return {
+            PROFILE_ID_HEADER: profile_id,
+            "Server-Timing": ", ".join(
+                f"{phase};dur={seconds * 1000:.2f}" for phase, seconds in phases.items()
+            ),
+        }
+
+    def _store(self, profile_id: str, content: str) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / f"{profile_id}.speedscope.json").write_text(content)
@@ -0,0 +1,3 @@
+from server.worker import ServerWorker
+
+__all__ = ["ServerWorker"]
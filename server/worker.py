@@ -0,0 +1,14 @@
+from uvicorn.workers import UvicornWorker
+
+from settings import server_settings
+
+
+class ServerWorker(UvicornWorker):
+    """A uvicorn worker using the event loop and HTTP parser of the settings.
+
+    The defaults, uvloop and httptools, are the fastest implementations.
+    Pinning them makes a missing one fail the worker boot instead of silently
+    falling back to asyncio and h11.
+    """
+
+    CONFIG_KWARGS = {"loop": server_settings.loop, "http": server_settings.http}
@@ -1,8 +1,27 @@
 from settings.db import db_settings
-from settings.logging import get_logger, setup_logging
+from settings.feed import feed_settings
+from settings.idempotency import idempotency_settings
+from settings.jobs import jobs_settings
+from settings.logging import get_logger, logging_settings, setup_logging
+from settings.monitoring import monitoring_settings
+from settings.questions import question_settings
+from settings.retention import retention_settings
+from settings.server import server_settings
+from settings.stream import stream_settings
+from settings.trending import trending_settings
 
 __all__ = [
     "db_settings",
+    "feed_settings",
+    "idempotency_settings",
+    "jobs_settings",
+    "logging_settings",
+    "monitoring_settings",
+    "question_settings",
+    "retention_settings",
+    "server_settings",
+    "stream_settings",
+    "trending_settings",
     "setup_logging",
     "get_logger",
 ]
@@ -13,6 +13,25 @@ class DbSettings(BaseSettings):
     password: str = Field(default="postgres", title="Database password")
     name: str = Field(default="auth", title="Database name")
 
+    shard_urls: list[str] = Field(
+        default=[],
+        title="SQLAlchemy URLs of the databases of shards 1 and up; the database "
+        "above is shard 0",
+    )
+
+    slow_query_log_enabled: bool = Field(
+        default=False, title="Log statements slower than the threshold"
+    )
+    slow_query_threshold_ms: float = Field(
+        default=500, title="Slow statement threshold in milliseconds", ge=0
+    )
+    slow_query_explain_sample_rate: float = Field(
+        default=0.0,
+        title="Fraction of slow SELECT statements captured with EXPLAIN ANALYZE",
+        ge=0,
+        le=1,
+    )
+
     @property
     def url(self) -> str:
         return (
@@ -24,5 +43,23 @@ class DbSettings(BaseSettings):
             f"{self.name}"
         )
 
+    @property
+    def dsn(self) -> str:
+        return self.url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+    @property
+    def shard_count(self) -> int:
+        return 1 + len(self.shard_urls)
+
+    @property
+    def shard_dsns(self) -> list[str]:
+        return [
+            self.dsn,
+            *(
+                url.replace("postgresql+asyncpg://", "postgresql://", 1)
+                for url in self.shard_urls
+            ),
+        ]
+
 
 db_settings = DbSettings()
@@ -0,0 +1,18 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class FeedSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="feed_")
+
+    settle_lag: float = Field(
+        default=5.0,
+        title="Seconds an answer must be old before the feed returns it, so "
+        "pollers do not skip answers of transactions still in flight",
+        ge=0,
+    )
+
+
+feed_settings = FeedSettings()
@@ -0,0 +1,30 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class IdempotencySettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="idempotency_")
+
+    ttl: float = Field(
+        default=24 * 60 * 60,
+        title="Seconds a stored response is replayed for a retried request",
+        gt=0,
+    )
+    pending_timeout: float = Field(
+        default=60.0,
+        title="Seconds after which a request that never finished stops blocking "
+        "retries with its key",
+        gt=0,
+    )
+
+    purge_interval: float = Field(
+        default=60 * 60, title="Seconds between purges of expired keys", gt=0
+    )
+    purge_batch_size: int = Field(
+        default=10_000, title="Expired keys deleted per transaction", gt=0
+    )
+
+
+idempotency_settings = IdempotencySettings()
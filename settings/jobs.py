@@ -0,0 +1,40 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class JobsSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="jobs_")
+
+    enabled: bool = Field(
+        default=True, title="Run periodic maintenance jobs inside the workers"
+    )
+
+    counter_compaction_interval: float = Field(
+        default=60.0, title="Seconds between answer counter compactions", gt=0
+    )
+    counter_compaction_batch_size: int = Field(
+        default=1000, title="Questions compacted per transaction", gt=0
+    )
+
+    question_purge_interval: float = Field(
+        default=10.0, title="Seconds between purges of deleted questions", gt=0
+    )
+    question_purge_batch_size: int = Field(
+        default=5000,
+        title="Answers of a deleted question deleted per transaction",
+        gt=0,
+    )
+
+    answer_partition_interval: float = Field(
+        default=86400.0, title="Seconds between runs creating answer partitions", gt=0
+    )
+    answer_partition_months_ahead: int = Field(
+        default=3,
+        title="Monthly answer partitions created ahead of the current month",
+        ge=0,
+    )
+
+
+jobs_settings = JobsSettings()
@@ -1,14 +1,211 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
+from datetime import datetime, timezone
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+REROUTED_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+
+class LoggingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="log_")
+
+    level: str = Field(default="INFO", title="Root log level")
+    format: Literal["json", "text"] = Field(default="json", title="Output format")
+    queue_size: int = Field(
+        default=10000, title="Maximum records buffered before dropping", gt=0
+    )
+    sample_rates: dict[str, float] = Field(
+        default_factory=dict,
+        title="Fraction of records below WARNING kept, by logger name prefix",
+    )
+
+
+logging_settings = LoggingSettings()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a single JSON line.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            The JSON encoded record.
+
+        """
+        payload = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        elif record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self._rates = rates
+        self._resolved: dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._resolved.get(name)
+
+        if rate is None:
+            prefix = name
+            while prefix and prefix not in self._rates:
+                prefix = prefix.rpartition(".")[0]
+            rate = self._resolved[name] = self._rates.get(prefix, 1.0)
+
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep warnings and errors, sample everything else per logger.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            True if the record should be emitted.
+
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+
+        rate = self._rate(name=record.name)
+        return rate >= 1 or random.random() < rate  # noqa: S311
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    _exception_formatter = logging.Formatter()
+
+    def __init__(self, queue: queue.Queue):
+        super().__init__(queue=queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Make a copy of a record that is safe to hand to the listener thread.
+
+        The message is merged with its arguments and the traceback rendered into
+        ``exc_text``, so the record no longer references live objects. Unlike
+        ``QueueHandler.prepare``, the traceback is kept apart from the message,
+        for the formatters to place it.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            The prepared copy.
+
+        """
+        record = copy.copy(record)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record without blocking, dropping it if the queue is full.
+
+        Args:
+            record: The log record.
+
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()
+
+
+def _restart_listener_after_fork() -> None:
+    if _listener is None:
+        return
+
+    records = queue.Queue(maxsize=logging_settings.queue_size)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DroppingQueueHandler):
+            handler.queue = records
+
+    _listener.queue = records
+    _listener._thread = None  # type: ignore[attr-defined]
+    _listener.start()
+
+
+atexit.register(_stop_listener)
+os.register_at_fork(after_in_child=_restart_listener_after_fork)
 
 
 def setup_logging() -> None:
-    """Setup logging for the application."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
+    """Setup logging for the application.
+
+    Records are handed to a bounded queue on the calling thread and written to
+    stdout by a listener thread, so the event loop never blocks on log I/O.
+
+    """
+    global _listener  # noqa: PLW0603
+
+    _stop_listener()
+
+    records = queue.Queue(maxsize=logging_settings.queue_size)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        JsonFormatter()
+        if logging_settings.format == "json"
+        else logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+
+    queue_handler = DroppingQueueHandler(queue=records)
+    queue_handler.addFilter(SamplingFilter(rates=logging_settings.sample_rates))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(logging_settings.level.upper())
+
+    for name in REROUTED_LOGGERS:
+        logger = logging.getLogger(name)
+        if logger.handlers:
+            logger.handlers = []
+            logger.propagate = True
+
+    _listener = logging.handlers.QueueListener(
+        records, stream_handler, respect_handler_level=True
     )
+    _listener.start()
 
 
 def get_logger(name: str) -> logging.Logger:
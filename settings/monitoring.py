@@ -0,0 +1,36 @@
+import tempfile
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class MonitoringSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="monitoring_")
+
+    loop_lag_enabled: bool = Field(default=True, title="Monitor event-loop lag")
+    loop_lag_interval: float = Field(
+        default=0.5, title="Event-loop lag probe interval in seconds", gt=0
+    )
+    loop_lag_threshold: float = Field(
+        default=0.1,
+        title="Event-loop block duration in seconds that triggers a stack capture",
+        gt=0,
+    )
+
+    profiling_secret: str | None = Field(
+        default=None,
+        title="Shared secret that enables profiling via the X-Profile header",
+    )
+    profiling_interval: float = Field(
+        default=0.001, title="Profiler sampling interval in seconds", gt=0
+    )
+    profiling_output_dir: Path = Field(
+        default=Path(tempfile.gettempdir()) / "profiles",
+        title="Directory for speedscope profiles",
+    )
+
+
+monitoring_settings = MonitoringSettings()
@@ -0,0 +1,19 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from constants.questions import DuplicatePolicy
+
+from .base import BaseSettings
+
+
+class QuestionSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="question_")
+
+    duplicate_policy: DuplicatePolicy = Field(
+        default="reject",
+        title="What creating a question with the text of an existing one does: "
+        "reject it, return the existing question or allow the duplicate",
+    )
+
+
+question_settings = QuestionSettings()
@@ -0,0 +1,25 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class RetentionSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="retention_")
+
+    enabled: bool = Field(
+        default=False, title="Periodically move old answers into the archive"
+    )
+    max_age_days: int = Field(
+        default=365, title="Days after which an answer is archived", gt=0
+    )
+
+    interval: float = Field(
+        default=60 * 60, title="Seconds between answer archiving runs", gt=0
+    )
+    batch_size: int = Field(
+        default=5000, title="Answers archived per transaction", gt=0
+    )
+
+
+retention_settings = RetentionSettings()
@@ -0,0 +1,64 @@
+import os
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class ServerSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="server_")
+
+    bind: str = Field(default="0.0.0.0:8000", title="Address gunicorn listens on")
+    workers: int = Field(
+        default=0, title="Number of workers; 0 sizes them from the available CPUs", ge=0
+    )
+    workers_per_cpu: float = Field(
+        default=1.0, title="Workers per available CPU when workers is 0", gt=0
+    )
+    worker_connections: int = Field(
+        default=500, title="Maximum concurrent connections per worker", gt=0
+    )
+    max_requests: int = Field(
+        default=2000,
+        title="Requests a worker serves before it is recycled; 0 disables recycling",
+        ge=0,
+    )
+    max_requests_jitter: int = Field(
+        default=400, title="Random extra requests before a worker is recycled", ge=0
+    )
+    timeout: int = Field(
+        default=300, title="Seconds a silent worker lives before it is killed", gt=0
+    )
+    keepalive: int = Field(
+        default=5, title="Seconds an idle keep-alive connection is kept open", gt=0
+    )
+    preload_app: bool = Field(
+        default=True, title="Import the app once in the master before forking workers"
+    )
+    loop: Literal["auto", "asyncio", "uvloop"] = Field(
+        default="uvloop", title="Event loop of the uvicorn workers"
+    )
+    http: Literal["auto", "h11", "httptools"] = Field(
+        default="httptools", title="HTTP protocol implementation of the uvicorn workers"
+    )
+
+    @property
+    def worker_count(self) -> int:
+        """Get the number of workers to run.
+
+        Returns:
+            The configured number, or the available CPUs times
+            ``workers_per_cpu``, at least one.
+
+        """
+        if self.workers:
+            return self.workers
+
+        cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 0
+
+        return max(1, round((cpus or os.cpu_count() or 1) * self.workers_per_cpu))
+
+
+server_settings = ServerSettings()
@@ -0,0 +1,20 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class StreamSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="stream_")
+
+    buffer_size: int = Field(
+        default=100,
+        title="Answers buffered per client before a slow client is disconnected",
+        gt=0,
+    )
+    heartbeat_interval: float = Field(
+        default=15.0, title="Seconds between keep-alive comments on idle streams", gt=0
+    )
+
+
+stream_settings = StreamSettings()
@@ -0,0 +1,31 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class TrendingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="trending_")
+
+    half_life: float = Field(
+        default=6 * 60 * 60, title="Seconds after which an answer counts half", gt=0
+    )
+    min_score: float = Field(
+        default=0.01, title="Decayed score below which a question is dropped", gt=0
+    )
+
+    interval: float = Field(
+        default=10.0, title="Seconds between trending score updates", gt=0
+    )
+    batch_size: int = Field(
+        default=10_000, title="Answers read per trending update transaction", gt=0
+    )
+    settle_lag: float = Field(
+        default=5.0,
+        title="Seconds an answer must be old before it is scored, so answers of "
+        "transactions still in flight are not skipped",
+        ge=0,
+    )
+
+
+trending_settings = TrendingSettings()
@@ -12,7 +12,9 @@ from testcontainers.postgres import PostgresContainer
 
 from api.dependencies import db
 from db.models import Base
+from db.notifications import AnswerBroadcaster
 from main import app
+from tests.containers import get_async_url, get_dsn
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -25,12 +27,7 @@ async def postgres_container() -> AsyncGenerator[PostgresContainer, None]:
 async def test_engine(
     postgres_container: PostgresContainer,
 ) -> AsyncGenerator[AsyncEngine, None]:
-    engine = create_async_engine(
-        url=postgres_container.get_connection_url().replace(
-            "postgresql+psycopg2://", "postgresql+asyncpg://", 1
-        ),
-        echo=False,
-    )
+    engine = create_async_engine(url=get_async_url(postgres_container), echo=False)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -53,12 +50,30 @@ async def test_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession,
         yield session
 
 
+@pytest_asyncio.fixture(scope="function")
+async def broadcaster(
+    postgres_container: PostgresContainer, test_engine: AsyncEngine
+) -> AsyncGenerator[AnswerBroadcaster, None]:
+    broadcaster = AnswerBroadcaster(
+        dsn=get_dsn(container=postgres_container),
+        session_factory=async_sessionmaker(test_engine, expire_on_commit=False),
+        buffer_size=1,
+    )
+
+    yield broadcaster
+
+    await broadcaster.stop()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     def override_get_session():
         return test_session
 
     app.dependency_overrides[db.get_session] = override_get_session
+    app.dependency_overrides[db.get_session_factory] = lambda: async_sessionmaker(
+        test_session.bind, class_=AsyncSession, expire_on_commit=False
+    )
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
@@ -0,0 +1,31 @@
+from testcontainers.postgres import PostgresContainer
+
+
+def get_async_url(container: PostgresContainer) -> str:
+    """Get the asyncpg connection URL of a Postgres container.
+
+    Args:
+        container: The started Postgres container.
+
+    Returns:
+        The SQLAlchemy asyncpg URL.
+
+    """
+    return container.get_connection_url().replace(
+        "postgresql+psycopg2://", "postgresql+asyncpg://", 1
+    )
+
+
+def get_dsn(container: PostgresContainer) -> str:
+    """Get the libpq connection string of a Postgres container.
+
+    Args:
+        container: The started Postgres container.
+
+    Returns:
+        The connection string for plain asyncpg connections.
+
+    """
+    return container.get_connection_url().replace(
+        "postgresql+psycopg2://", "postgresql://", 1
+    )
@@ -1,9 +1,19 @@
+import asyncio
 import uuid
+from datetime import UTC, datetime, timedelta, timezone
+from http import HTTPStatus
 
 import pytest
+from sqlalchemy import func, select
 
+from api.dependencies import stream
+from api.dependencies.answer import get_answer_usecase
+from db.models import Answer
+from db.notifications import AnswerBroadcaster
+from main import app
 from tests.factories import AnswerFactory, QuestionFactory
 from tests.test_api.base import BaseTestCase
+from usecases import AnswerUsecase
 
 
 class TestCreateAnswer(BaseTestCase):
@@ -31,6 +41,32 @@ class TestCreateAnswer(BaseTestCase):
         assert data["question_id"] == question.id
         assert "created_at" in data
 
+    @pytest.mark.asyncio
+    async def test_idempotent_retry(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        answer_data = {"user_id": str(uuid.uuid4()), "text": "Use a virtualenv"}
+        headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+        first = await self.client.post(
+            url=self.url.format(id=question.id), json=answer_data, headers=headers
+        )
+        retry = await self.client.post(
+            url=self.url.format(id=question.id), json=answer_data, headers=headers
+        )
+
+        data = await self.assert_response_ok(response=first)
+        assert await self.assert_response_ok(response=retry) == data
+        assert "Idempotent-Replayed" not in first.headers
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert (
+            await self.session.scalar(
+                select(func.count())
+                .select_from(Answer)
+                .where(Answer.question_id == question.id)
+            )
+            == 1
+        )
+
     @pytest.mark.asyncio
     async def test_not_found(self) -> None:
         non_existent_question_id = 999999
@@ -72,6 +108,23 @@ class TestGetAnswerById(BaseTestCase):
         assert data["question_id"] == answer.question_id
         assert "created_at" in data
 
+    @pytest.mark.asyncio
+    async def test_fields(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        answer = await AnswerFactory.create_async(
+            session=self.session, question_id=question.id
+        )
+        expected = {"id": answer.id, "question_id": question.id}
+        self.session.expire_all()
+
+        response = await self.client.get(
+            url=self.url.format(id=expected["id"]),
+            params={"fields": "id,question_id"},
+        )
+
+        data = await self.assert_response_ok(response=response)
+        assert data == expected
+
     @pytest.mark.asyncio
     async def test_not_found(self) -> None:
         non_existent_id = 999999
@@ -110,3 +163,232 @@ class TestDeleteAnswer(BaseTestCase):
 
         data = await self.assert_response_not_found(response=response)
         assert data["detail"] == "Answer not found"
+
+
+class TestGetAnswersFeed(BaseTestCase):
+    url = "/answers/feed"
+
+    @pytest.fixture(autouse=True)
+    def no_settle_lag(self) -> None:
+        app.dependency_overrides[get_answer_usecase] = lambda: AnswerUsecase(
+            feed_settle_lag=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        question = await QuestionFactory.create_async(
+            session=self.session, text="What is Python?"
+        )
+        answers = [
+            await AnswerFactory.create_async(
+                session=self.session, question_id=question.id
+            )
+            for _ in range(3)
+        ]
+
+        response = await self.client.get(url=self.url, params={"limit": 2})
+
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data["items"]] == [
+            answers[1].id,
+            answers[2].id,
+        ]
+
+        new_answer = await AnswerFactory.create_async(
+            session=self.session, question_id=question.id
+        )
+
+        response = await self.client.get(
+            url=self.url,
+            params={
+                "since_created_at": data["since_created_at"],
+                "since_id": data["since_id"],
+            },
+        )
+
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data["items"]] == [new_answer.id]
+        assert data["has_more"] is False
+        assert data["since_id"] == new_answer.id
+
+    @pytest.mark.asyncio
+    async def test_hides_deleted_questions(self) -> None:
+        deleted = await QuestionFactory.create_async(session=self.session)
+        await AnswerFactory.create_async(session=self.session, question_id=deleted.id)
+        question = await QuestionFactory.create_async(session=self.session)
+        answer = await AnswerFactory.create_async(
+            session=self.session, question_id=question.id
+        )
+
+        await self.client.delete(url=f"/questions/{deleted.id}")
+        response = await self.client.get(url=self.url)
+
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data["items"]] == [answer.id]
+
+    @pytest.mark.asyncio
+    async def test_has_more(self) -> None:
+        question = await QuestionFactory.create_async(
+            session=self.session, text="What is Python?"
+        )
+        answers = [
+            await AnswerFactory.create_async(
+                session=self.session, question_id=question.id
+            )
+            for _ in range(3)
+        ]
+
+        response = await self.client.get(
+            url=self.url,
+            params={
+                "since_created_at": answers[0].created_at.isoformat(),
+                "since_id": answers[0].id,
+                "limit": 1,
+            },
+        )
+
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data["items"]] == [answers[1].id]
+        assert data["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_holds_back_unsettled_answers(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        answer = await AnswerFactory.create_async(
+            session=self.session, question_id=question.id
+        )
+        since_created_at = (answer.created_at - timedelta(minutes=1)).isoformat()
+        app.dependency_overrides[get_answer_usecase] = lambda: (
+            AnswerUsecase(feed_settle_lag=60)
+        )
+
+        latest = await self.client.get(url=self.url)
+        polled = await self.client.get(
+            url=self.url, params={"since_created_at": since_created_at}
+        )
+
+        assert (await self.assert_response_ok(response=latest))["items"] == []
+        data = await self.assert_response_ok(response=polled)
+        assert data["items"] == []
+        assert data["since_created_at"] == since_created_at
+
+    @pytest.mark.asyncio
+    async def test_aware_since_created_at(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        answers = [
+            await AnswerFactory.create_async(
+                session=self.session, question_id=question.id
+            )
+            for _ in range(2)
+        ]
+        since_created_at = (
+            answers[0]
+            .created_at.replace(tzinfo=UTC)
+            .astimezone(timezone(timedelta(hours=2)))
+        )
+
+        response = await self.client.get(
+            url=self.url,
+            params={
+                "since_created_at": since_created_at.isoformat(),
+                "since_id": answers[0].id,
+            },
+        )
+
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data["items"]] == [answers[1].id]
+
+
+class TestStreamAnswers(BaseTestCase):
+    url = "/questions/{id}/answers/stream"
+
+    @pytest.mark.asyncio
+    async def test_replays_missed_answers(self, broadcaster: AnswerBroadcaster) -> None:
+        question = await QuestionFactory.create_async(
+            session=self.session, text="What is Python?"
+        )
+        answers = [
+            await AnswerFactory.create_async(
+                session=self.session, question_id=question.id
+            )
+            for _ in range(2)
+        ]
+        app.dependency_overrides[stream.get_answer_broadcaster] = lambda: broadcaster
+
+        request = asyncio.create_task(
+            self.client.get(
+                url=self.url.format(id=question.id),
+                headers={"Last-Event-ID": str(answers[0].id)},
+            )
+        )
+        for _ in range(50):
+            if question.id in broadcaster._subscribers:
+                break
+            await asyncio.sleep(0.1)
+        await broadcaster.stop()
+        response = await request
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert f"id: {answers[1].id}\nevent: answer\n" in response.text
+        assert f"id: {answers[0].id}\n" not in response.text
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, broadcaster: AnswerBroadcaster) -> None:
+        app.dependency_overrides[stream.get_answer_broadcaster] = lambda: broadcaster
+
+        response = await self.client.get(url=self.url.format(id=999999))
+
+        data = await self.assert_response_not_found(response=response)
+        assert data["detail"] == "Question not found"
+        assert not broadcaster._subscribers
+
+
+class TestGetArchivedAnswers(BaseTestCase):
+    url = "/questions/{id}/answers/archive"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        old_answers = [
+            await AnswerFactory.create_async(
+                session=self.session,
+                question_id=question.id,
+                created_at=datetime.now() - timedelta(days=days),
+            )
+            for days in (60, 40)
+        ]
+        recent = await AnswerFactory.create_async(
+            session=self.session, question_id=question.id
+        )
+
+        archived = await AnswerUsecase().archive_old(
+            session=self.session, max_age=timedelta(days=30), batch_size=1
+        )
+
+        assert archived == len(old_answers)
+        await self.session.refresh(question)
+        response = await self.client.get(url=f"/questions/{question.id}")
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data["answers"]] == [recent.id]
+        assert data["answer_count"] == len(old_answers) + 1
+
+        response = await self.client.get(
+            url=self.url.format(id=question.id), params={"limit": 1}
+        )
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data["items"]] == [old_answers[0].id]
+
+        response = await self.client.get(
+            url=self.url.format(id=question.id),
+            params={"limit": 1, "cursor": data["next_cursor"]},
+        )
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data["items"]] == [old_answers[1].id]
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_not_found(self) -> None:
+        response = await self.client.get(url=self.url.format(id=999999))
+
+        await self.assert_response_not_found(response=response)
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+import pytest
+
+from tests.factories import AnswerFactory, QuestionFactory
+from tests.test_api.base import BaseTestCase
+
+
+class TestExportQuestions(BaseTestCase):
+    url = "/export/questions"
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        answers = [
+            await AnswerFactory.create_async(
+                session=self.session, question_id=question.id
+            )
+            for _ in range(2)
+        ]
+        unanswered = await QuestionFactory.create_async(session=self.session)
+
+        response = await self.client.get(url=self.url, params={"format": "ndjson"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [(row["question_id"], row["answer_id"]) for row in rows] == [
+            (question.id, answers[0].id),
+            (question.id, answers[1].id),
+            (unanswered.id, None),
+        ]
+        assert rows[0]["answer_user_id"] == str(answers[0].user_id)
+
+    @pytest.mark.asyncio
+    async def test_csv_created_range(self) -> None:
+        await QuestionFactory.create_async(
+            session=self.session, created_at=datetime(2025, 1, 1)
+        )
+        question = await QuestionFactory.create_async(
+            session=self.session, created_at=datetime(2025, 2, 1)
+        )
+
+        response = await self.client.get(
+            url=self.url,
+            params={
+                "format": "csv",
+                "created_from": datetime(2025, 1, 15).isoformat(),
+                "created_to": datetime(
+                    2025, 2, 2, 2, tzinfo=timezone(timedelta(hours=2))
+                ).isoformat(),
+            },
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["question_id"] for row in rows] == [str(question.id)]
+        assert rows[0]["answer_id"] == ""
+
+    @pytest.mark.asyncio
+    async def test_parquet(self) -> None:
+        pq = pytest.importorskip("pyarrow.parquet")
+        question = await QuestionFactory.create_async(session=self.session)
+        answer = await AnswerFactory.create_async(
+            session=self.session, question_id=question.id
+        )
+
+        response = await self.client.get(url=self.url, params={"format": "parquet"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert pq.read_table(io.BytesIO(response.content)).to_pylist() == [
+            {
+                "question_id": question.id,
+                "question_text": question.text,
+                "question_created_at": question.created_at,
+                "answer_id": answer.id,
+                "answer_user_id": str(answer.user_id),
+                "answer_text": answer.text,
+                "answer_created_at": answer.created_at,
+            }
+        ]
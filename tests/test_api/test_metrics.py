@@ -0,0 +1,16 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.test_api.base import BaseTestCase
+
+
+class TestGetMetrics(BaseTestCase):
+    url = "/metrics"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        response = await self.client.get(url=self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert "event_loop_lag_seconds" in response.text
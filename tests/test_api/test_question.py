@@ -1,7 +1,17 @@
+from datetime import date, datetime, timedelta
+from http import HTTPStatus
+
 import pytest
+from sqlalchemy import select
 
-from tests.factories import QuestionFactory
+from api.dependencies.question import get_question_usecase
+from constants.pagination import NEXT_CURSOR_HEADER
+from db.models import Answer, Question
+from db.repositories import AnswerArchiveRepository, IdempotencyKeyRepository
+from main import app
+from tests.factories import AnswerFactory, QuestionFactory
 from tests.test_api.base import BaseTestCase
+from usecases import AnswerUsecase, QuestionUsecase, TrendingUsecase
 
 
 class TestGetAllQuestions(BaseTestCase):
@@ -28,6 +38,108 @@ class TestGetAllQuestions(BaseTestCase):
         assert data[1]["id"] == question2.id
         assert data[1]["text"] == question2.text
 
+    @pytest.mark.asyncio
+    async def test_sort_by_answer_count(self) -> None:
+        questions = [
+            await QuestionFactory.create_async(session=self.session) for _ in range(3)
+        ]
+        for question, count in zip(questions, (1, 3, 0), strict=True):
+            for _ in range(count):
+                await AnswerFactory.create_async(
+                    session=self.session, question_id=question.id
+                )
+        await QuestionUsecase().compact_answer_counters(
+            session=self.session, batch_size=len(questions)
+        )
+
+        response = await self.client.get(
+            url=self.url,
+            params={"sort_by": "answer_count", "order": "desc", "limit": 2},
+        )
+
+        data = await self.assert_response_ok(response=response)
+        assert [item["id"] for item in data] == [questions[1].id, questions[0].id]
+        assert [item["answer_count"] for item in data] == [3, 1]
+        assert data[0]["last_answer_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_cursor(self) -> None:
+        questions = [
+            await QuestionFactory.create_async(session=self.session) for _ in range(4)
+        ]
+        for question in (questions[1], questions[2]):
+            await AnswerFactory.create_async(
+                session=self.session, question_id=question.id
+            )
+        await QuestionUsecase().compact_answer_counters(
+            session=self.session, batch_size=len(questions)
+        )
+        params = {"sort_by": "last_answer_at", "order": "desc", "limit": 3}
+
+        first = await self.client.get(url=self.url, params=params)
+        second = await self.client.get(
+            url=self.url,
+            params={**params, "cursor": first.headers[NEXT_CURSOR_HEADER]},
+        )
+        other_order = await self.client.get(
+            url=self.url,
+            params={"cursor": first.headers[NEXT_CURSOR_HEADER]},
+        )
+
+        ids = [item["id"] for item in await self.assert_response_ok(response=first)]
+        ids += [item["id"] for item in await self.assert_response_ok(response=second)]
+        assert ids == [questions[index].id for index in (2, 1, 0, 3)]
+        assert NEXT_CURSOR_HEADER not in second.headers
+        assert other_order.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_fields(self) -> None:
+        questions = [
+            await QuestionFactory.create_async(session=self.session) for _ in range(3)
+        ]
+        ids = [question.id for question in questions]
+        self.session.expire_all()
+
+        response = await self.client.get(
+            url=self.url,
+            params={"sort_by": "created_at", "limit": 2, "fields": "id,answer_count"},
+        )
+        unknown = await self.client.get(url=self.url, params={"fields": "id,score"})
+
+        data = await self.assert_response_ok(response=response)
+        assert data == [{"id": id, "answer_count": 0} for id in ids[:2]]
+        assert NEXT_CURSOR_HEADER in response.headers
+        assert unknown.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+class TestGetTrendingQuestions(BaseTestCase):
+    url = "/questions/trending"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        questions = [
+            await QuestionFactory.create_async(session=self.session) for _ in range(3)
+        ]
+        for question, count in zip(questions, (1, 3, 0), strict=True):
+            for _ in range(count):
+                await AnswerFactory.create_async(
+                    session=self.session, question_id=question.id
+                )
+        usecase = TrendingUsecase()
+
+        scored = await usecase.update(session=self.session, batch_size=2, settle_lag=0)
+        rescored = await usecase.update(
+            session=self.session, batch_size=2, settle_lag=0
+        )
+
+        response = await self.client.get(url=self.url)
+
+        data = await self.assert_response_ok(response=response)
+        assert (scored, rescored) == (4, 0)
+        assert [item["id"] for item in data] == [questions[1].id, questions[0].id]
+        assert data[0]["score"] == pytest.approx(3, rel=0.01)
+        assert data[1]["score"] == pytest.approx(1, rel=0.01)
+
 
 class TestCreateQuestion(BaseTestCase):
     url = "/questions/"
@@ -43,6 +155,100 @@ class TestCreateQuestion(BaseTestCase):
         assert data["text"] == question_data["text"]
         assert "created_at" in data
 
+    @pytest.mark.asyncio
+    async def test_idempotent_retry(self) -> None:
+        headers = {"Idempotency-Key": "create-question-1"}
+
+        first = await self.client.post(
+            url=self.url, json={"text": "What is love?"}, headers=headers
+        )
+        retry = await self.client.post(
+            url=self.url, json={"text": "What is love?"}, headers=headers
+        )
+
+        data = await self.assert_response_ok(response=first)
+        assert await self.assert_response_ok(response=retry) == data
+        assert retry.headers["Idempotent-Replayed"] == "true"
+
+    @pytest.mark.asyncio
+    async def test_idempotent_create_is_atomic(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def fail(*args, **kwargs) -> None:
+            raise RuntimeError
+
+        monkeypatch.setattr(IdempotencyKeyRepository, "complete", fail)
+
+        with pytest.raises(RuntimeError):
+            await self.client.post(
+                url=self.url,
+                json={"text": "What is love?"},
+                headers={"Idempotency-Key": "create-question-3"},
+            )
+
+        # The request session is shared with the test; closing it rolls back.
+        await self.session.rollback()
+
+        assert list(await self.session.scalars(select(Question.id))) == []
+
+    @pytest.mark.asyncio
+    async def test_idempotency_key_reused(self) -> None:
+        headers = {"Idempotency-Key": "create-question-2"}
+
+        await self.client.post(
+            url=self.url, json={"text": "What is love?"}, headers=headers
+        )
+        response = await self.client.post(
+            url=self.url, json={"text": "What is hate?"}, headers=headers
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_duplicate_rejected(self) -> None:
+        await QuestionFactory.create_async(
+            session=self.session, text="What is the meaning of life?"
+        )
+
+        response = await self.client.post(
+            url=self.url, json={"text": "  what is the MEANING\n of life? "}
+        )
+
+        assert response.status_code == HTTPStatus.CONFLICT
+
+    @pytest.mark.asyncio
+    async def test_duplicate_returns_existing(self) -> None:
+        existing = await QuestionFactory.create_async(
+            session=self.session, text="What is the meaning of life?"
+        )
+        app.dependency_overrides[get_question_usecase] = lambda: (
+            QuestionUsecase(duplicate_policy="return-existing")
+        )
+
+        response = await self.client.post(
+            url=self.url, json={"text": "What is  the meaning of life?"}
+        )
+
+        data = await self.assert_response_ok(response=response)
+        assert data["id"] == existing.id
+        assert data["text"] == existing.text
+
+    @pytest.mark.asyncio
+    async def test_duplicate_allowed(self) -> None:
+        existing = await QuestionFactory.create_async(
+            session=self.session, text="What is the meaning of life?"
+        )
+        app.dependency_overrides[get_question_usecase] = lambda: (
+            QuestionUsecase(duplicate_policy="allow")
+        )
+
+        response = await self.client.post(
+            url=self.url, json={"text": "What is the meaning of life?"}
+        )
+
+        data = await self.assert_response_ok(response=response)
+        assert data["id"] != existing.id
+
 
 class TestGetQuestionWithAnswers(BaseTestCase):
     url = "/questions/{id}"
@@ -62,6 +268,28 @@ class TestGetQuestionWithAnswers(BaseTestCase):
         assert isinstance(data["answers"], list)
         assert "created_at" in data
 
+    @pytest.mark.asyncio
+    async def test_fields(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        answer = await AnswerFactory.create_async(
+            session=self.session, question_id=question.id
+        )
+        url = self.url.format(id=question.id)
+        expected = {"id": question.id, "text": question.text}
+        answer_id = answer.id
+        self.session.expire_all()
+
+        without_answers = await self.client.get(url=url, params={"fields": "id,text"})
+        with_answer_ids = await self.client.get(
+            url=url, params={"fields": "answer_count,answers.id"}
+        )
+
+        assert await self.assert_response_ok(response=without_answers) == expected
+        assert await self.assert_response_ok(response=with_answer_ids) == {
+            "answer_count": 1,
+            "answers": [{"id": answer_id}],
+        }
+
     @pytest.mark.asyncio
     async def test_not_found(self) -> None:
         non_existent_id = 999999
@@ -84,6 +312,98 @@ class TestDeleteQuestion(BaseTestCase):
         response = await self.client.delete(url=self.url.format(id=question.id))
 
         await self.assert_response_no_content(response=response)
+        response = await self.client.get(url=self.url.format(id=question.id))
+        await self.assert_response_not_found(response=response)
+        response = await self.client.get(url="/questions/")
+        assert await self.assert_response_ok(response=response) == []
+
+    @pytest.mark.asyncio
+    async def test_purge(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        answers = [
+            await AnswerFactory.create_async(
+                session=self.session, question_id=question.id
+            )
+            for _ in range(3)
+        ]
+        status_url = f"/questions/{question.id}/deletion"
+
+        response = await self.client.get(url=status_url)
+        data = await self.assert_response_ok(response=response)
+        assert data["status"] == "active"
+
+        await self.client.delete(url=self.url.format(id=question.id))
+
+        response = await self.client.get(url=status_url)
+        data = await self.assert_response_ok(response=response)
+        assert data["status"] == "purging"
+        assert data["remaining_answers"] == len(answers)
+        assert data["deleted_at"] is not None
+
+        purged = await QuestionUsecase().purge_deleted(
+            session=self.session, batch_size=2
+        )
+
+        assert purged == 1
+        response = await self.client.get(url=status_url)
+        await self.assert_response_not_found(response=response)
+
+    @pytest.mark.asyncio
+    async def test_purge_archived(self) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        question_id = question.id
+        ages = (60, 0)
+        for days in ages:
+            await AnswerFactory.create_async(
+                session=self.session,
+                question_id=question_id,
+                created_at=datetime.now() - timedelta(days=days),
+            )
+        await AnswerUsecase().archive_old(
+            session=self.session, max_age=timedelta(days=30), batch_size=10
+        )
+        status_url = f"/questions/{question_id}/deletion"
+
+        await self.client.delete(url=self.url.format(id=question_id))
+
+        response = await self.client.get(url=status_url)
+        data = await self.assert_response_ok(response=response)
+        assert data["remaining_answers"] == len(ages)
+
+        await AnswerArchiveRepository().purge_by_question(
+            session=self.session, question_id=question_id, limit=10
+        )
+
+        response = await self.client.get(url=status_url)
+        data = await self.assert_response_ok(response=response)
+        assert data["remaining_answers"] == 1
+
+    @pytest.mark.asyncio
+    async def test_purge_across_partitions(self) -> None:
+        await AnswerUsecase().create_partitions(
+            session=self.session, today=date(2026, 12, 1), months_ahead=1
+        )
+        question = await QuestionFactory.create_async(
+            session=self.session, created_at=datetime(2026, 12, 1)
+        )
+        other = await QuestionFactory.create_async(session=self.session)
+        for created_at in (datetime(2026, 12, 31), datetime(2027, 1, 15)):
+            await AnswerFactory.create_async(
+                session=self.session, question_id=question.id, created_at=created_at
+            )
+        kept = await AnswerFactory.create_async(
+            session=self.session, question_id=other.id
+        )
+        kept_id = kept.id
+
+        await self.client.delete(url=self.url.format(id=question.id))
+        purged = await QuestionUsecase().purge_deleted(
+            session=self.session, batch_size=1
+        )
+
+        assert purged == 1
+        remaining = await self.session.scalars(select(Answer.id))
+        assert list(remaining) == [kept_id]
 
     @pytest.mark.asyncio
     async def test_not_found(self) -> None:
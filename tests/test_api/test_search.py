@@ -0,0 +1,50 @@
+import pytest
+
+from tests.factories import AnswerFactory, QuestionFactory
+from tests.test_api.base import BaseTestCase
+
+
+class TestSearch(BaseTestCase):
+    url = "/search"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        question = await QuestionFactory.create_async(
+            session=self.session, text="How do I sort a list in Python?"
+        )
+        answer = await AnswerFactory.create_async(
+            session=self.session,
+            question_id=question.id,
+            text="Use sorted() to sort lists; sorting in Python is stable.",
+        )
+        await AnswerFactory.create_async(
+            session=self.session, question_id=question.id, text="Try Rust instead."
+        )
+
+        received = []
+        cursor = None
+        for _ in range(3):
+            params = {"q": "python sort", "limit": 1}
+            if cursor:
+                params["cursor"] = cursor
+            response = await self.client.get(url=self.url, params=params)
+
+            data = await self.assert_response_ok(response=response)
+            received.extend((item["kind"], item["id"]) for item in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert sorted(received) == [("answer", answer.id), ("question", question.id)]
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_no_results(self) -> None:
+        await QuestionFactory.create_async(
+            session=self.session, text="How do I sort a list in Python?"
+        )
+
+        response = await self.client.get(url=self.url, params={"q": "haskell"})
+
+        data = await self.assert_response_ok(response=response)
+        assert data == {"items": [], "next_cursor": None}
@@ -0,0 +1,82 @@
+import uuid
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+
+from tests.factories import AnswerFactory, QuestionFactory
+from tests.test_api.base import BaseTestCase
+
+
+class TestGetUserAnswers(BaseTestCase):
+    url = "/users/{user_id}/answers"
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        question = await QuestionFactory.create_async(
+            session=self.session, text="What is Python?"
+        )
+        user_id = uuid.uuid4()
+        created_at = datetime(2025, 1, 1)
+        answers = [
+            await AnswerFactory.create_async(
+                session=self.session,
+                question_id=question.id,
+                user_id=user_id,
+                created_at=created_at + timedelta(days=index // 2),
+            )
+            for index in range(5)
+        ]
+        await AnswerFactory.create_async(
+            session=self.session, question_id=question.id, user_id=uuid.uuid4()
+        )
+        expected_ids = [answers[index].id for index in (4, 2, 3, 0, 1)]
+
+        received_ids = []
+        cursor = None
+        for _ in range(len(answers)):
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            response = await self.client.get(
+                url=self.url.format(user_id=user_id), params=params
+            )
+
+            data = await self.assert_response_ok(response=response)
+            received_ids.extend(item["id"] for item in data["items"])
+            assert all(item["question"] is None for item in data["items"])
+
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert received_ids == expected_ids
+
+    @pytest.mark.asyncio
+    async def test_with_question(self) -> None:
+        question = await QuestionFactory.create_async(
+            session=self.session, text="What is Python?"
+        )
+        answer = await AnswerFactory.create_async(
+            session=self.session, question_id=question.id
+        )
+
+        response = await self.client.get(
+            url=self.url.format(user_id=answer.user_id),
+            params={"with_question": True},
+        )
+
+        data = await self.assert_response_ok(response=response)
+        assert data["next_cursor"] is None
+        assert data["items"][0]["id"] == answer.id
+        assert data["items"][0]["question"] == {
+            "id": question.id,
+            "text": question.text,
+        }
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self) -> None:
+        response = await self.client.get(
+            url=self.url.format(user_id=uuid.uuid4()), params={"cursor": "garbage"}
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == "Invalid pagination cursor"
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from db import instrumentation
+from db.repositories import QuestionRepository
+from tests.factories import QuestionFactory
+
+
+class TestSlowQueryLog:
+    @pytest.mark.asyncio
+    async def test_logs_caller_and_plan(
+        self,
+        test_engine: AsyncEngine,
+        test_session: AsyncSession,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        question = await QuestionFactory.create_async(session=test_session)
+        instrumentation.install_slow_query_log(
+            engine=test_engine, threshold_ms=0, explain_sample_rate=1
+        )
+
+        with caplog.at_level(logging.WARNING, logger=instrumentation.__name__):
+            await QuestionRepository().get_with_answers(
+                session=test_session, id=question.id
+            )
+            await asyncio.gather(*instrumentation._pending_explains)
+
+        assert "Slow query in QuestionRepository.get_with_answers" in caplog.text
+        assert "FROM questions WHERE questions.id = $" in caplog.text
+        assert "Plan for slow query in QuestionRepository.get_with_answers" in (
+            caplog.text
+        )
+        assert "Buffers" in caplog.text or "Execution Time" in caplog.text
+
+    def test_normalize_sql(self) -> None:
+        statement = (
+            "SELECT answers.id\n  FROM answers\n WHERE answers.question_id "
+            "IN ($1::INTEGER, $2::INTEGER, $3::INTEGER) AND answers.text = 'x' "
+            "LIMIT 10"
+        )
+
+        assert instrumentation.normalize_sql(statement=statement) == (
+            "SELECT answers.id FROM answers WHERE answers.question_id IN (...) "
+            "AND answers.text = ? LIMIT ?"
+        )
+
+
+class TestCompiledCacheMetrics:
+    @pytest.mark.asyncio
+    async def test_counts_hits(
+        self, test_engine: AsyncEngine, test_session: AsyncSession
+    ) -> None:
+        question = await QuestionFactory.create_async(session=test_session)
+        repository = QuestionRepository()
+        await repository.get_by(session=test_session, id=question.id)
+        instrumentation.install_compiled_cache_metrics(engine=test_engine)
+        labels = {"outcome": "cache_hit"}
+        hits = REGISTRY.get_sample_value("db_compiled_cache_total", labels) or 0
+
+        for _ in range(3):
+            await repository.get_by(session=test_session, id=question.id)
+
+        assert REGISTRY.get_sample_value("db_compiled_cache_total", labels) == hits + 3
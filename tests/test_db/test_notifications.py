@@ -0,0 +1,83 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import Answer
+from db.notifications import AnswerBroadcaster
+from tests.factories import QuestionFactory
+from usecases import AnswerUsecase
+
+
+class TestAnswerBroadcaster:
+    @pytest.mark.asyncio
+    async def test_publishes_created_answers(
+        self, broadcaster: AnswerBroadcaster, test_session: AsyncSession
+    ) -> None:
+        question = await QuestionFactory.create_async(session=test_session)
+        other_question = await QuestionFactory.create_async(session=test_session)
+        subscription = await broadcaster.subscribe(question_id=question.id)
+        usecase = AnswerUsecase()
+
+        await usecase.create(
+            session=test_session,
+            question_id=other_question.id,
+            user_id=uuid.uuid4(),
+            text="Not for this stream",
+        )
+        answer = await usecase.create(
+            session=test_session,
+            question_id=question.id,
+            user_id=uuid.uuid4(),
+            text="Python is a programming language",
+        )
+
+        received = await asyncio.wait_for(subscription.get(), timeout=5)
+        assert received is not None
+        assert received.id == answer.id
+        assert subscription.empty()
+
+    @pytest.mark.asyncio
+    async def test_publishes_on_commit_only(
+        self, broadcaster: AnswerBroadcaster, test_session: AsyncSession
+    ) -> None:
+        question = await QuestionFactory.create_async(session=test_session)
+        subscription = await broadcaster.subscribe(question_id=question.id)
+        values = {"question_id": question.id, "user_id": uuid.uuid4(), "text": "A"}
+
+        await test_session.execute(insert(Answer).values(values))
+        await test_session.rollback()
+        id = await test_session.scalar(
+            insert(Answer).values(values).returning(Answer.id)
+        )
+        await test_session.commit()
+
+        received = await asyncio.wait_for(subscription.get(), timeout=5)
+        assert received is not None
+        assert received.id == id
+        assert subscription.empty()
+
+    @pytest.mark.asyncio
+    async def test_ends_slow_subscriptions(
+        self, broadcaster: AnswerBroadcaster, test_session: AsyncSession
+    ) -> None:
+        question = await QuestionFactory.create_async(session=test_session)
+        subscription = await broadcaster.subscribe(question_id=question.id)
+        usecase = AnswerUsecase()
+
+        for _ in range(2):
+            await usecase.create(
+                session=test_session,
+                question_id=question.id,
+                user_id=uuid.uuid4(),
+                text="Python is a programming language",
+            )
+
+        for _ in range(50):
+            if question.id not in broadcaster._subscribers:
+                break
+            await asyncio.sleep(0.1)
+
+        assert await asyncio.wait_for(subscription.get(), timeout=5) is None
@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.repositories import QuestionRepository
+from tests.factories import QuestionFactory
+
+
+class TestCachedStatements:
+    @pytest.mark.asyncio
+    async def test_reuses_statement_per_filter_shape(
+        self, test_session: AsyncSession
+    ) -> None:
+        questions = [
+            await QuestionFactory.create_async(session=test_session) for _ in range(2)
+        ]
+        repository = QuestionRepository()
+
+        found = [
+            await repository.get_by(session=test_session, id=question.id)
+            for question in questions
+        ]
+
+        assert found == questions
+        assert repository._select_by(filters={"id": 1})[0] is (
+            QuestionRepository()._select_by(filters={"id": 2})[0]
+        )
+
+    @pytest.mark.asyncio
+    async def test_none_filter(self, test_session: AsyncSession) -> None:
+        deleted, active = [
+            await QuestionFactory.create_async(session=test_session) for _ in range(2)
+        ]
+        deleted.deleted_at = func.now()
+        await test_session.commit()
+
+        result = await QuestionRepository().get_all(
+            session=test_session, deleted_at=None
+        )
+
+        assert result == [active]
@@ -0,0 +1,176 @@
+import json
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from testcontainers.postgres import PostgresContainer
+
+from api.dependencies import db
+from api.dependencies.answer import get_answer_usecase
+from constants.pagination import NEXT_CURSOR_HEADER
+from db.models import Answer, Base, Question
+from db.sharding import shard_of
+from main import app
+from tests.containers import get_async_url
+from tests.test_api.base import BaseTestCase
+from usecases import AnswerUsecase, ShardUsecase, TrendingUsecase
+
+SHARD_COUNT = 2
+USER_ID = "5e4ed3b2-2c3f-4c9e-9a4a-0c4d8d3b8f51"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def second_postgres_container() -> AsyncGenerator[PostgresContainer, None]:
+    with PostgresContainer() as postgres:
+        yield postgres
+
+
+class TestSharding(BaseTestCase):
+    @pytest_asyncio.fixture(autouse=True)
+    async def shards(
+        self, test_engine: AsyncEngine, second_postgres_container: PostgresContainer
+    ) -> AsyncGenerator[None, None]:
+        engine = create_async_engine(url=get_async_url(second_postgres_container))
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        self.factories = [
+            async_sessionmaker(bind=shard_engine, expire_on_commit=False)
+            for shard_engine in (test_engine, engine)
+        ]
+        for shard, factory in enumerate(self.factories):
+            async with factory() as session:
+                await ShardUsecase().configure_ids(
+                    session=session, shard=shard, shard_count=SHARD_COUNT
+                )
+
+        app.dependency_overrides[db.get_shard_session_factories] = (
+            lambda: self.factories
+        )
+
+        yield
+
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+    async def get_ids(self, shard: int, model: type[Question | Answer]) -> list[int]:
+        async with self.factories[shard]() as session:
+            return list(await session.scalars(select(model.id).order_by(model.id)))
+
+    async def create_questions(self, count: int) -> list[int]:
+        ids = []
+        for index in range(count):
+            response = await self.client.post(
+                url="/questions/", json={"text": f"Sharded question {index}"}
+            )
+            ids.append((await self.assert_response_ok(response=response))["id"])
+
+        return ids
+
+    @pytest.mark.asyncio
+    async def test_routes_by_id(self) -> None:
+        question_ids = await self.create_questions(count=6)
+        remote_id = next(
+            id for id in question_ids if shard_of(id=id, shard_count=SHARD_COUNT) == 1
+        )
+
+        response = await self.client.post(
+            url=f"/questions/{remote_id}/answers/",
+            json={"user_id": USER_ID, "text": "Answer"},
+        )
+        answer_id = (await self.assert_response_ok(response=response))["id"]
+        question = await self.assert_response_ok(
+            response=await self.client.get(url=f"/questions/{remote_id}")
+        )
+
+        for shard in range(SHARD_COUNT):
+            assert await self.get_ids(shard=shard, model=Question) == sorted(
+                id
+                for id in question_ids
+                if shard_of(id=id, shard_count=SHARD_COUNT) == shard
+            )
+        assert await self.get_ids(shard=1, model=Answer) == [answer_id]
+        assert [answer["id"] for answer in question["answers"]] == [answer_id]
+        await self.assert_response_ok(
+            response=await self.client.get(url=f"/answers/{answer_id}")
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_all_merges_shards(self) -> None:
+        question_ids = await self.create_questions(count=5)
+
+        pages = []
+        params: dict[str, str | int] = {"limit": 2}
+        while True:
+            response = await self.client.get(url="/questions/", params=params)
+            data = await self.assert_response_ok(response=response)
+            pages.append([item["id"] for item in data])
+            if NEXT_CURSOR_HEADER not in response.headers:
+                break
+            params["cursor"] = response.headers[NEXT_CURSOR_HEADER]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert sum(pages, []) == sorted(question_ids)
+
+    async def get_pages(self, url: str, params: dict[str, str | int]) -> list[int]:
+        ids = []
+        while True:
+            data = await self.assert_response_ok(
+                response=await self.client.get(url=url, params=params)
+            )
+            ids += [item["id"] for item in data["items"]]
+            if data["next_cursor"] is None:
+                return ids
+            params = {**params, "cursor": data["next_cursor"]}
+
+    @pytest.mark.asyncio
+    async def test_reads_gather_shards(self) -> None:
+        question_ids = await self.create_questions(count=6)
+        answer_ids = []
+        for id in question_ids:
+            response = await self.client.post(
+                url=f"/questions/{id}/answers/",
+                json={"user_id": USER_ID, "text": f"Sharded answer {id}"},
+            )
+            answer_ids.append((await self.assert_response_ok(response=response))["id"])
+        for factory in self.factories:
+            async with factory() as session:
+                await TrendingUsecase().update(
+                    session=session, batch_size=len(answer_ids), settle_lag=0
+                )
+        app.dependency_overrides[get_answer_usecase] = lambda: AnswerUsecase(
+            feed_settle_lag=0
+        )
+
+        feed = await self.assert_response_ok(
+            response=await self.client.get(url="/answers/feed")
+        )
+        user_answer_ids = await self.get_pages(
+            url=f"/users/{USER_ID}/answers", params={"limit": 4}
+        )
+        search_ids = await self.get_pages(
+            url="/search", params={"q": "sharded", "limit": 5}
+        )
+        trending = await self.assert_response_ok(
+            response=await self.client.get(url="/questions/trending")
+        )
+        export = await self.client.get(
+            url="/export/questions", params={"format": "ndjson"}
+        )
+
+        assert {shard_of(id=id, shard_count=SHARD_COUNT) for id in question_ids} == {
+            0,
+            1,
+        }
+        assert sorted(item["id"] for item in feed["items"]) == sorted(answer_ids)
+        assert sorted(user_answer_ids) == sorted(answer_ids)
+        assert sorted(search_ids) == sorted(question_ids + answer_ids)
+        assert sorted(item["id"] for item in trending) == sorted(question_ids)
+        rows = [json.loads(line) for line in export.text.splitlines()]
+        keys = [(row["question_created_at"], row["question_id"]) for row in rows]
+        assert keys == sorted(keys)
+        assert sorted(key[1] for key in keys) == sorted(question_ids)
+        assert sorted(row["answer_id"] for row in rows) == sorted(answer_ids)
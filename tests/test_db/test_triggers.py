@@ -0,0 +1,141 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import Answer, Question, QuestionAnswerCounterShard
+from db.repositories import QuestionRepository
+from tests.factories import QuestionFactory
+from usecases import AnswerUsecase, QuestionUsecase
+
+
+class TestAnswerStatsTriggers:
+    @pytest.mark.asyncio
+    async def test_batched_insert_and_delete(self, test_session: AsyncSession) -> None:
+        first = await QuestionFactory.create_async(session=test_session)
+        second = await QuestionFactory.create_async(session=test_session)
+
+        result = await test_session.execute(
+            insert(Answer).returning(Answer.id, Answer.created_at),
+            [
+                {"question_id": question_id, "user_id": uuid.uuid4(), "text": "A"}
+                for question_id in (first.id, first.id, second.id)
+            ],
+        )
+        answers = result.all()
+        await test_session.execute(delete(Answer).where(Answer.id == answers[2].id))
+        await test_session.commit()
+        for question in (first, second):
+            await QuestionRepository().load_answer_stats(
+                session=test_session, question=question
+            )
+
+        assert (first.answer_count, first.last_answer_at) == (2, answers[1].created_at)
+        assert (second.answer_count, second.last_answer_at) == (0, None)
+
+    @pytest.mark.asyncio
+    async def test_archive_keeps_stats(self, test_session: AsyncSession) -> None:
+        question = await QuestionFactory.create_async(session=test_session)
+        result = await test_session.execute(
+            insert(Answer).returning(Answer.created_at),
+            [
+                {
+                    "question_id": question.id,
+                    "user_id": uuid.uuid4(),
+                    "text": "A",
+                    "created_at": datetime.now() - timedelta(days=days),
+                }
+                for days in (60, 40)
+            ],
+        )
+        last_answer_at = max(result.scalars())
+        await test_session.commit()
+
+        archived = await AnswerUsecase().archive_old(
+            session=test_session, max_age=timedelta(days=30), batch_size=10
+        )
+        await QuestionUsecase().repair_answer_stats(session=test_session, batch_size=10)
+        await QuestionRepository().load_answer_stats(
+            session=test_session, question=question
+        )
+
+        assert (question.answer_count, question.last_answer_at) == (
+            archived,
+            last_answer_at,
+        )
+
+    @pytest.mark.asyncio
+    async def test_cascade_delete(self, test_session: AsyncSession) -> None:
+        question = await QuestionFactory.create_async(session=test_session)
+        await test_session.execute(
+            insert(Answer),
+            [{"question_id": question.id, "user_id": uuid.uuid4(), "text": "A"}],
+        )
+
+        await test_session.delete(question)
+        await test_session.commit()
+
+        assert await test_session.get(Question, question.id) is None
+
+    @pytest.mark.asyncio
+    async def test_repair(self, test_session: AsyncSession) -> None:
+        questions = [
+            await QuestionFactory.create_async(session=test_session) for _ in range(3)
+        ]
+        await test_session.execute(
+            insert(Answer),
+            [
+                {"question_id": questions[0].id, "user_id": uuid.uuid4(), "text": "A"}
+                for _ in range(2)
+            ],
+        )
+        await test_session.execute(
+            update(Question).values(folded_answer_count=7, folded_last_answer_at=None)
+        )
+        await test_session.commit()
+
+        repaired = await QuestionUsecase().repair_answer_stats(
+            session=test_session, batch_size=2
+        )
+
+        assert repaired == len(questions)
+        for question in questions:
+            await QuestionRepository().load_answer_stats(
+                session=test_session, question=question
+            )
+        assert [question.answer_count for question in questions] == [2, 0, 0]
+        assert questions[0].last_answer_at is not None
+
+    @pytest.mark.asyncio
+    async def test_compaction(self, test_session: AsyncSession) -> None:
+        expected_count = 5
+        question = await QuestionFactory.create_async(session=test_session)
+        for _ in range(expected_count):
+            await test_session.execute(
+                insert(Answer),
+                [{"question_id": question.id, "user_id": uuid.uuid4(), "text": "A"}],
+            )
+        await test_session.commit()
+        await QuestionRepository().load_answer_stats(
+            session=test_session, question=question
+        )
+        last_answer_at = question.last_answer_at
+
+        compacted = await QuestionUsecase().compact_answer_counters(
+            session=test_session, batch_size=1
+        )
+
+        await test_session.refresh(question)
+        await QuestionRepository().load_answer_stats(
+            session=test_session, question=question
+        )
+        shards = await test_session.scalar(
+            select(func.count()).select_from(QuestionAnswerCounterShard)
+        )
+        assert compacted == 1
+        assert shards == 0
+        assert question.folded_answer_count == expected_count
+        assert question.answer_count == expected_count
+        assert question.last_answer_at == last_answer_at
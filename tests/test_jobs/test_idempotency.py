@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import IdempotencyKey
+from usecases import IdempotencyUsecase
+
+
+class TestPurgeIdempotencyKeys:
+    @pytest.mark.asyncio
+    async def test_purges_expired_keys(self, test_session: AsyncSession) -> None:
+        now = datetime.now()
+        await test_session.execute(
+            insert(IdempotencyKey),
+            [
+                {
+                    "key": "expired",
+                    "fingerprint": b"0" * 32,
+                    "response": {},
+                    "created_at": now - timedelta(days=2),
+                },
+                {
+                    "key": "fresh",
+                    "fingerprint": b"1" * 32,
+                    "response": {},
+                    "created_at": now,
+                },
+            ],
+        )
+        await test_session.commit()
+
+        purged = await IdempotencyUsecase().purge(session=test_session, batch_size=1)
+
+        assert purged == 1
+        assert list(await test_session.scalars(select(IdempotencyKey.key))) == ["fresh"]
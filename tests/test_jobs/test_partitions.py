@@ -0,0 +1,54 @@
+import uuid
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import Answer
+from tests.factories import QuestionFactory
+from usecases import AnswerUsecase
+
+
+class TestCreateAnswerPartitions:
+    @pytest.mark.asyncio
+    async def test_creates_missing_months(self, test_session: AsyncSession) -> None:
+        usecase = AnswerUsecase()
+
+        created = await usecase.create_partitions(
+            session=test_session, today=date(2026, 11, 15), months_ahead=2
+        )
+        created_again = await usecase.create_partitions(
+            session=test_session, today=date(2026, 12, 1), months_ahead=2
+        )
+
+        assert (created, created_again) == (3, 1)
+
+    @pytest.mark.asyncio
+    async def test_routes_answers_by_month(self, test_session: AsyncSession) -> None:
+        await AnswerUsecase().create_partitions(
+            session=test_session, today=date(2026, 12, 1), months_ahead=1
+        )
+        question = await QuestionFactory.create_async(session=test_session)
+
+        await test_session.execute(
+            insert(Answer),
+            [
+                {
+                    "question_id": question.id,
+                    "user_id": uuid.uuid4(),
+                    "text": "Answer",
+                    "created_at": created_at,
+                }
+                for created_at in (datetime(2026, 12, 31), datetime(2027, 2, 1))
+            ],
+        )
+        await test_session.commit()
+
+        result = await test_session.scalars(
+            select(literal_column("tableoid::regclass::text"))
+            .select_from(Answer)
+            .order_by(Answer.created_at)
+        )
+
+        assert list(result) == ["answers_p2026_12", "answers_default"]
@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from jobs import JobScheduler, PeriodicJob
+
+
+class TestJobScheduler:
+    @pytest.mark.asyncio
+    async def test_run_once_takes_lock(self, test_engine: AsyncEngine) -> None:
+        runs = []
+
+        async def run() -> None:
+            runs.append(True)
+
+        job = PeriodicJob(name="test-job", interval=60, run=run)
+        session_factory = async_sessionmaker(test_engine)
+        scheduler = JobScheduler(session_factory=session_factory, jobs=[job])
+
+        assert await scheduler.run_once(job=job) is True
+
+        async with session_factory() as session, session.begin():
+            await session.execute(select(func.pg_advisory_xact_lock(job.lock_key)))
+
+            assert await scheduler.run_once(job=job) is False
+
+        assert runs == [True]
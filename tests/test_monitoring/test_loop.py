@@ -0,0 +1,29 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from monitoring import EventLoopMonitor, loop
+
+
+def block_event_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestEventLoopMonitor:
+    @pytest.mark.asyncio
+    async def test_reports_blocking_call(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monitor = EventLoopMonitor(interval=0.01, threshold=0.05)
+
+        with caplog.at_level(logging.WARNING, logger=loop.__name__):
+            monitor.start()
+            await asyncio.sleep(0.05)
+            block_event_loop(seconds=0.3)
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+
+        assert "Event loop blocked" in caplog.text
+        assert "block_event_loop" in caplog.text
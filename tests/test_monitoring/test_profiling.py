@@ -0,0 +1,112 @@
+import json
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Message, Receive, Scope, Send
+
+from main import app
+from monitoring import ProfilingMiddleware
+from monitoring.profiling import PROFILE_ID_HEADER
+from tests.factories import AnswerFactory, QuestionFactory
+from tests.test_api.base import BaseTestCase
+
+
+class TestProfilingMiddleware(BaseTestCase):
+    url = "/questions/{id}"
+    secret = "profiling-secret"  # noqa: S105
+
+    @pytest_asyncio.fixture
+    async def profiled_client(
+        self, test_client: AsyncClient, tmp_path: Path
+    ) -> AsyncGenerator[AsyncClient, None]:
+        middleware = ProfilingMiddleware(
+            app=app, secret=self.secret, interval=0.0001, output_dir=tmp_path
+        )
+
+        async with AsyncClient(
+            transport=ASGITransport(app=middleware), base_url="http://test"
+        ) as client:
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_profiled(self, profiled_client: AsyncClient, tmp_path: Path) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+        await AnswerFactory.create_async(session=self.session, question_id=question.id)
+
+        response = await profiled_client.get(
+            url=self.url.format(id=question.id), headers={"X-Profile": self.secret}
+        )
+
+        await self.assert_response_ok(response=response)
+        server_timing = response.headers["Server-Timing"]
+        for phase in ("routing", "dependencies", "repository", "serialization"):
+            assert f"{phase};dur=" in server_timing
+        profile = tmp_path / f"{response.headers[PROFILE_ID_HEADER]}.speedscope.json"
+        assert "speedscope" in json.loads(profile.read_text())["$schema"]
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret(self, profiled_client: AsyncClient) -> None:
+        question = await QuestionFactory.create_async(session=self.session)
+
+        response = await profiled_client.get(
+            url=self.url.format(id=question.id), headers={"X-Profile": "wrong"}
+        )
+
+        await self.assert_response_ok(response=response)
+        assert PROFILE_ID_HEADER not in response.headers
+        assert "Server-Timing" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_streamed_response(self, profiled_client: AsyncClient) -> None:
+        questions = [
+            await QuestionFactory.create_async(session=self.session) for _ in range(3)
+        ]
+
+        response = await profiled_client.get(
+            url="/export/questions",
+            params={"format": "ndjson"},
+            headers={"X-Profile": self.secret},
+        )
+
+        assert PROFILE_ID_HEADER in response.headers
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["question_id"] for row in rows] == [q.id for q in questions]
+
+    @pytest.mark.asyncio
+    async def test_does_not_buffer_streams(self, tmp_path: Path) -> None:
+        sent: list[Message] = []
+
+        async def stream(scope: Scope, receive: Receive, send: Send) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"a", "more_body": True})
+            assert [message["type"] for message in sent] == [
+                "http.response.start",
+                "http.response.body",
+            ]
+            await send({"type": "http.response.body", "body": b"b"})
+
+        async def receive() -> Message:
+            return {"type": "http.request"}
+
+        async def record(message: Message) -> None:
+            sent.append(message)
+
+        middleware = ProfilingMiddleware(
+            app=stream, secret=self.secret, interval=0.0001, output_dir=tmp_path
+        )
+        await middleware(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/stream",
+                "headers": [(b"x-profile", self.secret.encode())],
+            },
+            receive=receive,
+            send=record,
+        )
+
+        assert [message.get("body") for message in sent] == [None, b"a", b"b"]
+        assert PROFILE_ID_HEADER.lower().encode() in dict(sent[0]["headers"])
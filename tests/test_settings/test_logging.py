@@ -0,0 +1,78 @@
+import json
+import logging
+import queue
+
+from settings.logging import DroppingQueueHandler, JsonFormatter, SamplingFilter
+
+
+def make_record(name: str, level: int, message: str = "message") -> logging.LogRecord:
+    return logging.LogRecord(
+        name=name,
+        level=level,
+        pathname=__file__,
+        lineno=1,
+        msg=message,
+        args=None,
+        exc_info=None,
+    )
+
+
+class TestSamplingFilter:
+    def test_samples_by_logger_prefix(self) -> None:
+        sampling_filter = SamplingFilter(rates={"usecases": 0.0, "usecases.answer": 1})
+
+        assert not sampling_filter.filter(
+            make_record("usecases.question", logging.INFO)
+        )
+        assert sampling_filter.filter(make_record("usecases.answer", logging.INFO))
+        assert sampling_filter.filter(make_record("api", logging.INFO))
+
+    def test_keeps_warnings(self) -> None:
+        sampling_filter = SamplingFilter(rates={"usecases": 0.0})
+
+        assert sampling_filter.filter(make_record("usecases.question", logging.ERROR))
+
+
+class TestJsonFormatter:
+    def test_format(self) -> None:
+        payload = json.loads(
+            JsonFormatter().format(make_record("usecases", logging.INFO, "✅ Done"))
+        )
+
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "usecases"
+        assert payload["message"] == "✅ Done"
+        assert "timestamp" in payload
+
+
+class TestDroppingQueueHandler:
+    def test_drops_when_full(self) -> None:
+        records = queue.Queue(maxsize=1)
+        handler = DroppingQueueHandler(queue=records)
+
+        handler.handle(make_record("usecases", logging.INFO))
+        handler.handle(make_record("usecases", logging.INFO))
+
+        assert records.qsize() == 1
+        assert handler.dropped == 1
+
+    def test_keeps_traceback_apart(self) -> None:
+        records = queue.Queue()
+        handler = DroppingQueueHandler(queue=records)
+        logger = logging.getLogger("tests.logging")
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        try:
+            try:
+                int("boom")
+            except ValueError:
+                logger.exception("Failed %s", "badly")
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+
+        payload = json.loads(JsonFormatter().format(records.get_nowait()))
+
+        assert payload["message"] == "Failed badly"
+        assert "ValueError" in payload["exc_info"]
@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from settings.server import ServerSettings
+
+
+class TestServerSettings:
+    def test_sizes_workers_from_cpus(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cpus = 4
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(cpus)))
+
+        assert ServerSettings(workers=0, workers_per_cpu=1.5).worker_count == cpus * 1.5
+        assert ServerSettings(workers=0, workers_per_cpu=0.1).worker_count == 1
+
+    def test_explicit_workers(self) -> None:
+        workers = 3
+
+        assert ServerSettings(workers=workers, workers_per_cpu=4).worker_count == (
+            workers
+        )
@@ -1,4 +1,17 @@
 from usecases.answer import AnswerUsecase
+from usecases.export import ExportUsecase
+from usecases.idempotency import IdempotencyUsecase
 from usecases.question import QuestionUsecase
+from usecases.search import SearchUsecase
+from usecases.shard import ShardUsecase
+from usecases.trending import TrendingUsecase
 
-__all__ = ["QuestionUsecase", "AnswerUsecase"]
+__all__ = [
+    "QuestionUsecase",
+    "AnswerUsecase",
+    "TrendingUsecase",
+    "SearchUsecase",
+    "IdempotencyUsecase",
+    "ExportUsecase",
+    "ShardUsecase",
+]
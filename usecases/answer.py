@@ -1,22 +1,50 @@
+import asyncio
+import itertools
 import uuid
+from datetime import date, datetime, timedelta
+from operator import attrgetter
+from typing import Collection
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.models import Answer
-from db.repositories import AnswerRepository, QuestionRepository
+from constants.columns import ANSWER_COLUMNS
+from constants.pagination import MAX_FEED_SIZE
+from db.models import Answer, AnswerArchive
+from db.models.partitions import (
+    add_months,
+    month_start,
+    monthly_partition_name,
+    months_between,
+)
+from db.repositories import (
+    AnswerArchiveRepository,
+    AnswerRepository,
+    QuestionRepository,
+)
 from exceptions import AnswerNotFoundError, QuestionNotFoundError
-from settings import get_logger
+from settings import feed_settings, get_logger
+from usecases.pagination import decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
 
 class AnswerUsecase:
-    def __init__(self):
+    def __init__(self, feed_settle_lag: float | None = None):
         self._answer_repository = AnswerRepository()
         self._question_repository = QuestionRepository()
+        self._answer_archive_repository = AnswerArchiveRepository()
+        self.feed_settle_lag = (
+            feed_settings.settle_lag if feed_settle_lag is None else feed_settle_lag
+        )
 
     async def create(
-        self, session: AsyncSession, question_id: int, user_id: uuid.UUID, text: str
+        self,
+        session: AsyncSession,
+        question_id: int,
+        user_id: uuid.UUID,
+        text: str,
+        transaction: AsyncSession | None = None,
     ) -> Answer:
         """Create a new answer for a question.
 
@@ -25,6 +53,8 @@ class AnswerUsecase:
             question_id: The question ID.
             user_id: The user ID.
             text: The answer text.
+            transaction: A session whose transaction the caller commits; an
+                answer created through it is flushed, not committed.
 
         Returns:
             The created answer.
@@ -39,7 +69,7 @@ class AnswerUsecase:
         )
 
         question = await self._question_repository.get_by(
-            session=session, id=question_id
+            session=session, id=question_id, deleted_at=None
         )
 
         if not question:
@@ -49,21 +79,171 @@ class AnswerUsecase:
         answer = await self._answer_repository.create(
             session=session,
             data={"question_id": question_id, "user_id": user_id, "text": text},
+            commit=session is not transaction,
         )
 
         logger.info("✅ Created answer with ID: %s", answer.id)
 
         return answer
 
-    async def get_by_id(self, session: AsyncSession, id: int) -> Answer:
-        """Get an answer by ID.
+    async def get_by_user(
+        self,
+        sessions: list[AsyncSession],
+        user_id: uuid.UUID,
+        limit: int,
+        cursor: str | None = None,
+        with_question: bool = False,
+    ) -> tuple[list[Answer], str | None]:
+        """Get a page of a user's answers on every shard, newest first.
+
+        Every shard returns its own first page after the cursor; the pages are
+        merged and cut to the limit, so the last answer is a valid cursor across
+        all shards.
+
+        Args:
+            sessions: The session of every shard.
+            user_id: The user ID.
+            limit: The maximum number of answers.
+            cursor: The cursor returned with the previous page.
+            with_question: Whether to embed the answered question.
+
+        Returns:
+            The answers and the cursor of the next page, if there is one.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+
+        """
+        logger.info("⏲️ Fetching answers of user %s", user_id)
+
+        after = decode_cursor(cursor=cursor) if cursor else None
+        pages = await asyncio.gather(
+            *(
+                self._answer_repository.get_by_user(
+                    session=session,
+                    user_id=user_id,
+                    limit=limit + 1,
+                    after=after,
+                    with_question=with_question,
+                )
+                for session in sessions
+            )
+        )
+        answers = sorted(itertools.chain.from_iterable(pages), key=attrgetter("id"))
+        answers.sort(key=attrgetter("created_at"), reverse=True)
+
+        next_cursor = None
+        if len(answers) > limit:
+            answers = answers[:limit]
+            next_cursor = encode_cursor(
+                created_at=answers[-1].created_at, id=answers[-1].id
+            )
+
+        logger.info("✅ Fetched %s answers of user %s", len(answers), user_id)
+
+        return answers, next_cursor
+
+    async def get_feed(
+        self,
+        sessions: list[AsyncSession],
+        limit: int,
+        since_created_at: datetime | None = None,
+        since_id: int | None = None,
+    ) -> tuple[list[Answer], bool]:
+        """Get the answers on every shard created after a point, or the latest ones.
+
+        Answers younger than the feed settle lag are left for a later poll, so
+        the returned position never moves past an answer still being committed.
+        The lag also absorbs small clock differences between shards.
+
+        Args:
+            sessions: The session of every shard.
+            limit: The maximum number of answers.
+            since_created_at: Only return answers created after this date.
+            since_id: Only return answers after this ID among those created at
+                ``since_created_at``.
+
+        Returns:
+            The answers, oldest first, and whether more are ready to be fetched.
+
+        """
+        logger.info("⏲️ Fetching answers feed since %s/%s", since_created_at, since_id)
+
+        after = None if since_created_at is None else (since_created_at, since_id or 0)
+
+        pages = await asyncio.gather(
+            *(
+                self._answer_repository.get_feed(
+                    session=session,
+                    limit=limit + 1 if after else limit,
+                    after=after,
+                    settle_lag=self.feed_settle_lag,
+                )
+                for session in sessions
+            )
+        )
+        answers = sorted(
+            itertools.chain.from_iterable(pages), key=attrgetter("created_at", "id")
+        )
+
+        if after is None:
+            answers, has_more = answers[-limit:], False
+        else:
+            answers, has_more = answers[:limit], len(answers) > limit
+
+        logger.info("✅ Fetched %s answers for the feed", len(answers))
+
+        return answers, has_more
+
+    async def get_missed(
+        self, session: AsyncSession, question_id: int, last_id: int | None = None
+    ) -> list[Answer]:
+        """Get the answers a reconnecting stream client has missed.
+
+        Args:
+            session: The session.
+            question_id: The question ID.
+            last_id: The last answer ID the client received, if any.
+
+        Returns:
+            The answers after ``last_id`` ordered by ID, capped to
+            ``MAX_FEED_SIZE``.
+
+        Raises:
+            QuestionNotFoundError: If the question is not found.
+
+        """
+        question = await self._question_repository.get_by(
+            session=session, id=question_id, deleted_at=None
+        )
+
+        if not question:
+            logger.error("❌ Question with ID %s not found", question_id)
+            raise QuestionNotFoundError
+
+        if last_id is None:
+            return []
+
+        return await self._answer_repository.get_by_question_after(
+            session=session,
+            question_id=question_id,
+            since=question.created_at,
+            after_id=last_id,
+            limit=MAX_FEED_SIZE,
+        )
+
+    async def get_by_id(
+        self, session: AsyncSession, id: int, fields: Collection[str] | None = None
+    ) -> Row:
+        """Get the row of an answer by ID.
 
         Args:
             session: The session.
             id: The answer ID.
+            fields: The fields to select, all of them by default.
 
         Returns:
-            The answer.
+            The answer row.
 
         Raises:
             AnswerNotFoundError: If the answer is not found.
@@ -71,7 +251,9 @@ class AnswerUsecase:
         """
         logger.info("⏲️ Fetching answer with ID: %s", id)
 
-        answer = await self._answer_repository.get_by(session=session, id=id)
+        answer = await self._answer_repository.get_row_by_id(
+            session=session, id=id, columns=ANSWER_COLUMNS if fields is None else fields
+        )
 
         if not answer:
             logger.error("❌Answer with ID %s not found", id)
@@ -84,6 +266,9 @@ class AnswerUsecase:
     async def delete_by_id(self, session: AsyncSession, id: int) -> None:
         """Delete an answer by ID.
 
+        Like ``get_by_id``, it probes every monthly partition of ``answers``, as
+        the ID alone does not tell the partition.
+
         Args:
             session: The session.
             id: The answer ID.
@@ -101,3 +286,120 @@ class AnswerUsecase:
             raise AnswerNotFoundError
 
         logger.info("✅ Deleted answer with ID: %s", id)
+
+    async def archive_old(
+        self, session: AsyncSession, max_age: timedelta, batch_size: int
+    ) -> int:
+        """Move the answers older than a maximum age into the archive.
+
+        Args:
+            session: The session.
+            max_age: Answers created longer ago than this are archived.
+            batch_size: The number of answers moved per transaction.
+
+        Returns:
+            The number of archived answers.
+
+        """
+        logger.info("⏲️ Archiving answers older than %s", max_age)
+
+        archived = 0
+        while batch := await self._answer_archive_repository.archive(
+            session=session, max_age=max_age, limit=batch_size
+        ):
+            archived += batch
+
+        logger.info("✅ Archived %s answers", archived)
+
+        return archived
+
+    async def get_archived(
+        self,
+        session: AsyncSession,
+        question_id: int,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[AnswerArchive], str | None]:
+        """Get a page of the archived answers of a question, oldest first.
+
+        Args:
+            session: The session.
+            question_id: The question ID.
+            limit: The maximum number of answers.
+            cursor: The cursor returned with the previous page.
+
+        Returns:
+            The archived answers and the cursor of the next page, if there is one.
+
+        Raises:
+            QuestionNotFoundError: If the question is not found.
+            InvalidCursorError: If the cursor is malformed.
+
+        """
+        logger.info("⏲️ Fetching archived answers of question %s", question_id)
+
+        question = await self._question_repository.get_by(
+            session=session, id=question_id, deleted_at=None
+        )
+
+        if not question:
+            logger.error("❌ Question with ID %s not found", question_id)
+            raise QuestionNotFoundError
+
+        answers = await self._answer_archive_repository.get_by_question(
+            session=session,
+            question_id=question_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor=cursor) if cursor else None,
+        )
+
+        next_cursor = None
+        if len(answers) > limit:
+            answers = answers[:limit]
+            next_cursor = encode_cursor(
+                created_at=answers[-1].created_at, id=answers[-1].id
+            )
+
+        logger.info(
+            "✅ Fetched %s archived answers of question %s", len(answers), question_id
+        )
+
+        return answers, next_cursor
+
+    async def create_partitions(
+        self, session: AsyncSession, today: date, months_ahead: int
+    ) -> int:
+        """Create the monthly partitions of answers that do not exist yet.
+
+        Partitions are created from the current month up to ``months_ahead``
+        months later, so new answers always have a partition to go to instead
+        of the default one.
+
+        Args:
+            session: The session.
+            today: The current date.
+            months_ahead: The number of months after the current one to create.
+
+        Returns:
+            The number of created partitions.
+
+        """
+        logger.info("⏲️ Creating answer partitions")
+
+        existing = await self._answer_repository.get_partition_names(session=session)
+        first = month_start(day=today)
+        last = add_months(month=first, months=months_ahead)
+        created = 0
+
+        for month in months_between(first=first, last=last):
+            name = monthly_partition_name(table=Answer.__tablename__, month=month)
+
+            if name not in existing:
+                await self._answer_repository.create_partition(
+                    session=session, month=month
+                )
+                created += 1
+
+        logger.info("✅ Created %s answer partitions", created)
+
+        return created
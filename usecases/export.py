@@ -0,0 +1,233 @@
+import csv
+import heapq
+import importlib.util
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.export import (
+    EXPORT_BATCH_SIZE,
+    EXPORT_COLUMNS,
+    EXPORT_PARQUET_ROW_GROUP_SIZE,
+    ExportFormat,
+)
+from db.repositories import QuestionRepository
+from exceptions import ExportFormatUnavailableError
+from settings import get_logger
+
+logger = get_logger(__name__)
+
+Batches = AsyncIterator[Sequence[Row]]
+
+
+class _ChunkSink:
+    """A write-only file handing out what was written since the last drain."""
+
+    def __init__(self):
+        self.closed = False
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _json_default(value: Any) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+async def _encode_csv(batches: Batches) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    async for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def _encode_ndjson(batches: Batches) -> AsyncIterator[bytes]:
+    async for rows in batches:
+        yield "".join(
+            json.dumps(row._asdict(), default=_json_default) + "\n" for row in rows
+        ).encode()
+
+
+async def _encode_parquet(batches: Batches) -> AsyncIterator[bytes]:
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    schema = pa.schema(
+        [
+            ("question_id", pa.int64()),
+            ("question_text", pa.string()),
+            ("question_created_at", pa.timestamp("us")),
+            ("answer_id", pa.int64()),
+            ("answer_user_id", pa.string()),
+            ("answer_text", pa.string()),
+            ("answer_created_at", pa.timestamp("us")),
+        ]
+    )
+    sink = _ChunkSink()
+    pending: list[dict[str, Any]] = []
+
+    with pq.ParquetWriter(where=sink, schema=schema) as writer:
+        async for rows in batches:
+            pending.extend(
+                {
+                    **row._asdict(),
+                    "answer_user_id": row.answer_user_id and str(row.answer_user_id),
+                }
+                for row in rows
+            )
+
+            if len(pending) >= EXPORT_PARQUET_ROW_GROUP_SIZE:
+                writer.write_table(pa.Table.from_pylist(pending, schema=schema))
+                pending.clear()
+                yield sink.drain()
+
+        if pending:
+            writer.write_table(pa.Table.from_pylist(pending, schema=schema))
+
+    yield sink.drain()
+
+
+async def _merge_by_question(streams: Sequence[Batches]) -> Batches:
+    # Questions live on one shard each, so the heads of two streams never tie on
+    # (question creation date, question ID) and rows of a question stay together.
+    if len(streams) == 1:
+        async for rows in streams[0]:
+            yield rows
+        return
+
+    iterators = [_rows(batches=batches) for batches in streams]
+    heads = []
+    for index, rows in enumerate(iterators):
+        if (row := await anext(rows, None)) is not None:
+            heads.append((_question_key(row=row), index, row))
+    heapq.heapify(heads)
+
+    batch: list[Row] = []
+    while heads:
+        _, index, row = heads[0]
+        batch.append(row)
+
+        if (row := await anext(iterators[index], None)) is None:
+            heapq.heappop(heads)
+        else:
+            heapq.heapreplace(heads, (_question_key(row=row), index, row))
+
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def _rows(batches: Batches) -> AsyncIterator[Row]:
+    async for rows in batches:
+        for row in rows:
+            yield row
+
+
+def _question_key(row: Row) -> tuple[datetime, int]:
+    return row.question_created_at, row.question_id
+
+
+ENCODERS = {"csv": _encode_csv, "ndjson": _encode_ndjson, "parquet": _encode_parquet}
+
+
+class ExportUsecase:
+    def __init__(self):
+        self._question_repository = QuestionRepository()
+
+    @staticmethod
+    def check_format(format: ExportFormat) -> None:
+        """Check that a format can be exported before streaming starts.
+
+        Args:
+            format: The export format.
+
+        Raises:
+            ExportFormatUnavailableError: If the format needs a missing optional
+                dependency.
+
+        """
+        if format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+            logger.error("❌ Parquet export requested without pyarrow installed")
+            raise ExportFormatUnavailableError
+
+    async def export(
+        self,
+        sessions: list[AsyncSession],
+        format: ExportFormat,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Export questions of every shard with their answers, one row per answer.
+
+        Rows are read from a server-side cursor per shard, merged in question
+        order and encoded batch by batch, so memory stays bounded however large
+        the export is.
+
+        Args:
+            sessions: The session of every shard, used for the whole export.
+            format: The export format.
+            created_from: Only questions created at or after this date.
+            created_to: Only questions created before this date.
+
+        Yields:
+            Chunks of the encoded export.
+
+        """
+        logger.info(
+            "⏲️ Exporting questions created from %s to %s as %s",
+            created_from,
+            created_to,
+            format,
+        )
+
+        size = 0
+        async for chunk in ENCODERS[format](
+            _merge_by_question(
+                streams=[
+                    self._question_repository.stream_with_answers(
+                        session=session,
+                        created_from=created_from,
+                        created_to=created_to,
+                        batch_size=EXPORT_BATCH_SIZE,
+                    )
+                    for session in sessions
+                ]
+            )
+        ):
+            size += len(chunk)
+            yield chunk
+
+        logger.info("✅ Exported %s bytes of questions as %s", size, format)
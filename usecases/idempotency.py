@@ -0,0 +1,127 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.repositories import IdempotencyKeyRepository
+from exceptions import IdempotencyKeyInProgressError, IdempotencyKeyMismatchError
+from settings import get_logger, idempotency_settings
+
+logger = get_logger(__name__)
+
+
+def fingerprint_request(request: dict[str, Any]) -> bytes:
+    """Hash a request so a reused key can be told apart from a retry.
+
+    Args:
+        request: The JSON-serializable request, e.g. its method, path and body.
+
+    Returns:
+        The SHA-256 digest of the canonical JSON of the request.
+
+    """
+    return hashlib.sha256(
+        json.dumps(request, sort_keys=True, separators=(",", ":")).encode()
+    ).digest()
+
+
+class IdempotencyUsecase:
+    def __init__(self):
+        self._idempotency_key_repository = IdempotencyKeyRepository()
+
+    async def execute(
+        self,
+        session: AsyncSession,
+        key: str,
+        request: dict[str, Any],
+        operation: Callable[[AsyncSession], Awaitable[dict[str, Any]]],
+    ) -> tuple[dict[str, Any], bool]:
+        """Run an operation once per idempotency key and replay its response.
+
+        The key is claimed with a placeholder before the operation runs, so a
+        retry that arrives while the first request is still running is turned
+        away instead of running the operation again. The operation is handed the
+        session, and a write it leaves uncommitted there is committed together
+        with the response, so a stored key never lacks its response.
+
+        Args:
+            session: The session.
+            key: The idempotency key.
+            request: The request, fingerprinted to detect a reused key.
+            operation: The operation, given the session whose transaction
+                stores the response, returning the JSON response body.
+
+        Returns:
+            The response body and whether it was replayed.
+
+        Raises:
+            IdempotencyKeyMismatchError: If the key was used for another request.
+            IdempotencyKeyInProgressError: If a request with the key is running.
+
+        """
+        fingerprint = fingerprint_request(request=request)
+
+        claimed = await self._idempotency_key_repository.claim(
+            session=session,
+            key=key,
+            fingerprint=fingerprint,
+            ttl=timedelta(seconds=idempotency_settings.ttl),
+            pending_timeout=timedelta(seconds=idempotency_settings.pending_timeout),
+        )
+
+        if not claimed:
+            stored = await self._idempotency_key_repository.get_stored(
+                session=session, key=key
+            )
+
+            if stored is not None and stored[0] != fingerprint:
+                logger.error("❌ Idempotency key %s reused for another request", key)
+                raise IdempotencyKeyMismatchError
+
+            if stored is None or stored[1] is None:
+                logger.error("❌ Request with idempotency key %s is in progress", key)
+                raise IdempotencyKeyInProgressError
+
+            logger.info("✅ Replayed response for idempotency key %s", key)
+
+            return stored[1], True
+
+        try:
+            response = await operation(session)
+        except Exception:
+            await session.rollback()
+            await self._idempotency_key_repository.release(session=session, key=key)
+            raise
+
+        await self._idempotency_key_repository.complete(
+            session=session, key=key, response=response
+        )
+
+        return response, False
+
+    async def purge(self, session: AsyncSession, batch_size: int) -> int:
+        """Delete the keys whose responses are no longer replayed.
+
+        Args:
+            session: The session.
+            batch_size: The number of keys deleted per transaction.
+
+        Returns:
+            The number of deleted keys.
+
+        """
+        logger.info("⏲️ Purging expired idempotency keys")
+
+        purged = 0
+        while batch := await self._idempotency_key_repository.purge(
+            session=session,
+            ttl=timedelta(seconds=idempotency_settings.ttl),
+            limit=batch_size,
+        ):
+            purged += batch
+
+        logger.info("✅ Purged %s idempotency keys", purged)
+
+        return purged
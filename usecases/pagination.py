@@ -0,0 +1,149 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from exceptions import InvalidCursorError
+
+
+def _encode(values: list[Any]) -> str:
+    payload = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError) as error:
+        raise InvalidCursorError from error
+
+    if not isinstance(values, list):
+        raise InvalidCursorError
+
+    return values
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Encode the position of a row in a ``(created_at, id)`` ordering.
+
+    Args:
+        created_at: The creation date of the last returned row.
+        id: The ID of the last returned row.
+
+    Returns:
+        The opaque cursor.
+
+    """
+    return _encode(values=[created_at.isoformat(), id])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: The opaque cursor.
+
+    Returns:
+        The creation date and ID of the last returned row.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+
+    """
+    try:
+        created_at, id = _decode(cursor=cursor)
+        return datetime.fromisoformat(created_at), int(id)
+    except (TypeError, ValueError) as error:
+        raise InvalidCursorError from error
+
+
+def encode_sort_cursor(
+    sort_by: str, descending: bool, value: int | datetime | None, id: int
+) -> str:
+    """Encode the position of a row in a ``(sort_by, id)`` ordering.
+
+    Args:
+        sort_by: The sorted field.
+        descending: Whether the field is sorted in descending order.
+        value: The sorted field of the last returned row.
+        id: The ID of the last returned row.
+
+    Returns:
+        The opaque cursor.
+
+    """
+    if isinstance(value, datetime):
+        return _encode(values=[sort_by, descending, value.isoformat(), id])
+
+    return _encode(values=[sort_by, descending, value, id])
+
+
+def decode_sort_cursor(
+    cursor: str, sort_by: str, descending: bool
+) -> tuple[int | datetime | None, int]:
+    """Decode a cursor produced by ``encode_sort_cursor`` for the same ordering.
+
+    Args:
+        cursor: The opaque cursor.
+        sort_by: The sorted field.
+        descending: Whether the field is sorted in descending order.
+
+    Returns:
+        The sorted field and ID of the last returned row.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or from another ordering.
+
+    """
+    try:
+        cursor_sort_by, cursor_descending, value, id = _decode(cursor=cursor)
+        if (cursor_sort_by, cursor_descending) != (sort_by, descending):
+            raise InvalidCursorError
+        if value is not None:
+            value = (
+                datetime.fromisoformat(value)
+                if sort_by in ("created_at", "last_answer_at")
+                else int(value)
+            )
+        return value, int(id)
+    except (TypeError, ValueError) as error:
+        raise InvalidCursorError from error
+
+
+def encode_search_cursor(rank: float, kind: str, id: int) -> str:
+    """Encode the position of a row in a ``(rank DESC, kind, id)`` ordering.
+
+    Args:
+        rank: The rank of the last returned row.
+        kind: The kind of the last returned row.
+        id: The ID of the last returned row.
+
+    Returns:
+        The opaque cursor.
+
+    """
+    return _encode(values=[rank, kind, id])
+
+
+def decode_search_cursor(cursor: str, kinds: tuple[str, ...]) -> tuple[float, str, int]:
+    """Decode a cursor produced by ``encode_search_cursor``.
+
+    Args:
+        cursor: The opaque cursor.
+        kinds: The valid row kinds.
+
+    Returns:
+        The rank, kind and ID of the last returned row.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+
+    """
+    try:
+        rank, kind, id = _decode(cursor=cursor)
+        if kind not in kinds:
+            raise InvalidCursorError
+        return float(rank), kind, int(id)
+    except (TypeError, ValueError) as error:
+        raise InvalidCursorError from error
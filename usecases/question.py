@@ -1,65 +1,193 @@
+import asyncio
+import itertools
+from operator import attrgetter
+from typing import Collection, Sequence
+
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from constants.columns import ANSWER_COLUMNS, QUESTION_COLUMNS, QUESTION_SORT_COLUMNS
+from constants.questions import DuplicatePolicy
 from db.models import Question
-from db.repositories import QuestionRepository
-from exceptions import QuestionNotFoundError
-from settings import get_logger
+from db.repositories import AnswerArchiveRepository, QuestionRepository
+from db.sharding import shard_for_text
+from exceptions import DuplicateQuestionError, QuestionNotFoundError
+from settings import get_logger, question_settings
+from usecases.pagination import decode_sort_cursor, encode_sort_cursor
 
 logger = get_logger(__name__)
 
 
+def _merge_sorted(
+    pages: Sequence[list[Row]], sort_column: str, descending: bool
+) -> list[Row]:
+    """Merge pages sorted like ``QuestionRepository.get_sorted`` into one list.
+
+    Args:
+        pages: The pages.
+        sort_column: The sorted column.
+        descending: Whether the column is sorted in descending order.
+
+    Returns:
+        The questions in the same order, ties broken by ID and questions with
+        an empty column last.
+
+    """
+    questions = sorted(itertools.chain.from_iterable(pages), key=attrgetter("id"))
+    present = [q for q in questions if getattr(q, sort_column) is not None]
+    missing = [q for q in questions if getattr(q, sort_column) is None]
+    present.sort(key=attrgetter(sort_column), reverse=descending)
+
+    return present + missing
+
+
 class QuestionUsecase:
-    def __init__(self):
+    def __init__(self, duplicate_policy: DuplicatePolicy | None = None):
         self._question_repository = QuestionRepository()
-
-    async def get_all(self, session: AsyncSession) -> list[Question]:
-        """Get all questions ordered by creation date.
+        self._answer_archive_repository = AnswerArchiveRepository()
+        self.duplicate_policy = duplicate_policy or question_settings.duplicate_policy
+
+    async def get_all(  # noqa: PLR0913, PLR0917
+        self,
+        sessions: list[AsyncSession],
+        sort_by: str = "id",
+        descending: bool = False,
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: Collection[str] | None = None,
+    ) -> tuple[list[Row], str | None]:
+        """Get a page of the questions of every shard in the requested order.
+
+        Every shard returns its own first page after the cursor; the pages are
+        merged and cut to the limit, so the last question is a valid cursor
+        across all shards.
 
         Args:
-            session: The session.
+            sessions: The session of every shard.
+            sort_by: The field to sort by.
+            descending: Whether to sort in descending order.
+            limit: The maximum number of questions.
+            cursor: The cursor returned with the previous page.
+            fields: The fields to select, all of them by default.
 
         Returns:
-            The list of questions.
+            The question rows and the cursor of the next page, if there is one.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was returned for
+                another ordering.
 
         """
         logger.info("⏲️ Fetching all questions")
 
-        questions = await self._question_repository.get_all(session=session)
+        after = (
+            decode_sort_cursor(cursor=cursor, sort_by=sort_by, descending=descending)
+            if cursor
+            else None
+        )
+        pages = await asyncio.gather(
+            *(
+                self._question_repository.get_sorted(
+                    session=session,
+                    sort_by=sort_by,
+                    descending=descending,
+                    limit=None if limit is None else limit + 1,
+                    after=after,
+                    columns=QUESTION_COLUMNS if fields is None else fields,
+                )
+                for session in sessions
+            )
+        )
+        sort_column = QUESTION_SORT_COLUMNS[sort_by]
+        questions = _merge_sorted(
+            pages=pages, sort_column=sort_column, descending=descending
+        )
+
+        next_cursor = None
+        if limit is not None and len(questions) > limit:
+            questions = questions[:limit]
+            next_cursor = encode_sort_cursor(
+                sort_by=sort_by,
+                descending=descending,
+                value=getattr(questions[-1], sort_column),
+                id=questions[-1].id,
+            )
 
         logger.info("✅ Fetched %s questions", len(questions))
 
-        return questions
+        return questions, next_cursor
 
-    async def create(self, session: AsyncSession, text: str) -> Question:
+    async def create(
+        self,
+        sessions: list[AsyncSession],
+        text: str,
+        transaction: AsyncSession | None = None,
+    ) -> Question:
         """Create a new question.
 
+        Texts are compared after trimming, collapsing whitespace and lowercasing;
+        what happens to a duplicate depends on the duplicate policy. The
+        question goes to the shard picked by its text, where its duplicates are.
+
         Args:
-            session: The session.
+            sessions: The session of every shard.
             text: The question text.
+            transaction: A session whose transaction the caller commits; a
+                question created through it is flushed, not committed.
 
         Returns:
-            The created question.
+            The created question, or the existing one under the
+            ``return-existing`` policy.
+
+        Raises:
+            DuplicateQuestionError: If the text is a duplicate under the
+                ``reject`` policy.
 
         """
         logger.info("⏲️ Creating question: %s...", text[:50])
 
+        session = sessions[shard_for_text(text=text, shard_count=len(sessions))]
+
+        if self.duplicate_policy != "allow":
+            existing = await self._question_repository.get_by_text(
+                session=session, text=text, lock=True
+            )
+
+            if existing is not None:
+                if self.duplicate_policy == "reject":
+                    logger.error("❌ Question duplicates question %s", existing.id)
+                    await session.rollback()
+                    raise DuplicateQuestionError
+
+                logger.info("✅ Returning existing question with ID: %s", existing.id)
+                await self._question_repository.load_answer_stats(
+                    session=session, question=existing
+                )
+                await session.commit()
+                return existing
+
         question = await self._question_repository.create(
-            session=session, data={"text": text}
+            session=session, data={"text": text}, commit=session is not transaction
         )
 
         logger.info("✅ Created question with ID: %s", question.id)
 
         return question
 
-    async def get_with_answers(self, session: AsyncSession, id: int) -> Question:
-        """Get a question by ID with its answers.
+    async def get_with_answers(
+        self, session: AsyncSession, id: int, fields: Collection[str] | None = None
+    ) -> tuple[Row, list[Row]]:
+        """Get the row of a question by ID and the rows of its answers.
 
         Args:
             session: The session.
             id: The question ID.
+            fields: The fields to select, all of them by default. ``answers``
+                selects the answers whole; ``answers.<field>`` selects only some
+                of their fields.
 
         Returns:
-            The question.
+            The question row and the answer rows.
 
         Raises:
             QuestionNotFoundError: If the question is not found.
@@ -67,20 +195,39 @@ class QuestionUsecase:
         """
         logger.info("⏲️ Fetching question with ID: %s", id)
 
-        question = await self._question_repository.get_with_answers(
-            session=session, id=id
+        columns, answer_columns, with_answers = QUESTION_COLUMNS, ANSWER_COLUMNS, True
+
+        if fields is not None:
+            columns = [
+                field for field in fields if field != "answers" and "." not in field
+            ]
+            answer_columns = [
+                field.removeprefix("answers.")
+                for field in fields
+                if field.startswith("answers.")
+            ] or ANSWER_COLUMNS
+            with_answers = "answers" in fields or any(
+                field.startswith("answers.") for field in fields
+            )
+
+        question, answers = await self._question_repository.get_rows_with_answers(
+            session=session,
+            id=id,
+            columns=columns,
+            answer_columns=answer_columns,
+            with_answers=with_answers,
         )
 
         if not question:
             logger.error("❌ Question with ID %s not found", id)
             raise QuestionNotFoundError
 
-        logger.info("✅ Fetched question with ID: %s", id)
+        logger.info("✅ Fetched question with ID %s and %s answers", id, len(answers))
 
-        return question
+        return question, answers
 
     async def delete_by_id(self, session: AsyncSession, id: int) -> None:
-        """Delete a question by ID.
+        """Mark a question as deleted; it is purged with its answers later.
 
         Args:
             session: The session.
@@ -90,12 +237,133 @@ class QuestionUsecase:
             QuestionNotFoundError: If the question is not found.
 
         """
-        logger.info("⏲️ Deleting question and answers with ID: %s", id)
+        logger.info("⏲️ Deleting question with ID: %s", id)
 
-        result = await self._question_repository.delete_by(session=session, id=id)
+        result = await self._question_repository.soft_delete(session=session, id=id)
 
         if not result:
             logger.error("❌Question with ID %s not found", id)
             raise QuestionNotFoundError
 
-        logger.info("✅ Deleted question and answers with ID: %s", id)
+        logger.info("✅ Scheduled question with ID %s for purging", id)
+
+    async def get_deletion_status(self, session: AsyncSession, id: int) -> Question:
+        """Get a question, deleted or not, to report its purge progress.
+
+        Args:
+            session: The session.
+            id: The question ID.
+
+        Returns:
+            The question; its answer count, which includes archived answers, is
+            the number of answers left to purge once it is deleted.
+
+        Raises:
+            QuestionNotFoundError: If the question is not found or was purged.
+
+        """
+        question = await self._question_repository.get_including_deleted(
+            session=session, id=id
+        )
+
+        if not question:
+            logger.error("❌ Question with ID %s not found", id)
+            raise QuestionNotFoundError
+
+        return question
+
+    async def purge_deleted(self, session: AsyncSession, batch_size: int) -> int:
+        """Purge soft-deleted questions, deleting their answers in batches.
+
+        Archived answers are deleted as well. Every batch is its own short
+        transaction, so purging a question with millions of answers never
+        holds locks for long.
+
+        Args:
+            session: The session.
+            batch_size: The number of answers deleted per transaction.
+
+        Returns:
+            The number of purged questions.
+
+        """
+        logger.info("⏲️ Purging deleted questions")
+
+        purged = 0
+        while questions := await self._question_repository.get_deleted(
+            session=session, limit=batch_size
+        ):
+            for id, created_at in questions:
+                answers = 0
+                while batch := await self._question_repository.purge_answers(
+                    session=session, question_id=id, since=created_at, limit=batch_size
+                ):
+                    answers += batch
+                while batch := await self._answer_archive_repository.purge_by_question(
+                    session=session, question_id=id, limit=batch_size
+                ):
+                    answers += batch
+
+                await self._question_repository.purge(session=session, id=id)
+                purged += 1
+
+                logger.info("✅ Purged question %s with %s answers", id, answers)
+
+        logger.info("✅ Purged %s deleted questions", purged)
+
+        return purged
+
+    async def repair_answer_stats(self, session: AsyncSession, batch_size: int) -> int:
+        """Rebuild the answer counts and last answer dates of all questions.
+
+        Args:
+            session: The session.
+            batch_size: The number of question IDs repaired per transaction.
+
+        Returns:
+            The number of questions whose values were wrong.
+
+        """
+        logger.info("⏲️ Repairing question answer stats")
+
+        id_range = await self._question_repository.get_id_range(session=session)
+        repaired = 0
+
+        if id_range is not None:
+            first_id, last_id = id_range
+
+            for batch_first_id in range(first_id, last_id + 1, batch_size):
+                repaired += await self._question_repository.repair_answer_stats(
+                    session=session,
+                    first_id=batch_first_id,
+                    last_id=batch_first_id + batch_size - 1,
+                )
+
+        logger.info("✅ Repaired answer stats of %s questions", repaired)
+
+        return repaired
+
+    async def compact_answer_counters(
+        self, session: AsyncSession, batch_size: int
+    ) -> int:
+        """Fold the answer counter shards of all questions into the questions.
+
+        Args:
+            session: The session.
+            batch_size: The number of questions compacted per transaction.
+
+        Returns:
+            The number of compacted questions.
+
+        """
+        logger.info("⏲️ Compacting answer counters")
+
+        compacted = 0
+        while batch := await self._question_repository.compact_answer_counters(
+            session=session, limit=batch_size
+        ):
+            compacted += batch
+
+        logger.info("✅ Compacted answer counters of %s questions", compacted)
+
+        return compacted
@@ -0,0 +1,73 @@
+import asyncio
+import itertools
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.search import SEARCH_KINDS
+from db.repositories import SearchRepository
+from settings import get_logger
+from usecases.pagination import decode_search_cursor, encode_search_cursor
+
+logger = get_logger(__name__)
+
+
+class SearchUsecase:
+    def __init__(self):
+        self._search_repository = SearchRepository()
+
+    async def search(
+        self,
+        sessions: list[AsyncSession],
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        """Search questions and answers on every shard.
+
+        Every shard returns its own first page after the cursor; the pages are
+        merged and cut to the limit, so the last result is a valid cursor across
+        all shards.
+
+        Args:
+            sessions: The session of every shard.
+            query: The search query.
+            limit: The maximum number of results.
+            cursor: The cursor returned with the previous page.
+
+        Returns:
+            The results, best matches first, and the cursor of the next page, if
+            there is one.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+
+        """
+        logger.info("⏲️ Searching for: %s...", query[:50])
+
+        after = (
+            decode_search_cursor(cursor=cursor, kinds=SEARCH_KINDS) if cursor else None
+        )
+        pages = await asyncio.gather(
+            *(
+                self._search_repository.search(
+                    session=session, query=query, limit=limit + 1, after=after
+                )
+                for session in sessions
+            )
+        )
+        results = sorted(
+            itertools.chain.from_iterable(pages),
+            key=lambda result: (-result.rank, result.kind, result.id),
+        )
+
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = encode_search_cursor(
+                rank=results[-1].rank, kind=results[-1].kind, id=results[-1].id
+            )
+
+        logger.info("✅ Found %s results", len(results))
+
+        return results, next_cursor
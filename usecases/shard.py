@@ -0,0 +1,37 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.repositories import AnswerRepository, QuestionRepository
+from settings import get_logger
+
+logger = get_logger(__name__)
+
+
+class ShardUsecase:
+    def __init__(self):
+        self._question_repository = QuestionRepository()
+        self._answer_repository = AnswerRepository()
+
+    async def configure_ids(
+        self, session: AsyncSession, shard: int, shard_count: int
+    ) -> None:
+        """Make a shard hand out question and answer IDs that route back to it.
+
+        Shard ``k`` of ``n`` only hands out IDs that are ``k + 1`` modulo ``n``,
+        which is how ``db.sharding.shard_of`` finds the shard of an ID. Running
+        it again is harmless; changing the shard count moves existing IDs to
+        other shards, so shards are only added to empty databases.
+
+        Args:
+            session: The session of the shard.
+            shard: The shard number.
+            shard_count: The number of shards.
+
+        """
+        logger.info("⏲️ Configuring IDs of shard %s of %s", shard, shard_count)
+
+        for repository in (self._question_repository, self._answer_repository):
+            await repository.stride_ids(
+                session=session, stride=shard_count, offset=shard
+            )
+
+        logger.info("✅ Configured IDs of shard %s", shard)
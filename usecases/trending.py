@@ -0,0 +1,130 @@
+import asyncio
+import itertools
+import math
+from collections import defaultdict
+from operator import itemgetter
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.trending import TRENDING_CURSOR
+from db.models import Question
+from db.repositories import JobCursorRepository, TrendingRepository
+from settings import get_logger, trending_settings
+
+logger = get_logger(__name__)
+
+
+class TrendingUsecase:
+    """Rank questions by exponentially time-decayed answer velocity.
+
+    Each answer adds ``exp(decay_rate * seconds_since_epoch)`` to its question.
+    Decaying every score at once does not change the order, so scores are kept
+    in log space relative to a fixed epoch and only ever grow; the current
+    decayed score is derived when reading.
+    """
+
+    def __init__(self):
+        self._trending_repository = TrendingRepository()
+        self._job_cursor_repository = JobCursorRepository()
+        self.decay_rate = math.log(2) / trending_settings.half_life
+
+    async def get_top(
+        self, sessions: list[AsyncSession], limit: int
+    ) -> list[tuple[Question, float]]:
+        """Get the trending questions of every shard.
+
+        Every shard scores the answers it holds, so each returns its own top
+        questions and the highest scores of all of them are kept.
+
+        Args:
+            sessions: The session of every shard.
+            limit: The maximum number of questions.
+
+        Returns:
+            The questions with their decayed answer velocity, highest first.
+
+        """
+        logger.info("⏲️ Fetching %s trending questions", limit)
+
+        pages = await asyncio.gather(
+            *(
+                self._trending_repository.get_top(
+                    session=session, limit=limit, decay_rate=self.decay_rate
+                )
+                for session in sessions
+            )
+        )
+        questions = sorted(
+            itertools.chain.from_iterable(pages), key=itemgetter(1), reverse=True
+        )[:limit]
+
+        logger.info("✅ Fetched %s trending questions", len(questions))
+
+        return questions
+
+    async def update(
+        self, session: AsyncSession, batch_size: int, settle_lag: float
+    ) -> int:
+        """Score the answers created since the last update.
+
+        Args:
+            session: The session.
+            batch_size: The number of answers scored per transaction.
+            settle_lag: Only score answers at least this many seconds old.
+
+        Returns:
+            The number of scored answers.
+
+        """
+        logger.info("⏲️ Updating trending scores")
+
+        scored = 0
+        while True:
+            position = await self._job_cursor_repository.get_position(
+                session=session, name=TRENDING_CURSOR
+            )
+            answers = await self._trending_repository.get_new_answers(
+                session=session, after=position, settle_lag=settle_lag, limit=batch_size
+            )
+
+            if not answers:
+                await session.commit()
+                break
+
+            weights: dict[int, list[float]] = defaultdict(list)
+            for answer in answers:
+                weights[answer.question_id].append(self.decay_rate * answer.seconds)
+
+            await self._trending_repository.add_scores(
+                session=session,
+                log_scores={
+                    question_id: self._log_sum_exp(values=values)
+                    for question_id, values in weights.items()
+                },
+            )
+            await self._job_cursor_repository.save_position(
+                session=session,
+                name=TRENDING_CURSOR,
+                position=(answers[-1].created_at, answers[-1].id),
+            )
+            scored += len(answers)
+
+            if len(answers) < batch_size:
+                break
+
+        pruned = await self._trending_repository.prune(
+            session=session,
+            decay_rate=self.decay_rate,
+            min_score=trending_settings.min_score,
+        )
+
+        logger.info(
+            "✅ Scored %s answers and dropped %s stale questions", scored, pruned
+        )
+
+        return scored
+
+    @staticmethod
+    def _log_sum_exp(values: list[float]) -> float:
+        largest = max(values)
+        return largest + math.log(sum(math.exp(value - largest) for value in values))